@@ -15,6 +15,8 @@
 """Assemble function for converting a list of circuits into a qobj"""
 import logging
 
+from qiskit.circuit import Parameter
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
                          QasmQobjConfig)
@@ -22,14 +24,17 @@ from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
 logger = logging.getLogger(__name__)
 
 
-def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
+def assemble_circuits(circuits, run_config, qobj_id, qobj_header, parameter_binds=None):
     """Assembles a list of circuits into a qobj which can be run on the backend.
 
     Args:
-        circuits (list[QuantumCircuits]): circuit(s) to assemble
+        circuits (list[QuantumCircuit or DAGCircuit]): circuit(s) to assemble
         qobj_id (int): identifier for the generated qobj
         qobj_header (QobjHeader): header to pass to the results
         run_config (RunConfig): configuration of the runtime environment
+        parameter_binds (tuple(list[Parameter], list[list])): the parameters of
+            the circuits, and rows of values to bind to them. Each circuit is
+            assembled once, and gives an experiment for each row.
 
     Returns:
         QasmQobj: the Qobj to be run on the backends
@@ -43,99 +48,17 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
     max_n_qubits = 0
     max_memory_slots = 0
     for circuit in circuits:
-        # header stuff
-        n_qubits = 0
-        memory_slots = 0
-        qubit_labels = []
-        clbit_labels = []
-
-        qreg_sizes = []
-        creg_sizes = []
-        for qreg in circuit.qregs:
-            qreg_sizes.append([qreg.name, qreg.size])
-            for j in range(qreg.size):
-                qubit_labels.append([qreg.name, j])
-            n_qubits += qreg.size
-        for creg in circuit.cregs:
-            creg_sizes.append([creg.name, creg.size])
-            for j in range(creg.size):
-                clbit_labels.append([creg.name, j])
-            memory_slots += creg.size
-
-        # TODO: why do we need creq_sizes and qreg_sizes in header
-        # TODO: we need to rethink memory_slots as they are tied to classical bit
-        header = QobjExperimentHeader(qubit_labels=qubit_labels,
-                                      n_qubits=n_qubits,
-                                      qreg_sizes=qreg_sizes,
-                                      clbit_labels=clbit_labels,
-                                      memory_slots=memory_slots,
-                                      creg_sizes=creg_sizes,
-                                      name=circuit.name)
-        # TODO: why do we need n_qubits and memory_slots in both the header and the config
-        config = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
-
-        # Convert conditionals from QASM-style (creg ?= int) to qobj-style
-        # (register_bit ?= 1), by assuming device has unlimited register slots
-        # (supported only for simulators). Map all measures to a register matching
-        # their clbit_index, create a new register slot for every conditional gate
-        # and add a bfunc to map the creg=val mask onto the gating register bit.
-
-        is_conditional_experiment = any(op.control for (op, qargs, cargs) in circuit.data)
-        max_conditional_idx = 0
-
-        instructions = []
-        for op_context in circuit.data:
-            instruction = op_context[0].assemble()
-
-            # Add register attributes to the instruction
-            qargs = op_context[1]
-            cargs = op_context[2]
-            if qargs:
-                qubit_indices = [qubit_labels.index([qubit[0].name, qubit[1]])
-                                 for qubit in qargs]
-                instruction.qubits = qubit_indices
-            if cargs:
-                clbit_indices = [clbit_labels.index([clbit[0].name, clbit[1]])
-                                 for clbit in cargs]
-                instruction.memory = clbit_indices
-                # If the experiment has conditional instructions, assume every
-                # measurement result may be needed for a conditional gate.
-                if instruction.name == "measure" and is_conditional_experiment:
-                    instruction.register = clbit_indices
-
-            # To convert to a qobj-style conditional, insert a bfunc prior
-            # to the conditional instruction to map the creg ?= val condition
-            # onto a gating register bit.
-            if hasattr(instruction, '_control'):
-                ctrl_reg, ctrl_val = instruction._control
-                mask = 0
-                val = 0
-                for clbit in clbit_labels:
-                    if clbit[0] == ctrl_reg.name:
-                        mask |= (1 << clbit_labels.index(clbit))
-                        val |= (((ctrl_val >> clbit[1]) & 1) << clbit_labels.index(clbit))
-
-                conditional_reg_idx = memory_slots + max_conditional_idx
-                conversion_bfunc = QasmQobjInstruction(name='bfunc',
-                                                       mask="0x%X" % mask,
-                                                       relation='==',
-                                                       val="0x%X" % val,
-                                                       register=conditional_reg_idx)
-                instructions.append(conversion_bfunc)
-                instruction.conditional = conditional_reg_idx
-                max_conditional_idx += 1
-                # Delete control attribute now that we have replaced it with
-                # the conditional and bfuc
-                del instruction._control
-
-            instructions.append(instruction)
-
-        experiments.append(QasmQobjExperiment(instructions=instructions, header=header,
-                                              config=config))
-        if n_qubits > max_n_qubits:
-            max_n_qubits = n_qubits
-        if memory_slots > max_memory_slots:
-            max_memory_slots = memory_slots
+        instructions, header, config = _assemble_circuit(circuit)
+        if parameter_binds is None:
+            experiments.append(QasmQobjExperiment(instructions=instructions, header=header,
+                                                  config=config))
+        else:
+            experiments.extend(_bind_experiments(instructions, header, config,
+                                                 *parameter_binds))
+        if config.n_qubits > max_n_qubits:
+            max_n_qubits = config.n_qubits
+        if config.memory_slots > max_memory_slots:
+            max_memory_slots = config.memory_slots
 
     qobj_config.memory_slots = max_memory_slots
     qobj_config.n_qubits = max_n_qubits
@@ -144,3 +67,147 @@ def assemble_circuits(circuits, run_config, qobj_id, qobj_header):
                     config=qobj_config,
                     experiments=experiments,
                     header=qobj_header)
+
+
+def _assemble_circuit(circuit):
+    """Return the instructions, header and config of the experiment of a circuit."""
+    qregs, cregs, operations = _circuit_operations(circuit)
+
+    # header stuff
+    n_qubits = 0
+    memory_slots = 0
+    qubit_labels = []
+    clbit_labels = []
+
+    qreg_sizes = []
+    creg_sizes = []
+    for qreg in qregs:
+        qreg_sizes.append([qreg.name, qreg.size])
+        for j in range(qreg.size):
+            qubit_labels.append([qreg.name, j])
+        n_qubits += qreg.size
+    for creg in cregs:
+        creg_sizes.append([creg.name, creg.size])
+        for j in range(creg.size):
+            clbit_labels.append([creg.name, j])
+        memory_slots += creg.size
+    qubit_indices = {(name, j): index for index, (name, j) in enumerate(qubit_labels)}
+    clbit_indices = {(name, j): index for index, (name, j) in enumerate(clbit_labels)}
+
+    # TODO: why do we need creq_sizes and qreg_sizes in header
+    # TODO: we need to rethink memory_slots as they are tied to classical bit
+    header = QobjExperimentHeader(qubit_labels=qubit_labels,
+                                  n_qubits=n_qubits,
+                                  qreg_sizes=qreg_sizes,
+                                  clbit_labels=clbit_labels,
+                                  memory_slots=memory_slots,
+                                  creg_sizes=creg_sizes,
+                                  name=circuit.name)
+    # TODO: why do we need n_qubits and memory_slots in both the header and the config
+    config = QasmQobjExperimentConfig(n_qubits=n_qubits, memory_slots=memory_slots)
+
+    # Convert conditionals from QASM-style (creg ?= int) to qobj-style
+    # (register_bit ?= 1), by assuming device has unlimited register slots
+    # (supported only for simulators). Map all measures to a register matching
+    # their clbit_index, create a new register slot for every conditional gate
+    # and add a bfunc to map the creg=val mask onto the gating register bit.
+
+    is_conditional_experiment = any(condition for (_, _, _, condition) in operations)
+    max_conditional_idx = 0
+
+    instructions = []
+    for op, qargs, cargs, condition in operations:
+        instruction = op.assemble()
+        # The condition of a dag node is held by the node, not its op
+        if condition:
+            instruction._control = condition
+        elif hasattr(instruction, '_control'):
+            del instruction._control
+
+        # Add register attributes to the instruction
+        if qargs:
+            instruction.qubits = [qubit_indices[qubit[0].name, qubit[1]]
+                                  for qubit in qargs]
+        if cargs:
+            instruction.memory = [clbit_indices[clbit[0].name, clbit[1]]
+                                  for clbit in cargs]
+            # If the experiment has conditional instructions, assume every
+            # measurement result may be needed for a conditional gate.
+            if instruction.name == "measure" and is_conditional_experiment:
+                instruction.register = instruction.memory
+
+        # To convert to a qobj-style conditional, insert a bfunc prior
+        # to the conditional instruction to map the creg ?= val condition
+        # onto a gating register bit.
+        if hasattr(instruction, '_control'):
+            ctrl_reg, ctrl_val = instruction._control
+            mask = 0
+            val = 0
+            for index, clbit in enumerate(clbit_labels):
+                if clbit[0] == ctrl_reg.name:
+                    mask |= (1 << index)
+                    val |= (((ctrl_val >> clbit[1]) & 1) << index)
+
+            conditional_reg_idx = memory_slots + max_conditional_idx
+            conversion_bfunc = QasmQobjInstruction(name='bfunc',
+                                                   mask="0x%X" % mask,
+                                                   relation='==',
+                                                   val="0x%X" % val,
+                                                   register=conditional_reg_idx)
+            instructions.append(conversion_bfunc)
+            instruction.conditional = conditional_reg_idx
+            max_conditional_idx += 1
+            # Delete control attribute now that we have replaced it with
+            # the conditional and bfuc
+            del instruction._control
+
+        instructions.append(instruction)
+
+    return instructions, header, config
+
+
+def _bind_experiments(instructions, header, config, parameters, values):
+    """Return an experiment for each row of values bound to the parameters
+    of the instructions.
+
+    Only the instructions with parameters are copied for each experiment.
+    The other instructions, the header and the config are shared by the
+    experiments.
+    """
+    columns = {parameter: column for column, parameter in enumerate(parameters)}
+    # The index of each instruction with parameters, and the column of the
+    # value of each of its parameters
+    slots = []
+    for index, instruction in enumerate(instructions):
+        param_columns = [(param_index, columns[param]) for param_index, param
+                         in enumerate(getattr(instruction, 'params', ()))
+                         if isinstance(param, Parameter)]
+        if param_columns:
+            slots.append((index, param_columns))
+
+    experiments = []
+    for row in values:
+        bound_instructions = list(instructions)
+        for index, param_columns in slots:
+            template = instructions[index]
+            # A copy of the validated template, without validating it again
+            instruction = QasmQobjInstruction.__new__(QasmQobjInstruction)
+            instruction.__dict__.update(template.__dict__)
+            instruction.params = list(template.params)
+            for param_index, column in param_columns:
+                instruction.params[param_index] = row[column]
+            bound_instructions[index] = instruction
+        experiments.append(QasmQobjExperiment(instructions=bound_instructions, header=header,
+                                              config=config))
+    return experiments
+
+
+def _circuit_operations(circuit):
+    """Return the quantum and classical registers of a circuit or dag, and
+    the (op, qargs, cargs, condition) of its operations in order."""
+    if isinstance(circuit, DAGCircuit):
+        operations = [(node.op, node.qargs, node.cargs, node.condition)
+                      for node in circuit.topological_op_nodes()]
+        return list(circuit.qregs.values()), list(circuit.cregs.values()), operations
+    operations = [(op, qargs, cargs, op.control) for op, qargs, cargs in circuit.data]
+    return circuit.qregs, circuit.cregs, operations
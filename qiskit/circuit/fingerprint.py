@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Canonical structural fingerprint shared by QuantumCircuit and DAGCircuit.
+
+The fingerprint hashes, for each wire in a canonical order, the sequence of
+operations applied to it: their name, class, parameters, condition and the
+position of the wire among the operation's wires. Equal circuits have equal
+fingerprints, whatever the order of their registers and of the operations
+on disjoint wires, so a fingerprint mismatch proves that two circuits differ.
+"""
+
+import hashlib
+
+import numpy
+
+# Number of decimals numeric parameters are rounded to, matching the
+# tolerance of Instruction.__eq__
+_PARAM_DECIMALS = 10
+
+
+def _param_key(param, exact_params):
+    """Return a canonical string for an instruction parameter."""
+    if isinstance(param, numpy.ndarray):
+        if not exact_params:
+            return 'array'
+        values = numpy.round(numpy.asarray(param, dtype=complex), _PARAM_DECIMALS) + 0.0
+        return repr(values.tolist())
+    try:
+        value = complex(param)
+    except (TypeError, ValueError):
+        return str(param)
+    if not exact_params:
+        return 'number'
+    # Adding 0.0 turns a rounded -0.0 into 0.0
+    return '%r,%r' % (round(value.real, _PARAM_DECIMALS) + 0.0,
+                      round(value.imag, _PARAM_DECIMALS) + 0.0)
+
+
+def _op_key(name, op, condition, exact_params):
+    """Return a canonical string for an operation, without its wires."""
+    if name == 'barrier':
+        # Barriers are equal whatever the order of their qubits
+        return name
+    params = ','.join(_param_key(param, exact_params) for param in op.params)
+    if condition is None:
+        condition_key = ''
+    else:
+        condition_key = '%s[%d]==%d' % (condition[0].name, condition[0].size, condition[1])
+    return '%s|%s|%s|%s' % (name, type(op).__name__, params, condition_key)
+
+
+def _wire_sort_key(wire):
+    return type(wire[0]).__name__, wire[0].name, wire[0].size, wire[1]
+
+
+def fingerprint(wires, instructions, exact_params=True):
+    """Compute the fingerprint of a circuit in linear time.
+
+    Args:
+        wires (list[(Register, int)]): all the wires of the circuit.
+        instructions (iterable): (name, op, qargs, cargs, condition) of each
+            operation, in an order that is topological on each wire.
+        exact_params (bool): if False, only the kind of numeric parameters
+            is hashed and not their value. Circuits whose parameters only
+            differ within the tolerance of Instruction.__eq__ then always get
+            the same fingerprint.
+
+    Returns:
+        str: the hexadecimal fingerprint.
+    """
+    sequences = {wire: [] for wire in wires}
+    for name, op, qargs, cargs, condition in instructions:
+        op_key = _op_key(name, op, condition, exact_params)
+        op_wires = list(qargs) + list(cargs)
+        if condition is not None:
+            op_wires.extend(condition[0])
+        for position, wire in enumerate(op_wires):
+            if name == 'barrier':
+                position = 0
+            sequences[wire].append('%s@%d' % (op_key, position))
+
+    digest = hashlib.sha256()
+    for wire in sorted(sequences, key=_wire_sort_key):
+        digest.update(('%s %s(%d)[%d]:%s\n' % (type(wire[0]).__name__, wire[0].name,
+                                               wire[0].size, wire[1],
+                                               ';'.join(sequences[wire]))).encode())
+    return digest.hexdigest()
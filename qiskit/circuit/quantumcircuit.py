@@ -29,6 +29,7 @@ from .classicalregister import ClassicalRegister
 from .parametertable import ParameterTable
 from .instructionset import InstructionSet
 from .register import Register
+from .fingerprint import fingerprint
 
 
 def _is_bit(obj):
@@ -99,10 +100,31 @@ class QuantumCircuit:
         return str(self.draw(output='text'))
 
     def __eq__(self, other):
+        # Circuits with different structures are told apart in linear time
+        if self._fingerprint(exact_params=False) != other._fingerprint(exact_params=False):
+            return False
         # TODO: remove the DAG from this function
         from qiskit.converters import circuit_to_dag
         return circuit_to_dag(self) == circuit_to_dag(other)
 
+    def fingerprint(self):
+        """Return a canonical hash of the structure of the circuit.
+
+        The hash covers the registers and, for each wire, the sequence of
+        instructions applied to it with their parameters and conditions.
+        Equal circuits have the same fingerprint, which is also the
+        fingerprint of their DAGCircuit. It is stable across processes.
+
+        Returns:
+            str: the hexadecimal fingerprint.
+        """
+        return self._fingerprint(exact_params=True)
+
+    def _fingerprint(self, exact_params):
+        instructions = ((instruction.name, instruction, qargs, cargs, instruction.control)
+                        for instruction, qargs, cargs in self.data)
+        return fingerprint(self.qubits + self.clbits, instructions, exact_params)
+
     @classmethod
     def _increment_instances(cls):
         cls.instances += 1
@@ -17,7 +17,8 @@ import uuid
 import logging
 import copy
 
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import QuantumCircuit, Parameter
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.exceptions import QiskitError
 from qiskit.pulse import ScheduleComponent, LoConfig
 from qiskit.assembler.run_config import RunConfig
@@ -45,8 +46,9 @@ def assemble(experiments,
     header and configurations.
 
     Args:
-        experiments (QuantumCircuit or list[QuantumCircuit] or Schedule or list[Schedule]):
-            Circuit(s) or pulse schedule(s) to execute
+        experiments (QuantumCircuit or DAGCircuit or Schedule or list):
+            Circuit(s) or pulse schedule(s) to execute. DAGCircuits are
+            assembled without converting them to QuantumCircuits.
 
         backend (BaseBackend):
             If set, some runtime options are automatically grabbed from
@@ -115,13 +117,17 @@ def assemble(experiments,
             The delay between experiments will be rep_time.
             Must be from the list provided by the device.
 
-        parameter_binds (list[dict{Parameter: Value}]):
+        parameter_binds (list[dict] or dict):
             List of Parameter bindings over which the set of experiments will be
             executed. Each list element (bind) should be of the form
             {Parameter1: value1, Parameter2: value2, ...}. All binds will be
             executed across all experiments, e.g. if parameter_binds is a
             length-n list, and there are m experiments, a total of m x n
             experiments will be run (one for each experiment/bind pair).
+            The bindings can also be given as a dict of each Parameter to
+            its sequence of values, e.g. the columns of a 2-D array of values.
+            Each circuit is assembled once, and only its parameterized
+            instructions are copied for each binding.
 
         run_config (dict):
             extra arguments used to configure the run (e.g. for Aer configurable backends)
@@ -146,12 +152,14 @@ def assemble(experiments,
                                                        parameter_binds, **run_config)
 
     # assemble either circuits or schedules
-    if all(isinstance(exp, QuantumCircuit) for exp in experiments):
-        # If circuits are parameterized, bind parameters and remove from run_config
-        bound_experiments, run_config = _expand_parameters(circuits=experiments,
-                                                           run_config=run_config)
-        return assemble_circuits(circuits=bound_experiments, qobj_id=qobj_id,
-                                 qobj_header=qobj_header, run_config=run_config)
+    if all(isinstance(exp, (QuantumCircuit, DAGCircuit)) for exp in experiments):
+        # If circuits are parameterized, remove parameters from run_config
+        # and bind them while assembling
+        parameter_binds, run_config = _parse_parameter_binds(circuits=experiments,
+                                                             run_config=run_config)
+        return assemble_circuits(circuits=experiments, qobj_id=qobj_id,
+                                 qobj_header=qobj_header, run_config=run_config,
+                                 parameter_binds=parameter_binds)
 
     elif all(isinstance(exp, ScheduleComponent) for exp in experiments):
         return assemble_schedules(schedules=experiments, qobj_id=qobj_id,
@@ -259,31 +267,42 @@ def _parse_run_args(backend, qobj_id, qobj_header,
     return qobj_id, qobj_header, run_config
 
 
-def _expand_parameters(circuits, run_config):
+def _parse_parameter_binds(circuits, run_config):
     """Verifies that there is a single common set of parameters shared between
-    all circuits and all parameter binds in the run_config. Returns an expanded
-    list of circuits (if parameterized) with all parameters bound, and a copy of
-    the run_config with parameter_binds cleared.
+    all circuits and all parameter binds in the run_config. Returns the
+    parameters and the rows of values to bind to them, and a copy of the
+    run_config with parameter_binds cleared.
 
-    If neither the circuits nor the run_config specify parameters, the two are
-    returned unmodified.
+    If neither the circuits nor the run_config specify parameters, None and
+    the unmodified run_config are returned.
 
     Raises:
         QiskitError: if run_config parameters are not compatible with circuit parameters
 
     Returns:
-        Tuple(List[QuantumCircuit], RunConfig):
-          - List of input circuits expanded and with parameters bound
+        Tuple(Tuple(List[Parameter], List[List]) or None, RunConfig):
+          - The parameters, and a row of their values for each binding
           - RunConfig with parameter_binds removed
     """
 
     parameter_binds = run_config.parameter_binds
-    if parameter_binds or \
-       any(circuit.parameters for circuit in circuits):
+    if isinstance(parameter_binds, dict):
+        # A sequence of values for each parameter
+        parameters = list(parameter_binds)
+        columns = [list(parameter_binds[parameter]) for parameter in parameters]
+        if len({len(column) for column in columns}) > 1:
+            raise QiskitError('The parameters of parameter_binds have different numbers '
+                              'of values: {}'.format({str(parameter): len(column) for
+                                                      parameter, column in zip(parameters,
+                                                                               columns)}))
+        rows = list(zip(*columns))
+        all_bind_parameters = [set(parameters)] if rows else []
+    else:
+        all_bind_parameters = [bind.keys() for bind in parameter_binds]
 
-        all_bind_parameters = [bind.keys()
-                               for bind in parameter_binds]
-        all_circuit_parameters = [circuit.parameters for circuit in circuits]
+    if all_bind_parameters or \
+       any(_parameters(circuit) for circuit in circuits):
+        all_circuit_parameters = [_parameters(circuit) for circuit in circuits]
 
         # Collect set of all unique parameters across all circuits and binds
         unique_parameters = set(param
@@ -300,12 +319,22 @@ def _expand_parameters(circuits, run_config):
                  'Parameter binds: {} ' +
                  'Circuit parameters: {}').format(all_bind_parameters, all_circuit_parameters))
 
-        circuits = [circuit.bind_parameters(binds)
-                    for circuit in circuits
-                    for binds in parameter_binds]
+        if not isinstance(parameter_binds, dict):
+            parameters = list(parameter_binds[0])
+            rows = [[bind[parameter] for parameter in parameters] for bind in parameter_binds]
 
-        # All parameters have been expanded and bound, so remove from run_config
+        # The parameters are bound by the assembler, so remove from run_config
         run_config = copy.deepcopy(run_config)
         run_config.parameter_binds = []
 
-    return circuits, run_config
+        return (parameters, rows), run_config
+
+    return None, run_config
+
+
+def _parameters(circuit):
+    """Return the parameters of a circuit or dag."""
+    if isinstance(circuit, DAGCircuit):
+        return {param for node in circuit.op_nodes() for param in node.op.params
+                if isinstance(param, Parameter)}
+    return circuit.parameters
@@ -14,11 +14,18 @@
 
 """Circuit transpile function"""
 import warnings
-
-from qiskit.transpiler import Layout, CouplingMap
-from qiskit.tools.parallel import parallel_map
+from itertools import islice
+
+from qiskit.transpiler import Layout, CouplingMap, TranspileCache, TranspilerError
+from qiskit.tools.parallel import parallel_map, should_run_in_parallel, CPU_COUNT
+from qiskit.tools.events.pubsub import Publisher
+from qiskit.converters import (circuit_to_binary, binary_to_circuit, dag_to_binary,
+                               binary_to_dag)
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.exceptions import QiskitError
 from qiskit.transpiler.transpile_config import TranspileConfig
-from qiskit.transpiler.transpile_circuit import transpile_circuit
+from qiskit.transpiler.transpile_circuit import transpile_circuit, transpile_dag
+from qiskit.transpiler.preset_passmanagers.methods import LAYOUT_METHODS, ROUTING_METHODS
 from qiskit.pulse import Schedule
 
 
@@ -27,7 +34,8 @@ def transpile(circuits,
               basis_gates=None, coupling_map=None, backend_properties=None,
               initial_layout=None, seed_transpiler=None,
               optimization_level=None,
-              pass_manager=None):
+              pass_manager=None, cache=None,
+              layout_method=None, routing_method=None):
     """transpile one or more circuits, according to some desired
     transpilation targets.
 
@@ -37,8 +45,9 @@ def transpile(circuits,
     Transpilation is done in parallel using multiprocessing.
 
     Args:
-        circuits (QuantumCircuit or list[QuantumCircuit]):
-            Circuit(s) to transpile
+        circuits (QuantumCircuit or DAGCircuit or list):
+            Circuit(s) to transpile. DAGCircuits are transpiled without
+            converting them to QuantumCircuits, and returned as DAGCircuits.
 
         backend (BaseBackend):
             If set, transpiler options are automatically grabbed from
@@ -116,12 +125,38 @@ def transpile(circuits,
             pass manager will be used directly (Qiskit will not attempt to
             auto-select a pass manager based on transpile options).
 
+        cache (TranspileCache or str or bool):
+            Cache of transpiled circuits to reuse, or the directory of one.
+            If True, the cache in ~/.qiskit/transpile_cache is used. Circuits
+            found in the cache for the same transpile options are not
+            transpiled again, and repeated circuits are transpiled once.
+            Circuits with unbound parameters and custom pass managers bypass
+            the cache.
+
+        layout_method (str):
+            The pass choosing the initial layout in the preset pass managers,
+            when none is given: 'trivial', 'dense', 'noise_adaptive' or
+            'sabre'. If None, the optimization level decides.
+
+        routing_method (str):
+            The pass inserting SWAPs to map the circuit onto the coupling
+            map in the preset pass managers: 'basic', 'lookahead',
+            'stochastic', 'legacy' or 'sabre'. 'sabre' scales to devices
+            of hundreds of qubits. If None, the optimization level decides.
 
     Returns:
-        QuantumCircuit or list[QuantumCircuit]: transpiled circuit(s).
+        QuantumCircuit or DAGCircuit or list: transpiled circuit(s), of the
+            same types as the input circuit(s).
 
     Raises:
         TranspilerError: in case of bad inputs to transpiler or errors in passes
+
+    Events:
+        terra.transpiler.transpile.start: The circuits are about to be transpiled.
+        terra.transpiler.transpile.done: All the circuits have been transpiled.
+
+        While terra.transpiler.pass.done has subscribers, the circuits are
+        transpiled in this process so that all the passes are reported.
     """
 
     # transpiling schedules is not supported yet.
@@ -134,37 +169,293 @@ def transpile(circuits,
     transpile_configs = _parse_transpile_args(circuits, backend, basis_gates, coupling_map,
                                               backend_properties, initial_layout,
                                               seed_transpiler, optimization_level,
-                                              pass_manager)
+                                              pass_manager, layout_method, routing_method)
 
-    # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_configs)))
+    Publisher().publish("terra.transpiler.transpile.start", len(circuits))
+    circuits = _transpile_chunk(circuits, transpile_configs, _parse_cache(cache))
+    Publisher().publish("terra.transpiler.transpile.done")
 
     if len(circuits) == 1:
         return circuits[0]
     return circuits
 
 
+def transpile_iter(circuits,
+                   backend=None,
+                   basis_gates=None, coupling_map=None, backend_properties=None,
+                   initial_layout=None, seed_transpiler=None,
+                   optimization_level=None,
+                   pass_manager=None, cache=None, chunk_size=None,
+                   layout_method=None, routing_method=None):
+    """transpile the circuits of an iterable in chunks, and yield the
+    transpiled circuits in order.
+
+    Only one chunk of input and transpiled circuits is held at a time, so
+    large or lazily generated batches of circuits are transpiled in constant
+    memory, and the first transpiled circuits can be used before the last
+    ones are transpiled. Each chunk is transpiled in parallel.
+
+    Unlike in transpile(), the options apply to every circuit: they cannot
+    be given as lists of per-circuit values.
+
+    Args:
+        circuits (iterable): QuantumCircuits or DAGCircuits to transpile.
+
+        backend (BaseBackend): as in transpile().
+
+        basis_gates (list[str]): as in transpile().
+
+        coupling_map (CouplingMap or list): as in transpile().
+
+        backend_properties (BackendProperties): as in transpile().
+
+        initial_layout (Layout or dict or list): as in transpile().
+
+        seed_transpiler (int): as in transpile().
+
+        optimization_level (int): as in transpile().
+
+        pass_manager (PassManager): as in transpile().
+
+        cache (TranspileCache or str or bool): as in transpile().
+
+        chunk_size (int): The number of circuits transpiled at a time. If
+            None, 8 circuits per CPU are transpiled at a time.
+
+        layout_method (str): as in transpile().
+
+        routing_method (str): as in transpile().
+
+    Returns:
+        generator: the transpiled circuits, of the same types as the input
+            circuits.
+
+    Raises:
+        TranspilerError: in case of bad inputs to transpiler or errors in passes
+
+    Events:
+        terra.transpiler.transpile.start: The circuits are about to be
+            transpiled. The number of circuits is None if the iterable has
+            no length.
+        terra.transpiler.transpile.done: All the circuits have been transpiled.
+    """
+    if chunk_size is None:
+        chunk_size = 8 * CPU_COUNT
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise TranspilerError('chunk_size must be a positive integer, not %s' % chunk_size)
+
+    # Read the backend once rather than for every chunk
+    if backend is not None:
+        configuration = backend.configuration() \
+            if getattr(backend, 'configuration', None) else None
+        if basis_gates is None:
+            basis_gates = getattr(configuration, 'basis_gates', None)
+        if coupling_map is None:
+            coupling_map = getattr(configuration, 'coupling_map', None)
+        if backend_properties is None and getattr(backend, 'properties', None):
+            backend_properties = backend.properties()
+
+    num_circuits = len(circuits) if hasattr(circuits, '__len__') else None
+    return _transpile_chunks(iter(circuits), num_circuits, chunk_size, _parse_cache(cache),
+                             (basis_gates, coupling_map, backend_properties, initial_layout,
+                              seed_transpiler, optimization_level, pass_manager,
+                              layout_method, routing_method))
+
+
+def _transpile_chunks(circuits, num_circuits, chunk_size, cache, transpile_args):
+    """Generator of transpile_iter(), so that its arguments are checked when
+    it is called rather than when the first circuit is requested."""
+    Publisher().publish("terra.transpiler.transpile.start", num_circuits)
+    while True:
+        chunk = list(islice(circuits, chunk_size))
+        if not chunk:
+            break
+        transpile_configs = _parse_transpile_args(chunk, None, *transpile_args)
+        transpiled = _transpile_chunk(chunk, transpile_configs, cache)
+        # Release the chunk's circuits as they are yielded
+        del chunk, transpile_configs
+        transpiled.reverse()
+        while transpiled:
+            yield transpiled.pop()
+    Publisher().publish("terra.transpiler.transpile.done")
+
+
+def _transpile_chunk(circuits, transpile_configs, cache):
+    """Transpile circuits, through the cache if there is one.
+
+    Returns:
+        list[QuantumCircuit or DAGCircuit]: the transpiled circuits.
+    """
+    if cache is None:
+        circuits = _transpile_circuits(circuits, transpile_configs)
+    else:
+        circuits = _transpile_cached_circuits(circuits, transpile_configs, cache)
+    return [_decode_circuit(circuit) if isinstance(circuit, bytes) else circuit
+            for circuit in circuits]
+
+
+def _transpile_circuits(circuits, transpile_configs):
+    """Transpile circuits in parallel.
+
+    Circuits are sent to the worker processes and back in their binary
+    encoding instead of being pickled.
+
+    Returns:
+        list[QuantumCircuit or bytes]: the transpiled circuits, or their
+            binary encoding if they were transpiled in another process.
+    """
+    # Passes run in other processes cannot be reported to subscribers
+    num_processes = 1 if Publisher().has_subscribers("terra.transpiler.pass.done") \
+        else CPU_COUNT
+
+    if len(circuits) > 1 and should_run_in_parallel(num_processes):
+        circuits = [_encode_circuit(circuit) for circuit in circuits]
+    # The options shared by the circuits, such as the coupling map and backend
+    # properties, are sent once with each chunk of tasks instead of with
+    # every circuit
+    option_values, options = _share_transpile_options(transpile_configs)
+    return parallel_map(_transpile_circuit, list(zip(circuits, options)),
+                        task_args=(option_values,), num_processes=num_processes)
+
+
+def _share_transpile_options(transpile_configs):
+    """Split transpile configs into the distinct values of their options, and
+    the index of each option value of each config.
+
+    Returns:
+        tuple(list, list[dict]): the option values, and for each config, a
+            dict of the index of each of its options in the values.
+    """
+    option_values = []
+    value_indices = {}
+    options = []
+    for transpile_config in transpile_configs:
+        option = {}
+        for name, value in transpile_config.__dict__.items():
+            index = value_indices.get(id(value))
+            if index is None:
+                index = value_indices[id(value)] = len(option_values)
+                option_values.append(value)
+            option[name] = index
+        options.append(option)
+    return option_values, options
+
+
+def _transpile_cached_circuits(circuits, transpile_configs, cache):
+    """Transpile the circuits that are not in the cache, and store them.
+
+    Circuits with the same cache key are transpiled once, and all get a copy
+    of the result under their own name.
+
+    Returns:
+        list[QuantumCircuit]: the transpiled circuits.
+    """
+    keys = [cache.key(circuit, transpile_config)
+            for circuit, transpile_config in zip(circuits, transpile_configs)]
+    results = [None] * len(circuits)
+    # Index of the circuit transpiled or loaded for each key
+    sources = {}
+    todo = []
+    for index, key in enumerate(keys):
+        if key is None:
+            todo.append(index)
+        elif key not in sources:
+            sources[key] = index
+            results[index] = cache.get(key)
+            if results[index] is None:
+                todo.append(index)
+
+    if todo:
+        transpiled = _transpile_circuits([circuits[index] for index in todo],
+                                         [transpile_configs[index] for index in todo])
+    else:
+        transpiled = []
+    for index, circuit in zip(todo, transpiled):
+        if keys[index] is not None and not isinstance(circuit, bytes):
+            circuit = _encode_circuit(circuit)
+        if isinstance(circuit, bytes) and keys[index] is not None:
+            cache.put(keys[index], circuit)
+        results[index] = circuit
+
+    transpiled = []
+    for index, (circuit, key) in enumerate(zip(circuits, keys)):
+        result = results[index] if key is None else results[sources[key]]
+        if isinstance(result, bytes):
+            result = _decode_circuit(result)
+            result.name = circuit.name
+        elif key is not None and result.name != circuit.name:
+            result = result.copy(circuit.name)
+        transpiled.append(result)
+    return transpiled
+
+
+def _parse_cache(cache):
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return TranspileCache()
+    if isinstance(cache, str):
+        return TranspileCache(cache)
+    return cache
+
+
 # FIXME: This is a helper function because of parallel tools.
-def _transpile_circuit(circuit_config_tuple):
+def _transpile_circuit(circuit_config_tuple, option_values=None):
     """Select a PassManager and run a single circuit through it.
 
     Args:
         circuit_config_tuple (tuple):
-            circuit (QuantumCircuit): circuit to transpile
-            transpile_config (TranspileConfig): configuration dictating how to transpile
+            circuit (QuantumCircuit or DAGCircuit or bytes): circuit to
+                transpile, or its binary encoding
+            transpile_config (TranspileConfig or dict): configuration
+                dictating how to transpile, or the index of each of its
+                options in option_values
+        option_values (list): the option values shared by the circuits, as
+            returned by _share_transpile_options()
 
     Returns:
-        QuantumCircuit: transpiled circuit
+        QuantumCircuit or DAGCircuit or bytes: transpiled circuit, encoded if
+            the input was
     """
     circuit, transpile_config = circuit_config_tuple
-
+    if option_values is not None:
+        transpile_config = TranspileConfig(**{name: option_values[index]
+                                              for name, index in transpile_config.items()})
+
+    if isinstance(circuit, bytes):
+        circuit = _decode_circuit(circuit)
+        if isinstance(circuit, DAGCircuit):
+            return _encode_circuit(transpile_dag(circuit, transpile_config))
+        return _encode_circuit(transpile_circuit(circuit, transpile_config))
+    if isinstance(circuit, DAGCircuit):
+        # The passes must not modify the caller's dag
+        return transpile_dag(circuit.snapshot(), transpile_config)
     return transpile_circuit(circuit, transpile_config)
 
 
+def _encode_circuit(circuit):
+    """Return the binary encoding of a circuit or dag, or the circuit itself
+    if it holds values the encoding does not support."""
+    try:
+        if isinstance(circuit, DAGCircuit):
+            return dag_to_binary(circuit)
+        return circuit_to_binary(circuit)
+    except QiskitError:
+        return circuit
+
+
+def _decode_circuit(data):
+    """Decode a circuit or dag encoded by _encode_circuit()."""
+    try:
+        return binary_to_circuit(data)
+    except QiskitError:
+        return binary_to_dag(data)
+
+
 def _parse_transpile_args(circuits, backend,
                           basis_gates, coupling_map, backend_properties,
                           initial_layout, seed_transpiler, optimization_level,
-                          pass_manager):
+                          pass_manager, layout_method=None, routing_method=None):
     """Resolve the various types of args allowed to the transpile() function through
     duck typing, overriding args, etc. Refer to the transpile() docstring for details on
     what types of inputs are allowed.
@@ -195,16 +486,23 @@ def _parse_transpile_args(circuits, backend,
 
     pass_manager = _parse_pass_manager(pass_manager, num_circuits)
 
+    layout_method = _parse_layout_method(layout_method, num_circuits)
+
+    routing_method = _parse_routing_method(routing_method, num_circuits)
+
     transpile_configs = []
     for args in zip(basis_gates, coupling_map, backend_properties, initial_layout,
-                    seed_transpiler, optimization_level, pass_manager):
+                    seed_transpiler, optimization_level, pass_manager,
+                    layout_method, routing_method):
         transpile_config = TranspileConfig(basis_gates=args[0],
                                            coupling_map=args[1],
                                            backend_properties=args[2],
                                            initial_layout=args[3],
                                            seed_transpiler=args[4],
                                            optimization_level=args[5],
-                                           pass_manager=args[6])
+                                           pass_manager=args[6],
+                                           layout_method=args[7],
+                                           routing_method=args[8])
         transpile_configs.append(transpile_config)
 
     return transpile_configs
@@ -226,7 +524,7 @@ def _parse_basis_gates(basis_gates, backend, circuits):
                                all(isinstance(i, str) for i in basis_gates)):
         basis_gates = [basis_gates] * len(circuits)
     # no basis means don't unroll (all circuit gates are valid basis)
-    basis_gates = [[inst.name for inst, _, _ in circuit.data] if basis is None
+    basis_gates = [_instruction_names(circuit) if basis is None
                    else basis for basis, circuit in zip(basis_gates, circuits)]
 
     return basis_gates
@@ -263,7 +561,7 @@ def _parse_initial_layout(initial_layout, circuits):
     def _layout_from_raw(initial_layout, circuit):
         if isinstance(initial_layout, list):
             if all(isinstance(elem, int) for elem in initial_layout):
-                initial_layout = Layout.from_intlist(initial_layout, *circuit.qregs)
+                initial_layout = Layout.from_intlist(initial_layout, *_qregs(circuit))
             elif all(elem is None or isinstance(elem, tuple) for elem in initial_layout):
                 initial_layout = Layout.from_tuplelist(initial_layout)
         elif isinstance(initial_layout, dict):
@@ -294,7 +592,39 @@ def _parse_optimization_level(optimization_level, num_circuits):
     return optimization_level
 
 
+def _parse_layout_method(layout_method, num_circuits):
+    if not isinstance(layout_method, list):
+        layout_method = [layout_method] * num_circuits
+    for method in layout_method:
+        if method is not None and method not in LAYOUT_METHODS:
+            raise TranspilerError("Invalid layout_method '%s'. Choose from %s." %
+                                  (method, ', '.join(LAYOUT_METHODS)))
+    return layout_method
+
+
+def _parse_routing_method(routing_method, num_circuits):
+    if not isinstance(routing_method, list):
+        routing_method = [routing_method] * num_circuits
+    for method in routing_method:
+        if method is not None and method not in ROUTING_METHODS:
+            raise TranspilerError("Invalid routing_method '%s'. Choose from %s." %
+                                  (method, ', '.join(ROUTING_METHODS)))
+    return routing_method
+
+
 def _parse_pass_manager(pass_manager, num_circuits):
     if not isinstance(pass_manager, list):
         pass_manager = [pass_manager] * num_circuits
     return pass_manager
+
+
+def _instruction_names(circuit):
+    if isinstance(circuit, DAGCircuit):
+        return list(circuit.count_ops())
+    return [inst.name for inst, _, _ in circuit.data]
+
+
+def _qregs(circuit):
+    if isinstance(circuit, DAGCircuit):
+        return list(circuit.qregs.values())
+    return circuit.qregs
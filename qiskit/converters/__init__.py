@@ -21,3 +21,4 @@ from .circuit_to_dag import circuit_to_dag
 from .dag_to_circuit import dag_to_circuit
 from .ast_to_dag import ast_to_dag
 from .circuit_to_instruction import circuit_to_instruction
+from .binary import circuit_to_binary, binary_to_circuit, dag_to_binary, binary_to_dag
@@ -0,0 +1,548 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Compact binary encoding of QuantumCircuit and DAGCircuit.
+
+The encoding is meant to move circuits between processes, in place of
+pickling register and instruction objects for every gate. It is made of:
+
+- a string table, and tables of the registers, parameters and instruction
+  classes that are referenced,
+- an op table holding each distinct instruction once, as its class and
+  the typed values of its attributes,
+- int32 arrays of the op index, qubit and clbit indices of each
+  instruction.
+
+Attribute values are encoded with a closed set of types (numbers, strings,
+lists, tuples, registers, parameters, sympy expressions, numpy arrays and
+instructions); an instruction holding any other value cannot be encoded.
+Sympy expressions other than numbers and symbols are stored as their
+``srepr`` string, and decoding evaluates it, so only decode data produced
+by a trusted process.
+"""
+
+import importlib
+import struct
+import sys
+from array import array
+
+import numpy
+import sympy
+
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.quantumregister import QuantumRegister
+from qiskit.circuit.classicalregister import ClassicalRegister
+from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.parameter import Parameter
+from qiskit.dagcircuit.dagcircuit import DAGCircuit
+from qiskit.exceptions import QiskitError
+
+_MAGIC = b'QKBC'
+_VERSION = 1
+_CIRCUIT = b'c'
+_DAG = b'd'
+
+_UINT = struct.Struct('<I')
+_INT = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+_COMPLEX = struct.Struct('<dd')
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def circuit_to_binary(circuit):
+    """Encode a QuantumCircuit into bytes.
+
+    Args:
+        circuit (QuantumCircuit): the circuit to encode.
+
+    Returns:
+        bytes: the encoded circuit.
+
+    Raises:
+        QiskitError: if an instruction holds a value that cannot be encoded.
+    """
+    writer = _Writer()
+    instructions = [(instruction, qargs, cargs, None)
+                    for instruction, qargs, cargs in circuit.data]
+    return writer.encode(_CIRCUIT, circuit.name, circuit.qregs, circuit.cregs,
+                         instructions, None)
+
+
+def binary_to_circuit(data):
+    """Decode a QuantumCircuit encoded by circuit_to_binary().
+
+    Args:
+        data (bytes): the encoded circuit.
+
+    Returns:
+        QuantumCircuit: the decoded circuit.
+
+    Raises:
+        QiskitError: if data is not an encoded circuit.
+    """
+    name, qregs, cregs, instructions, _ = _Reader(data).decode(_CIRCUIT)
+    circuit = QuantumCircuit(*qregs, *cregs, name=name)
+    parameter_table = circuit._parameter_table
+    for instruction, qargs, cargs, _ in instructions:
+        # The encoded circuit was valid: skip the checks of _append
+        circuit.data.append((instruction, qargs, cargs))
+        for param_index, param in enumerate(instruction.params):
+            if isinstance(param, Parameter):
+                if param in parameter_table:
+                    parameter_table[param].append((instruction, param_index))
+                else:
+                    parameter_table[param] = [(instruction, param_index)]
+    return circuit
+
+
+def dag_to_binary(dag):
+    """Encode a DAGCircuit into bytes.
+
+    The op nodes are encoded in topological order, with their conditions.
+
+    Args:
+        dag (DAGCircuit): the DAG to encode.
+
+    Returns:
+        bytes: the encoded DAG.
+
+    Raises:
+        QiskitError: if an operation holds a value that cannot be encoded.
+    """
+    writer = _Writer()
+    instructions = [(node.op, node.qargs, node.cargs, node.condition)
+                    for node in dag.topological_op_nodes()]
+    return writer.encode(_DAG, dag.name, list(dag.qregs.values()),
+                         list(dag.cregs.values()), instructions, dag.storage)
+
+
+def binary_to_dag(data):
+    """Decode a DAGCircuit encoded by dag_to_binary().
+
+    Args:
+        data (bytes): the encoded DAG.
+
+    Returns:
+        DAGCircuit: the decoded DAG, with the graph storage of the original.
+
+    Raises:
+        QiskitError: if data is not an encoded DAG.
+    """
+    name, qregs, cregs, instructions, storage = _Reader(data).decode(_DAG)
+    dag = DAGCircuit(storage=storage)
+    dag.name = name
+    for qreg in qregs:
+        dag.add_qreg(qreg)
+    for creg in cregs:
+        dag.add_creg(creg)
+    for op, qargs, cargs, condition in instructions:
+        dag.apply_operation_back(op, qargs, cargs, condition)
+    return dag
+
+
+def _state_key(cls, state, regenerated):
+    """Return a hashable key of the attributes of an instruction, or None.
+
+    Values are keyed with their type, so that sympy numbers that compare
+    equal but print differently get distinct keys.
+    """
+    items = []
+    for attribute, value in state.items():
+        if regenerated and attribute == '_definition':
+            value = None
+        elif isinstance(value, list):
+            value = tuple((type(item), item) for item in value)
+        items.append((attribute, type(value), value))
+    key = (cls, tuple(items))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _regenerated_definition(op):
+    """Return True if the definition of op is rebuilt from its parameters."""
+    return type(op)._define is not Instruction._define
+
+
+class _Writer:
+    """Accumulates the tables and the body of an encoding."""
+
+    def __init__(self):
+        self.strings = []
+        self.string_ids = {}
+        self.classes = []
+        self.class_ids = {}
+        self.registers = []
+        self.register_ids = {}
+        self.parameters = []
+        self.parameter_ids = {}
+        # Encoded ops, and their indices keyed on encoding, on attribute
+        # values when they are hashable, and on identity
+        self.ops = []
+        self.op_ids = {}
+        self.op_keys = {}
+        self.op_identity = {}
+        # Keep encoded instructions alive while their id() is in op_identity
+        self.op_refs = []
+
+    def encode(self, kind, name, qregs, cregs, instructions, storage):
+        """Return the full encoding of a circuit or DAG."""
+        bits = {}
+        for register in list(qregs) + list(cregs):
+            for index in range(register.size):
+                bits[(register, index)] = len(bits)
+        op_index = array('i')
+        num_qargs = array('i')
+        num_cargs = array('i')
+        qarg_index = array('i')
+        carg_index = array('i')
+        conditions = bytearray()
+        for op, qargs, cargs, condition in instructions:
+            op_index.append(self.op(op))
+            num_qargs.append(len(qargs))
+            num_cargs.append(len(cargs))
+            qarg_index.extend([bits[qarg] for qarg in qargs])
+            carg_index.extend([bits[carg] for carg in cargs])
+            if kind == _DAG:
+                self.value(conditions, condition)
+
+        body = bytearray()
+        self.value(body, name)
+        self.value(body, storage)
+        self.value(body, list(qregs))
+        self.value(body, list(cregs))
+        for int_array in (op_index, num_qargs, num_cargs, qarg_index, carg_index):
+            if sys.byteorder == 'big':
+                int_array.byteswap()
+            self.uint(body, len(int_array))
+            body += int_array.tobytes()
+        body += conditions
+
+        out = bytearray(_MAGIC)
+        out.append(_VERSION)
+        out += kind
+        self.uint(out, len(self.strings))
+        for string in self.strings:
+            encoded = string.encode('utf-8')
+            self.uint(out, len(encoded))
+            out += encoded
+        self.uint(out, len(self.classes))
+        for class_name in self.classes:
+            self.uint(out, class_name)
+        self.uint(out, len(self.registers))
+        for is_quantum, reg_name, size in self.registers:
+            out.append(is_quantum)
+            self.uint(out, reg_name)
+            self.uint(out, size)
+        self.uint(out, len(self.parameters))
+        for param_name in self.parameters:
+            self.uint(out, param_name)
+        self.uint(out, len(self.ops))
+        for encoded_op in self.ops:
+            out += encoded_op
+        out += body
+        return bytes(out)
+
+    @staticmethod
+    def uint(buffer, value):
+        """Append an unsigned 32-bit integer."""
+        buffer += _UINT.pack(value)
+
+    def string(self, string):
+        """Return the index of a string in the string table."""
+        index = self.string_ids.get(string)
+        if index is None:
+            index = self.string_ids[string] = len(self.strings)
+            self.strings.append(string)
+        return index
+
+    def register(self, register):
+        """Return the index of a register in the register table."""
+        index = self.register_ids.get(register)
+        if index is None:
+            if not isinstance(register, (QuantumRegister, ClassicalRegister)):
+                raise QiskitError("cannot encode register of type %s" % type(register))
+            index = self.register_ids[register] = len(self.registers)
+            self.registers.append((isinstance(register, QuantumRegister),
+                                   self.string(register.name), register.size))
+        return index
+
+    def parameter(self, parameter):
+        """Return the index of a Parameter in the parameter table."""
+        index = self.parameter_ids.get(id(parameter))
+        if index is None:
+            index = self.parameter_ids[id(parameter)] = len(self.parameters)
+            self.parameters.append(self.string(parameter.name))
+        return index
+
+    def op(self, op):
+        """Return the index of an instruction in the op table.
+
+        Instructions with the same encoding share an entry.
+        """
+        index = self.op_identity.get(id(op))
+        if index is not None:
+            return index
+        state = op.__dict__
+        regenerated = _regenerated_definition(op)
+        cls = type(op)
+        key = _state_key(cls, state, regenerated)
+        index = self.op_keys.get(key) if key is not None else None
+        if index is not None:
+            self.op_identity[id(op)] = index
+            self.op_refs.append(op)
+            return index
+        class_key = '%s:%s' % (cls.__module__, cls.__qualname__)
+        class_index = self.class_ids.get(class_key)
+        if class_index is None:
+            class_index = self.class_ids[class_key] = len(self.classes)
+            self.classes.append(self.string(class_key))
+        encoded = bytearray()
+        self.uint(encoded, class_index)
+        self.uint(encoded, len(state))
+        for attribute, value in state.items():
+            self.uint(encoded, self.string(attribute))
+            self.value(encoded, None if regenerated and attribute == '_definition' else value)
+        encoded = bytes(encoded)
+        index = self.op_ids.get(encoded)
+        if index is None:
+            index = self.op_ids[encoded] = len(self.ops)
+            self.ops.append(encoded)
+        if key is not None:
+            self.op_keys[key] = index
+        self.op_identity[id(op)] = index
+        self.op_refs.append(op)
+        return index
+
+    def value(self, buffer, value):
+        """Append a typed value."""
+        # pylint: disable=too-many-branches
+        if value is None:
+            buffer += b'N'
+        elif isinstance(value, sympy.Integer) and _INT64_MIN <= int(value) <= _INT64_MAX:
+            buffer += b'Z'
+            buffer += _INT.pack(int(value))
+        elif isinstance(value, sympy.Float) and value._prec == 53:
+            buffer += b'R'
+            buffer += _FLOAT.pack(float(value))
+        elif value is True:
+            buffer += b'T'
+        elif value is False:
+            buffer += b'F'
+        elif isinstance(value, int) and _INT64_MIN <= value <= _INT64_MAX:
+            buffer += b'i'
+            buffer += _INT.pack(value)
+        elif isinstance(value, float):
+            buffer += b'd'
+            buffer += _FLOAT.pack(value)
+        elif isinstance(value, complex):
+            buffer += b'j'
+            buffer += _COMPLEX.pack(value.real, value.imag)
+        elif isinstance(value, str):
+            buffer += b's'
+            self.uint(buffer, self.string(value))
+        elif isinstance(value, (list, tuple)):
+            buffer += b'l' if isinstance(value, list) else b't'
+            self.uint(buffer, len(value))
+            for item in value:
+                self.value(buffer, item)
+        elif isinstance(value, (QuantumRegister, ClassicalRegister)):
+            buffer += b'r'
+            self.uint(buffer, self.register(value))
+        elif isinstance(value, Parameter):
+            buffer += b'P'
+            self.uint(buffer, self.parameter(value))
+        elif isinstance(value, Instruction):
+            index = self.op(value)
+            buffer += b'o'
+            self.uint(buffer, index)
+        elif isinstance(value, numpy.ndarray):
+            if value.dtype.hasobject:
+                raise QiskitError("cannot encode numpy arrays of objects")
+            data = numpy.ascontiguousarray(value).astype(value.dtype.newbyteorder('<'))
+            buffer += b'a'
+            self.uint(buffer, self.string(data.dtype.str))
+            self.uint(buffer, data.ndim)
+            for dim in data.shape:
+                self.uint(buffer, dim)
+            raw = data.tobytes()
+            self.uint(buffer, len(raw))
+            buffer += raw
+        elif isinstance(value, sympy.Symbol):
+            buffer += b'S'
+            self.uint(buffer, self.string(value.name))
+        elif isinstance(value, (sympy.Basic, sympy.MatrixBase)):
+            buffer += b'E'
+            self.uint(buffer, self.string(sympy.srepr(value)))
+        else:
+            raise QiskitError("cannot encode value of type %s" % type(value))
+
+
+class _Reader:
+    """Decodes the tables and the body of an encoding."""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+        self.strings = []
+        self.registers = []
+        self.parameters = []
+        # Per op table entry, the class and the decoded attributes
+        self.ops = []
+        self.op_instances = {}
+
+    def decode(self, kind):
+        """Return the name, registers, instructions and storage of an encoding."""
+        if bytes(self.data[:4]) != _MAGIC:
+            raise QiskitError("not a binary encoded circuit")
+        if self.data[4] != _VERSION:
+            raise QiskitError("unsupported binary circuit version %d" % self.data[4])
+        if bytes(self.data[5:6]) != kind:
+            raise QiskitError("expected a binary encoded %s"
+                              % ('circuit' if kind == _CIRCUIT else 'DAG'))
+        self.offset = 6
+
+        for _ in range(self.uint()):
+            length = self.uint()
+            self.strings.append(str(self.data[self.offset:self.offset + length], 'utf-8'))
+            self.offset += length
+        classes = [self.load_class(self.strings[self.uint()]) for _ in range(self.uint())]
+        for _ in range(self.uint()):
+            is_quantum = self.data[self.offset]
+            self.offset += 1
+            reg_name = self.strings[self.uint()]
+            size = self.uint()
+            register_class = QuantumRegister if is_quantum else ClassicalRegister
+            self.registers.append(register_class(size, reg_name))
+        self.parameters = [Parameter(self.strings[self.uint()]) for _ in range(self.uint())]
+        for _ in range(self.uint()):
+            cls = classes[self.uint()]
+            state = {}
+            for _ in range(self.uint()):
+                attribute = self.strings[self.uint()]
+                state[attribute] = self.value()
+            self.ops.append((cls, state))
+
+        name = self.value()
+        storage = self.value()
+        qregs = self.value()
+        cregs = self.value()
+        op_index, num_qargs, num_cargs, qarg_index, carg_index = \
+            [self.int_array() for _ in range(5)]
+        bit = [bit for register in qregs + cregs for bit in register].__getitem__
+        qarg_index = qarg_index.tolist()
+        carg_index = carg_index.tolist()
+
+        instructions = []
+        qarg_pos = carg_pos = 0
+        for op, num_q, num_c in zip(op_index, num_qargs, num_cargs):
+            qargs = list(map(bit, qarg_index[qarg_pos:qarg_pos + num_q]))
+            cargs = list(map(bit, carg_index[carg_pos:carg_pos + num_c]))
+            qarg_pos += num_q
+            carg_pos += num_c
+            condition = self.value() if kind == _DAG else None
+            instructions.append((self.instantiate(op), qargs, cargs, condition))
+        return name, qregs, cregs, instructions, storage
+
+    @staticmethod
+    def load_class(class_key):
+        """Import an instruction class from its module:qualname key."""
+        module_name, qualname = class_key.split(':')
+        cls = importlib.import_module(module_name)
+        for attribute in qualname.split('.'):
+            cls = getattr(cls, attribute)
+        if not (isinstance(cls, type) and issubclass(cls, Instruction)):
+            raise QiskitError("%s is not an Instruction class" % class_key)
+        return cls
+
+    def instantiate(self, index):
+        """Return a new instruction for an entry of the op table."""
+        cls, state = self.ops[index]
+        op = cls.__new__(cls)
+        op.__dict__.update({attribute: list(value) if isinstance(value, list) else value
+                            for attribute, value in state.items()})
+        return op
+
+    def uint(self):
+        """Read an unsigned 32-bit integer."""
+        value = _UINT.unpack_from(self.data, self.offset)[0]
+        self.offset += 4
+        return value
+
+    def int_array(self):
+        """Read a length-prefixed int32 array."""
+        length = self.uint()
+        int_array = array('i')
+        int_array.frombytes(self.data[self.offset:self.offset + 4 * length])
+        if sys.byteorder == 'big':
+            int_array.byteswap()
+        self.offset += 4 * length
+        return int_array
+
+    def unpack(self, fmt):
+        """Read a fixed-size struct."""
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def value(self):
+        """Read a typed value."""
+        # pylint: disable=too-many-return-statements
+        tag = self.data[self.offset:self.offset + 1].tobytes()
+        self.offset += 1
+        if tag == b'N':
+            return None
+        if tag == b'T':
+            return True
+        if tag == b'F':
+            return False
+        if tag == b'i':
+            return self.unpack(_INT)[0]
+        if tag == b'd':
+            return self.unpack(_FLOAT)[0]
+        if tag == b'j':
+            return complex(*self.unpack(_COMPLEX))
+        if tag == b's':
+            return self.strings[self.uint()]
+        if tag in (b'l', b't'):
+            items = [self.value() for _ in range(self.uint())]
+            return items if tag == b'l' else tuple(items)
+        if tag == b'r':
+            return self.registers[self.uint()]
+        if tag == b'P':
+            return self.parameters[self.uint()]
+        if tag == b'o':
+            index = self.uint()
+            if index not in self.op_instances:
+                self.op_instances[index] = self.instantiate(index)
+            return self.op_instances[index]
+        if tag == b'a':
+            dtype = numpy.dtype(self.strings[self.uint()])
+            shape = tuple(self.uint() for _ in range(self.uint()))
+            length = self.uint()
+            data = numpy.frombuffer(self.data[self.offset:self.offset + length], dtype=dtype)
+            self.offset += length
+            return data.reshape(shape).astype(dtype.newbyteorder('='))
+        if tag == b'Z':
+            return sympy.Integer(self.unpack(_INT)[0])
+        if tag == b'R':
+            return sympy.Float(self.unpack(_FLOAT)[0])
+        if tag == b'S':
+            return sympy.Symbol(self.strings[self.uint()])
+        if tag == b'E':
+            return sympy.sympify(self.strings[self.uint()])
+        raise QiskitError("invalid value tag %r in binary circuit" % tag)
@@ -17,16 +17,17 @@
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 
 
-def circuit_to_dag(circuit):
+def circuit_to_dag(circuit, storage=None):
     """Build a ``DAGCircuit`` object from a ``QuantumCircuit``.
 
     Args:
         circuit (QuantumCircuit): the input circuit.
+        storage (str): the graph storage of the DAG, see ``DAGCircuit``.
 
     Return:
         DAGCircuit: the DAG representing the input circuit.
     """
-    dagcircuit = DAGCircuit()
+    dagcircuit = DAGCircuit(storage=storage)
     dagcircuit.name = circuit.name
     for register in circuit.qregs:
         dagcircuit.add_qreg(register)
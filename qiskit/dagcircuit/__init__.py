@@ -15,4 +15,5 @@
 """Module for DAG Circuits."""
 from .dagcircuit import DAGCircuit
 from .dagnode import DAGNode
+from .frontlayer import FrontLayer
 from .exceptions import DAGCircuitError
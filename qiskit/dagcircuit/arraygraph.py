@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Array-backed directed multigraph used as an alternative DAGCircuit storage.
+
+Nodes are addressed by the integer id of their DAGNode, and edges are kept
+in contiguous integer arrays (source, target, wire) instead of the nested
+per-edge attribute dictionaries of a networkx.MultiDiGraph. Edge attributes
+('name' and 'wire') are rebuilt on demand from an interned wire table.
+
+Only the subset of the networkx.MultiDiGraph interface used by DAGCircuit is
+provided, together with the handful of graph algorithms DAGCircuit needs.
+"""
+from array import array
+from collections import deque
+import heapq
+
+import networkx as nx
+
+from .exceptions import DAGCircuitError
+
+
+class ArrayMultiDiGraph:
+    """Directed multigraph of DAGNodes stored in integer arrays."""
+
+    def __init__(self):
+        # DAGNode indexed by node id, None for unused ids
+        self._nodes = []
+        # Per node id, the list of incoming and outgoing edge ids
+        self._in = []
+        self._out = []
+        self._num_nodes = 0
+
+        # Edge arrays indexed by edge id. A removed edge has source -1.
+        self._src = array('l')
+        self._dst = array('l')
+        self._wire = array('l')
+        self._free_edges = []
+
+        # Interned wires (Register, int) and their integer ids.
+        # Id -1 is used for edges that do not carry a wire.
+        self._wires = []
+        self._wire_ids = {}
+
+    # Node handling
+
+    def _grow(self, nid):
+        missing = nid + 1 - len(self._nodes)
+        if missing > 0:
+            self._nodes.extend([None] * missing)
+            self._in.extend([None] * missing)
+            self._out.extend([None] * missing)
+
+    def add_node(self, node):
+        """Add a DAGNode, indexed by its node id."""
+        nid = node._node_id
+        self._grow(nid)
+        if self._nodes[nid] is None:
+            self._num_nodes += 1
+            self._in[nid] = []
+            self._out[nid] = []
+        elif self._nodes[nid] is not node:
+            raise DAGCircuitError("node id %d is already in use" % nid)
+        self._nodes[nid] = node
+
+    def add_nodes_from(self, nodes):
+        """Add each DAGNode of an iterable."""
+        for node in nodes:
+            self.add_node(node)
+
+    def remove_node(self, node):
+        """Remove a node and all its incident edges."""
+        nid = node._node_id
+        if not self._has_id(nid):
+            raise DAGCircuitError("node %s is not in the graph" % node)
+        for eid in list(self._in[nid]):
+            self._drop_edge(eid)
+        for eid in list(self._out[nid]):
+            self._drop_edge(eid)
+        self._nodes[nid] = None
+        self._in[nid] = None
+        self._out[nid] = None
+        self._num_nodes -= 1
+
+    def _has_id(self, nid):
+        return 0 <= nid < len(self._nodes) and self._nodes[nid] is not None
+
+    def has_node(self, node):
+        """Return True if the node is in the graph."""
+        return self._has_id(node._node_id) and self._nodes[node._node_id] is node
+
+    __contains__ = has_node
+
+    def order(self):
+        """Return the number of nodes."""
+        return self._num_nodes
+
+    __len__ = order
+
+    def nodes(self):
+        """Return the list of nodes in node id order."""
+        return [node for node in self._nodes if node is not None]
+
+    def __iter__(self):
+        return iter(self.nodes())
+
+    def copy(self):
+        """Return a copy of the graph sharing the same DAGNode objects."""
+        graph = ArrayMultiDiGraph.__new__(ArrayMultiDiGraph)
+        graph._nodes = list(self._nodes)
+        graph._in = [None if edges is None else list(edges) for edges in self._in]
+        graph._out = [None if edges is None else list(edges) for edges in self._out]
+        graph._num_nodes = self._num_nodes
+        graph._src = array('l', self._src)
+        graph._dst = array('l', self._dst)
+        graph._wire = array('l', self._wire)
+        graph._free_edges = list(self._free_edges)
+        graph._wires = list(self._wires)
+        graph._wire_ids = dict(self._wire_ids)
+        return graph
+
+    # Edge handling
+
+    def _intern_wire(self, wire):
+        if wire is None:
+            return -1
+        wid = self._wire_ids.get(wire)
+        if wid is None:
+            wid = len(self._wires)
+            self._wires.append(wire)
+            self._wire_ids[wire] = wid
+        return wid
+
+    def _edge_data(self, eid):
+        wid = self._wire[eid]
+        if wid < 0:
+            return {}
+        wire = self._wires[wid]
+        return {'name': "%s[%s]" % (wire[0].name, wire[1]), 'wire': wire}
+
+    def add_edge(self, u_node, v_node, name=None, wire=None):
+        """Add an edge from u_node to v_node carrying a wire.
+
+        The name attribute is accepted for compatibility with networkx and is
+        always derived from the wire.
+
+        Returns:
+            int: the id of the new edge.
+        """
+        # pylint: disable=unused-argument
+        src = u_node._node_id
+        dst = v_node._node_id
+        if not self._has_id(src):
+            self.add_node(u_node)
+        if not self._has_id(dst):
+            self.add_node(v_node)
+        wid = self._intern_wire(wire)
+        if self._free_edges:
+            eid = self._free_edges.pop()
+            self._src[eid] = src
+            self._dst[eid] = dst
+            self._wire[eid] = wid
+        else:
+            eid = len(self._src)
+            self._src.append(src)
+            self._dst.append(dst)
+            self._wire.append(wid)
+        self._out[src].append(eid)
+        self._in[dst].append(eid)
+        return eid
+
+    def add_edges_from(self, edges):
+        """Add edges from an iterable of (u, v) or (u, v, data) tuples."""
+        for edge in edges:
+            data = edge[2] if len(edge) == 3 else {}
+            self.add_edge(edge[0], edge[1], wire=data.get('wire'))
+
+    def _drop_edge(self, eid):
+        self._out[self._src[eid]].remove(eid)
+        self._in[self._dst[eid]].remove(eid)
+        self._src[eid] = -1
+        self._dst[eid] = -1
+        self._wire[eid] = -1
+        self._free_edges.append(eid)
+
+    def remove_edge(self, u_node, v_node, wire=None):
+        """Remove the most recently added edge from u_node to v_node, or the
+        one carrying wire if given."""
+        src = u_node._node_id
+        dst = v_node._node_id
+        wid = None if wire is None else self._wire_ids.get(wire)
+        if self._has_id(src):
+            for eid in reversed(self._out[src]):
+                if self._dst[eid] == dst and (wid is None or self._wire[eid] == wid):
+                    self._drop_edge(eid)
+                    return
+        raise DAGCircuitError("no edge between %s and %s" % (u_node, v_node))
+
+    def number_of_edges(self, u_node=None, v_node=None):
+        """Return the number of edges between two nodes, or in the graph."""
+        if u_node is None:
+            return len(self._src) - len(self._free_edges)
+        dst = v_node._node_id
+        return sum(1 for eid in self._out[u_node._node_id] if self._dst[eid] == dst)
+
+    def in_degree(self, node):
+        """Return the number of incoming edges of a node."""
+        return len(self._in[node._node_id])
+
+    def out_degree(self, node):
+        """Return the number of outgoing edges of a node."""
+        return len(self._out[node._node_id])
+
+    def predecessors(self, node):
+        """Return an iterator over the distinct predecessors of a node."""
+        nodes = self._nodes
+        src = self._src
+        return (nodes[nid] for nid in
+                dict.fromkeys(src[eid] for eid in self._in[node._node_id]))
+
+    def successors(self, node):
+        """Return an iterator over the distinct successors of a node."""
+        nodes = self._nodes
+        dst = self._dst
+        return (nodes[nid] for nid in
+                dict.fromkeys(dst[eid] for eid in self._out[node._node_id]))
+
+    def in_edges(self, nbunch, data=False):
+        """Return the incoming edges of a node as (u, v[, data]) tuples."""
+        nodes = self._nodes
+        node = nodes[nbunch._node_id]
+        if data:
+            return [(nodes[self._src[eid]], node, self._edge_data(eid))
+                    for eid in self._in[nbunch._node_id]]
+        return [(nodes[self._src[eid]], node) for eid in self._in[nbunch._node_id]]
+
+    def out_edges(self, nbunch, data=False):
+        """Return the outgoing edges of a node as (u, v[, data]) tuples."""
+        nodes = self._nodes
+        node = nodes[nbunch._node_id]
+        if data:
+            return [(node, nodes[self._dst[eid]], self._edge_data(eid))
+                    for eid in self._out[nbunch._node_id]]
+        return [(node, nodes[self._dst[eid]]) for eid in self._out[nbunch._node_id]]
+
+    def edges(self, nbunch=None, data=False):
+        """Return the outgoing edges of nbunch (a node, an iterable of nodes,
+        or None for all nodes) as (u, v[, data]) tuples."""
+        if nbunch is None:
+            sources = self.nodes()
+        elif hasattr(nbunch, '_node_id'):
+            sources = [nbunch]
+        else:
+            sources = nbunch
+        edges = []
+        for node in sources:
+            edges.extend(self.out_edges(node, data=data))
+        return edges
+
+    def get_edge_data(self, u_node, v_node, key=0):
+        """Return the attributes of the key-th edge from u_node to v_node."""
+        dst = v_node._node_id
+        matches = [eid for eid in self._out[u_node._node_id] if self._dst[eid] == dst]
+        if key >= len(matches):
+            return None
+        return self._edge_data(matches[key])
+
+    # Algorithms
+
+    def lexicographical_topological_sort(self, key):
+        """Yield nodes in topological order, ties broken by key then node id.
+
+        This matches the ordering of networkx.lexicographical_topological_sort
+        on DAGNodes.
+        """
+        nodes = self._nodes
+        dst = self._dst
+        indegree = [len(in_list) if in_list is not None else 0 for in_list in self._in]
+        zero_indegree = [(key(node), node._node_id, node) for node in nodes
+                         if node is not None and not indegree[node._node_id]]
+        heapq.heapify(zero_indegree)
+        while zero_indegree:
+            node = heapq.heappop(zero_indegree)[2]
+            for eid in self._out[node._node_id]:
+                child = dst[eid]
+                indegree[child] -= 1
+                if not indegree[child]:
+                    child_node = nodes[child]
+                    heapq.heappush(zero_indegree, (key(child_node), child, child_node))
+            yield node
+
+    def _topological_ids(self):
+        """Return node ids in (unordered) topological order."""
+        dst = self._dst
+        indegree = [len(in_list) if in_list is not None else 0 for in_list in self._in]
+        order = [nid for nid, node in enumerate(self._nodes)
+                 if node is not None and not indegree[nid]]
+        for nid in order:
+            for eid in self._out[nid]:
+                child = dst[eid]
+                indegree[child] -= 1
+                if not indegree[child]:
+                    order.append(child)
+        return order
+
+    def is_directed_acyclic_graph(self):
+        """Return True if the graph has no directed cycle."""
+        return len(self._topological_ids()) == self._num_nodes
+
+    def dag_longest_path_length(self):
+        """Return the number of edges on the longest path of the DAG."""
+        longest = [0] * len(self._nodes)
+        src = self._src
+        best = 0
+        for nid in self._topological_ids():
+            length = 0
+            for eid in self._in[nid]:
+                length = max(length, longest[src[eid]] + 1)
+            longest[nid] = length
+            best = max(best, length)
+        return best
+
+    def number_weakly_connected_components(self):
+        """Return the number of weakly connected components."""
+        parent = list(range(len(self._nodes)))
+
+        def find(nid):
+            while parent[nid] != nid:
+                parent[nid] = parent[parent[nid]]
+                nid = parent[nid]
+            return nid
+
+        for eid, src in enumerate(self._src):
+            if src >= 0:
+                root_u, root_v = find(src), find(self._dst[eid])
+                if root_u != root_v:
+                    parent[root_u] = root_v
+        return len({find(nid) for nid, node in enumerate(self._nodes) if node is not None})
+
+    def _reachable(self, node, adjacency, endpoint):
+        seen = set()
+        stack = [node._node_id]
+        while stack:
+            nid = stack.pop()
+            for eid in adjacency[nid]:
+                other = endpoint[eid]
+                if other not in seen:
+                    seen.add(other)
+                    stack.append(other)
+        seen.discard(node._node_id)
+        return {self._nodes[nid] for nid in seen}
+
+    def ancestors(self, node):
+        """Return the set of nodes having a path to node."""
+        return self._reachable(node, self._in, self._src)
+
+    def descendants(self, node):
+        """Return the set of nodes reachable from node."""
+        return self._reachable(node, self._out, self._dst)
+
+    def bfs_successors(self, node):
+        """Yield (node, [successors]) pairs in breadth-first order from node."""
+        visited = {node._node_id}
+        queue = deque([node])
+        while queue:
+            parent = queue.popleft()
+            children = []
+            for child in self.successors(parent):
+                if child._node_id not in visited:
+                    visited.add(child._node_id)
+                    children.append(child)
+                    queue.append(child)
+            if children:
+                yield parent, children
+
+    def to_networkx(self):
+        """Return an equivalent networkx.MultiDiGraph."""
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self.nodes())
+        for eid, src in enumerate(self._src):
+            if src >= 0:
+                graph.add_edge(self._nodes[src], self._nodes[self._dst[eid]],
+                               **self._edge_data(eid))
+        return graph
@@ -32,8 +32,14 @@ import networkx as nx
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
 from qiskit.circuit.gate import Gate
+from qiskit.circuit.fingerprint import fingerprint
 from .exceptions import DAGCircuitError
 from .dagnode import DAGNode
+from .arraygraph import ArrayMultiDiGraph
+from .frontlayer import FrontLayer
+
+# Supported graph storages, see DAGCircuit.__init__
+STORAGES = ('networkx', 'array')
 
 
 class DAGCircuit:
@@ -47,8 +53,24 @@ class DAGCircuit:
 
     # pylint: disable=invalid-name
 
-    def __init__(self):
-        """Create an empty circuit."""
+    def __init__(self, storage=None):
+        """Create an empty circuit.
+
+        Args:
+            storage (str): the graph storage backing the DAG. Either 'networkx'
+                (default), a networkx.MultiDiGraph, or 'array', a compact
+                graph of integer node ids and edge arrays that uses several
+                times less memory on large circuits. Both expose the same
+                DAGCircuit API.
+
+        Raises:
+            DAGCircuitError: if the storage is not supported.
+        """
+        storage = storage or 'networkx'
+        if storage not in STORAGES:
+            raise DAGCircuitError("unknown DAG storage '%s', expected one of %s"
+                                  % (storage, ', '.join(STORAGES)))
+        self._storage = storage
 
         # Circuit name.  Generally, this corresponds to the name
         # of the QuantumCircuit from which the DAG was generated.
@@ -73,7 +95,10 @@ class DAGCircuit:
         # Input nodes have out-degree 1 and output nodes have in-degree 1.
         # Edges carry wire labels (reg,idx) and each operation has
         # corresponding in- and out-edges with the same wire labels.
-        self._multi_graph = nx.MultiDiGraph()
+        if storage == 'array':
+            self._multi_graph = ArrayMultiDiGraph()
+        else:
+            self._multi_graph = nx.MultiDiGraph()
 
         # Map of qreg name to QuantumRegister object
         self.qregs = OrderedDict()
@@ -84,6 +109,32 @@ class DAGCircuit:
         # TO REMOVE WHEN NODE IS HAVE BEEN REMOVED FULLY
         self._id_to_node = {}
 
+        # Per-wire linked index: map from node to {wire: node} of the next
+        # (resp. previous) node along each wire the node touches.
+        self._wire_next = {}
+        self._wire_prev = {}
+
+        # Mutation counter, incremented on every structural change, and the
+        # topological order cached at a given value of the counter.
+        self._version = 0
+        self._topo_order = None
+        self._topo_version = -1
+
+        # Running count of op nodes per name
+        self._op_counts = {}
+        # Depth of the last op on each wire and depth of the circuit, kept up
+        # to date by appending ops, valid while _depth_version equals _version.
+        self._wire_depth = {}
+        self._depth = 0
+        self._depth_version = 0
+
+        # (version, exact_params) and fingerprint of the last fingerprint computed
+        self._fingerprint_cache = (None, None)
+
+        # Between snapshot() and the first mutation, a one-element list holding
+        # the number of DAGCircuits sharing the containers above, else None.
+        self._shared = None
+
     @property
     def multi_graph(self):
         """Deprecated. Returns internal multi_graph."""
@@ -96,10 +147,82 @@ class DAGCircuit:
         """Deprecated. Sets internal multi_graph."""
         warnings.warn('DAGCircuit.multi_graph access has been deprecated ' +
                       'in favor of access through the DAGCircuit API. ', DeprecationWarning)
+        self._unshare()
         self._multi_graph = multi_graph
+        # The cached topological order and depth are stale once the version changes
+        self._version += 1
+        self._op_counts = {}
+        self._wire_next = {}
+        self._wire_prev = {}
+        for node in multi_graph.nodes():
+            if node.type == 'op':
+                self._op_counts[node.name] = self._op_counts.get(node.name, 0) + 1
+        for source, target, edge_data in multi_graph.edges(data=True):
+            self._wire_next.setdefault(source, {})[edge_data['wire']] = target
+            self._wire_prev.setdefault(target, {})[edge_data['wire']] = source
+
+    @property
+    def version(self):
+        """Returns a counter that changes on every structural change of the DAG."""
+        return self._version
+
+    @property
+    def storage(self):
+        """Returns the name of the graph storage backing the DAG."""
+        return self._storage
+
+    def _uses_array(self):
+        return self._storage == 'array'
+
+    def snapshot(self):
+        """Return a copy-on-write copy of the DAG.
+
+        The snapshot shares the graph, the wire maps and the cached metrics
+        with this DAG, so taking it costs O(1). The first DAG of the two to
+        be modified then copies the graph structure for itself, in time
+        linear in the number of nodes and edges but without copying the
+        operations. This makes it cheap to try a transformation on a
+        snapshot and keep either the snapshot or the original.
+
+        Nodes, and the operations they hold, are shared between the DAG and
+        its snapshot: they must be replaced through the DAGCircuit API, not
+        modified in place.
+
+        Returns:
+            DAGCircuit: a DAG equal to this one.
+        """
+        if self._shared is None:
+            self._shared = [1]
+        self._shared[0] += 1
+        return copy.copy(self)
+
+    def _unshare(self):
+        """Take a private copy of the containers shared with snapshots, if
+        any, before a mutation."""
+        shared = self._shared
+        if shared is None:
+            return
+        self._shared = None
+        shared[0] -= 1
+        if not shared[0]:
+            # The other DAGCircuits sharing them have all been modified already
+            return
+        self._multi_graph = self._multi_graph.copy()
+        self.wires = list(self.wires)
+        self.input_map = OrderedDict(self.input_map)
+        self.output_map = OrderedDict(self.output_map)
+        self.qregs = OrderedDict(self.qregs)
+        self.cregs = OrderedDict(self.cregs)
+        self._id_to_node = dict(self._id_to_node)
+        self._wire_next = {node: dict(wires) for node, wires in self._wire_next.items()}
+        self._wire_prev = {node: dict(wires) for node, wires in self._wire_prev.items()}
+        self._op_counts = dict(self._op_counts)
+        self._wire_depth = dict(self._wire_depth)
 
     def to_networkx(self):
         """Returns a copy of the DAGCircuit in networkx format."""
+        if self._uses_array():
+            return copy.deepcopy(self._multi_graph.to_networkx())
         return copy.deepcopy(self._multi_graph)
 
     def get_qubits(self):
@@ -143,6 +266,8 @@ class DAGCircuit:
             raise DAGCircuitError("duplicate register name %s" % newname)
         if regname not in self.qregs and regname not in self.cregs:
             raise DAGCircuitError("no register named %s" % regname)
+        self._unshare()
+        self._version += 1
         if regname in self.qregs:
             reg = self.qregs[regname]
             reg.name = newname
@@ -190,6 +315,7 @@ class DAGCircuit:
             raise DAGCircuitError("not a QuantumRegister instance.")
         if qreg.name in self.qregs:
             raise DAGCircuitError("duplicate register %s" % qreg.name)
+        self._unshare()
         self.qregs[qreg.name] = qreg
         for j in range(qreg.size):
             self._add_wire((qreg, j))
@@ -200,6 +326,7 @@ class DAGCircuit:
             raise DAGCircuitError("not a ClassicalRegister instance.")
         if creg.name in self.cregs:
             raise DAGCircuitError("duplicate register %s" % creg.name)
+        self._unshare()
         self.cregs[creg.name] = creg
         for j in range(creg.size):
             self._add_wire((creg, j))
@@ -215,6 +342,8 @@ class DAGCircuit:
             DAGCircuitError: if trying to add duplicate wire
         """
         if wire not in self.wires:
+            self._unshare()
+            depth_valid = self._depth_version == self._version
             self.wires.append(wire)
             self._max_node_id += 1
             input_map_wire = self.input_map[wire] = self._max_node_id
@@ -224,9 +353,9 @@ class DAGCircuit:
 
             wire_name = "%s[%s]" % (wire[0].name, wire[1])
 
-            inp_node = DAGNode(data_dict={'type': 'in', 'name': wire_name, 'wire': wire},
+            inp_node = DAGNode(type='in', name=wire_name, wire=wire,
                                nid=input_map_wire)
-            outp_node = DAGNode(data_dict={'type': 'out', 'name': wire_name, 'wire': wire},
+            outp_node = DAGNode(type='out', name=wire_name, wire=wire,
                                 nid=output_map_wire)
             self._id_to_node[input_map_wire] = inp_node
             self._id_to_node[output_map_wire] = outp_node
@@ -237,16 +366,62 @@ class DAGCircuit:
             self._multi_graph.add_node(inp_node)
             self._multi_graph.add_node(outp_node)
 
-            self._multi_graph.add_edge(inp_node,
-                                       outp_node)
-
-            self._multi_graph.adj[inp_node][outp_node][0]["name"] \
-                = "%s[%s]" % (wire[0].name, wire[1])
-            self._multi_graph.adj[inp_node][outp_node][0]["wire"] \
-                = wire
+            self._add_wire_edge(inp_node, outp_node, wire)
+            if depth_valid:
+                self._wire_depth[wire] = 0
+                self._depth_version = self._version
         else:
             raise DAGCircuitError("duplicate wire %s" % (wire,))
 
+    def _add_wire_edge(self, source, target, wire):
+        """Add an edge along wire and update the per-wire index."""
+        self._unshare()
+        self._version += 1
+        self._multi_graph.add_edge(source, target,
+                                   name="%s[%s]" % (wire[0].name, wire[1]), wire=wire)
+        self._wire_next.setdefault(source, {})[wire] = target
+        self._wire_prev.setdefault(target, {})[wire] = source
+
+    def _remove_wire_edge(self, source, target, wire):
+        """Remove the edge along wire and update the per-wire index."""
+        self._unshare()
+        self._version += 1
+        if self._uses_array():
+            self._multi_graph.remove_edge(source, target, wire=wire)
+        else:
+            edges = self._multi_graph.succ[source][target]
+            if len(edges) == 1:
+                self._multi_graph.remove_edge(source, target)
+            else:
+                for key, edge_data in edges.items():
+                    if edge_data['wire'] == wire:
+                        self._multi_graph.remove_edge(source, target, key)
+                        break
+        del self._wire_next[source][wire]
+        del self._wire_prev[target][wire]
+
+    def _remove_node(self, node):
+        """Remove a node, its edges and its index entries."""
+        self._unshare()
+        self._version += 1
+        self._multi_graph.remove_node(node)
+        if node.type == 'op':
+            self._op_counts[node.name] -= 1
+            if not self._op_counts[node.name]:
+                del self._op_counts[node.name]
+        for wire, pred in self._wire_prev.pop(node, {}).items():
+            if self._wire_next[pred].get(wire) is node:
+                del self._wire_next[pred][wire]
+        for wire, succ in self._wire_next.pop(node, {}).items():
+            if self._wire_prev[succ].get(wire) is node:
+                del self._wire_prev[succ][wire]
+
+    def _node_wires(self, node):
+        """Return the wires of a node, in (qargs, cargs, condition) order."""
+        if node.type == 'op':
+            return node.qargs + node.cargs + self._bits_in_condition(node.condition)
+        return [node.wire]
+
     def _check_condition(self, name, condition):
         """Verify that the condition is valid.
 
@@ -302,18 +477,13 @@ class DAGCircuit:
             cargs (list): list of classical wires to attach to.
             condition (tuple or None): optional condition (ClassicalRegister, int)
         """
-        node_properties = {
-            "type": "op",
-            "op": op,
-            "name": op.name,
-            "qargs": qargs,
-            "cargs": cargs,
-            "condition": condition
-        }
-
         # Add a new operation node to the graph
+        self._unshare()
+        self._version += 1
         self._max_node_id += 1
-        new_node = DAGNode(data_dict=node_properties, nid=self._max_node_id)
+        new_node = DAGNode(type="op", op=op, name=op.name, qargs=qargs, cargs=cargs,
+                           condition=condition, nid=self._max_node_id)
+        self._op_counts[op.name] = self._op_counts.get(op.name, 0) + 1
         self._multi_graph.add_node(new_node)
         self._id_to_node[self._max_node_id] = new_node
 
@@ -343,25 +513,30 @@ class DAGCircuit:
         self._check_bits(qargs, self.output_map)
         self._check_bits(all_cbits, self.output_map)
 
+        depth_valid = self._depth_version == self._version
         self._add_op_node(op, qargs, cargs, condition)
 
         # Add new in-edges from predecessors of the output nodes to the
         # operation node while deleting the old in-edges of the output nodes
         # and adding new edges from the operation node to each output node
+        new_node = self._id_to_node[self._max_node_id]
         al = [qargs, all_cbits]
         for q in itertools.chain(*al):
-            ie = list(self._multi_graph.predecessors(self.output_map[q]))
-
-            if len(ie) != 1:
-                raise DAGCircuitError("output node has multiple in-edges")
-
-            self._multi_graph.add_edge(ie[0], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
-            self._multi_graph.remove_edge(ie[0], self.output_map[q])
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], self.output_map[q],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
+            output_node = self.output_map[q]
+            pred = self._wire_prev[output_node][q]
+            self._remove_wire_edge(pred, output_node, q)
+            self._add_wire_edge(pred, new_node, q)
+            self._add_wire_edge(new_node, output_node, q)
+
+        if depth_valid:
+            # The op follows the last op of each of its wires
+            depth = 1 + max((self._wire_depth[q] for q in itertools.chain(*al)), default=0)
+            for q in itertools.chain(*al):
+                self._wire_depth[q] = depth
+            self._depth = max(self._depth, depth)
+            self._depth_version = self._version
 
-        return self._id_to_node[self._max_node_id]
+        return new_node
 
     def apply_operation_front(self, op, qargs, cargs, condition=None):
         """Apply an operation to the input of the circuit.
@@ -388,18 +563,16 @@ class DAGCircuit:
         # Add new out-edges to successors of the input nodes from the
         # operation node while deleting the old out-edges of the input nodes
         # and adding new edges to the operation node from each input node
+        new_node = self._id_to_node[self._max_node_id]
         al = [qargs, all_cbits]
         for q in itertools.chain(*al):
-            ie = list(self._multi_graph.successors(self.input_map[q]))
-            if len(ie) != 1:
-                raise DAGCircuitError("input node has multiple out-edges")
-            self._multi_graph.add_edge(self._id_to_node[self._max_node_id], ie[0],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
-            self._multi_graph.remove_edge(self.input_map[q], ie[0])
-            self._multi_graph.add_edge(self.input_map[q], self._id_to_node[self._max_node_id],
-                                       name="%s[%s]" % (q[0].name, q[1]), wire=q)
+            input_node = self.input_map[q]
+            succ = self._wire_next[input_node][q]
+            self._remove_wire_edge(input_node, succ, q)
+            self._add_wire_edge(new_node, succ, q)
+            self._add_wire_edge(input_node, new_node, q)
 
-        return self._id_to_node[self._max_node_id]
+        return new_node
 
     def _check_edgemap_registers(self, edge_map, keyregs, valregs, valreg=True):
         """Check that wiremap neither fragments nor leaves duplicate registers.
@@ -569,14 +742,35 @@ class DAGCircuit:
                 # ignore output nodes
                 pass
             elif nd.type == "op":
-                condition = self._map_condition(edge_map, nd.condition)
-                self._check_condition(nd.name, condition)
-                m_qargs = list(map(lambda x: edge_map.get(x, x), nd.qargs))
-                m_cargs = list(map(lambda x: edge_map.get(x, x), nd.cargs))
-                self.apply_operation_back(nd.op, m_qargs, m_cargs, condition)
+                self._apply_mapped_node_back(nd, edge_map)
             else:
                 raise DAGCircuitError("bad node type %s" % nd.type)
 
+    def compose_nodes_back(self, nodes, edge_map=None):
+        """Apply op nodes of another circuit to the output of this circuit.
+
+        Unlike compose_back(), no circuit needs to be built around the nodes,
+        so a layer view can be appended directly. The mapped wires must
+        already exist in self.
+
+        Args:
+            nodes (list[DAGNode]): op nodes, in topological order
+            edge_map (dict): map {(Register, int): (Register, int)}
+                from the wires of the nodes to wires of self. Wires not
+                in edge_map are kept as they are.
+        """
+        edge_map = edge_map or {}
+        for nd in nodes:
+            self._apply_mapped_node_back(nd, edge_map)
+
+    def _apply_mapped_node_back(self, node, edge_map):
+        """Apply a copy of an op node to the output, renaming its wires."""
+        condition = self._map_condition(edge_map, node.condition)
+        self._check_condition(node.name, condition)
+        m_qargs = list(map(lambda x: edge_map.get(x, x), node.qargs))
+        m_cargs = list(map(lambda x: edge_map.get(x, x), node.cargs))
+        self.apply_operation_back(node.op, m_qargs, m_cargs, condition)
+
     # FIXME: this does not work as expected. it is also not used anywhere
     def compose_front(self, input_circuit, edge_map=None):
         """Apply the input circuit to the input of this circuit.
@@ -633,7 +827,7 @@ class DAGCircuit:
                 # ignore input nodes
                 pass
             elif nd.type == "op":
-                condition = self._map_condition(edge_map, nd["condition"])
+                condition = self._map_condition(edge_map, nd.condition)
                 self._check_condition(nd.name, condition)
                 m_qargs = list(map(lambda x: edge_map.get(x, x), nd.qargs))
                 m_cargs = list(map(lambda x: edge_map.get(x, x), nd.cargs))
@@ -647,16 +841,35 @@ class DAGCircuit:
 
     def depth(self):
         """Return the circuit depth.
+
+        The depth is kept up to date as operations are appended with
+        apply_operation_back(), and recomputed once after other changes.
+
         Returns:
             int: the circuit depth
         Raises:
             DAGCircuitError: if not a directed acyclic graph
         """
-        if not nx.is_directed_acyclic_graph(self._multi_graph):
+        if self._depth_version != self._version:
+            self._compute_depth()
+        return self._depth
+
+    def _compute_depth(self):
+        """Recompute the depth of the last op on each wire and of the circuit."""
+        if self._uses_array():
+            if not self._multi_graph.is_directed_acyclic_graph():
+                raise DAGCircuitError("not a DAG")
+        elif not nx.is_directed_acyclic_graph(self._multi_graph):
             raise DAGCircuitError("not a DAG")
 
-        depth = nx.dag_longest_path_length(self._multi_graph) - 1
-        return depth if depth != -1 else 0
+        node_depth = {}
+        for node in self.topological_op_nodes():
+            node_depth[node] = 1 + max((node_depth.get(pred, 0) for pred in
+                                        self._multi_graph.predecessors(node)), default=0)
+        self._wire_depth = {wire: node_depth.get(self._wire_prev[output_node][wire], 0)
+                            for wire, output_node in self.output_map.items()}
+        self._depth = max(node_depth.values(), default=0)
+        self._depth_version = self._version
 
     def width(self):
         """Return the total number of qubits used by the circuit."""
@@ -668,6 +881,8 @@ class DAGCircuit:
 
     def num_tensor_factors(self):
         """Compute how many components the circuit can decompose into."""
+        if self._uses_array():
+            return self._multi_graph.number_weakly_connected_components()
         return nx.number_weakly_connected_components(self._multi_graph)
 
     def qasm(self):
@@ -717,10 +932,8 @@ class DAGCircuit:
                 nodes of n.
         """
 
-        pred_map = {e[2]['wire']: e[0] for e in
-                    self._multi_graph.in_edges(nbunch=node, data=True)}
-        succ_map = {e[2]['wire']: e[1] for e in
-                    self._multi_graph.out_edges(nbunch=node, data=True)}
+        pred_map = dict(self._wire_prev[node])
+        succ_map = dict(self._wire_next[node])
         return pred_map, succ_map
 
     def _full_pred_succ_maps(self, pred_map, succ_map, input_circuit,
@@ -739,8 +952,6 @@ class DAGCircuit:
         Returns:
             tuple: full_pred_map, full_succ_map (dict, dict)
 
-        Raises:
-            DAGCircuitError: if more than one predecessor for output nodes
         """
         full_pred_map = {}
         full_succ_map = {}
@@ -752,20 +963,44 @@ class DAGCircuit:
                 full_succ_map[wire_map[w]] = succ_map[wire_map[w]]
             else:
                 # Otherwise, use the corresponding output nodes of self
-                # and compute the predecessor.
+                # and compute the predecessor. The edge between them is
+                # removed and added back once the input circuit is placed.
                 full_succ_map[w] = self.output_map[w]
-                full_pred_map[w] = self._multi_graph.predecessors(
-                    self.output_map[w])[0]
-                if len(list(self._multi_graph.predecessors(self.output_map[w]))) != 1:
-                    raise DAGCircuitError("too many predecessors for %s[%d] "
-                                          "output node" % (w[0], w[1]))
+                full_pred_map[w] = self._wire_prev[self.output_map[w]][w]
+                self._remove_wire_edge(full_pred_map[w], full_succ_map[w], w)
 
         return full_pred_map, full_succ_map
 
+    def fingerprint(self):
+        """Return a canonical hash of the structure of the circuit.
+
+        The hash covers the wires and, for each wire, the sequence of
+        operations applied to it with their parameters and conditions.
+        Equal circuits have the same fingerprint, which is also the
+        fingerprint of their QuantumCircuit. It is cached until the DAG
+        is modified, and stable across processes.
+
+        Returns:
+            str: the hexadecimal fingerprint.
+        """
+        return self._fingerprint(exact_params=True)
+
+    def _fingerprint(self, exact_params):
+        key = (self._version, exact_params)
+        if self._fingerprint_cache[0] != key:
+            instructions = ((node.name, node.op, node.qargs, node.cargs, node.condition)
+                            for node in self.topological_op_nodes())
+            self._fingerprint_cache = (key, fingerprint(self.wires, instructions,
+                                                        exact_params))
+        return self._fingerprint_cache[1]
+
     def __eq__(self, other):
+        # Circuits with different structures are told apart in linear time
+        if self._fingerprint(exact_params=False) != other._fingerprint(exact_params=False):
+            return False
         # TODO this works but is a horrible way to do this
-        slf = copy.deepcopy(self._multi_graph)
-        oth = copy.deepcopy(other._multi_graph)
+        slf = self.to_networkx()
+        oth = other.to_networkx()
 
         for node in slf.nodes:
             slf.nodes[node]['node'] = node
@@ -779,11 +1014,51 @@ class DAGCircuit:
         """
         Yield nodes in topological order.
 
+        The order is computed once and cached until the DAG is structurally
+        modified. remove_op_node() and substitute_node_with_dag() patch the
+        cached order in place of recomputing it, so after those the order is
+        still topological but not necessarily lexicographical.
+
         Returns:
             generator(DAGNode): node in topological order
         """
-        return nx.lexicographical_topological_sort(self._multi_graph,
-                                                   key=lambda x: str(x.qargs))
+        order = self._cached_topological_order()
+        if order is None:
+            if self._uses_array():
+                order = self._multi_graph.lexicographical_topological_sort(
+                    key=lambda x: str(x.qargs))
+            else:
+                order = nx.lexicographical_topological_sort(self._multi_graph,
+                                                            key=lambda x: str(x.qargs))
+            order = tuple(order)
+            self._topo_order = order
+            self._topo_version = self._version
+        return iter(order)
+
+    def _cached_topological_order(self):
+        """Return the cached topological order if it is up to date, else None."""
+        if self._topo_version == self._version:
+            return self._topo_order
+        return None
+
+    def _patch_topological_order(self, order, replacements):
+        """Replace nodes in a topological order cached before they were
+        substituted, and cache the result.
+
+        This is valid since the new nodes of a node only depend on the
+        predecessors of that node, and only its successors depend on them.
+
+        Args:
+            order (tuple(DAGNode) or None): the order cached before the
+                substitutions, if any.
+            replacements (dict): map from each substituted node to the list
+                of nodes that replaced it.
+        """
+        if order is None:
+            return
+        self._topo_order = tuple(itertools.chain.from_iterable(
+            replacements.get(node, (node,)) for node in order))
+        self._topo_version = self._version
 
     def topological_op_nodes(self):
         """
@@ -869,50 +1144,111 @@ class DAGCircuit:
                                                       condition_bit_list]
                                           for i in s])}
         self._check_wiremap_validity(wire_map, wires, self.input_map)
+        topo_order = self._cached_topological_order()
         pred_map, succ_map = self._make_pred_succ_maps(node)
         full_pred_map, full_succ_map = self._full_pred_succ_maps(pred_map, succ_map,
                                                                  input_dag, wire_map)
         # Now that we know the connections, delete node
-        self._multi_graph.remove_node(node)
+        self._remove_node(node)
 
         # Iterate over nodes of input_circuit
-        for sorted_node in input_dag.topological_op_nodes():
+        ops = [(sorted_node.op, sorted_node.qargs, sorted_node.cargs, sorted_node.condition)
+               for sorted_node in input_dag.topological_op_nodes()]
+        new_nodes = self._splice_ops(full_pred_map, ops, wire_map)
+
+        # Connect all predecessors and successors
+        for w in full_pred_map:
+            self._add_wire_edge(full_pred_map[w], full_succ_map[w], w)
+
+        self._patch_topological_order(topo_order, {node: new_nodes})
+
+    def substitute_nodes(self, mapping):
+        """Replace many op nodes, each with a dag, in a single sweep.
+
+        This is equivalent to calling substitute_node_with_dag() on each node
+        with the default wire order, but the wires of each distinct input
+        dag are checked once, and the topological order is patched once. The
+        same input dag can replace many nodes: its operations are then
+        shared by all the nodes that replace them. The input dags are not
+        modified, and a condition on a substituted node is applied to each
+        of the nodes replacing it.
+
+        Args:
+            mapping (dict): map from each op node to substitute to the
+                DAGCircuit that will substitute it.
+
+        Raises:
+            DAGCircuitError: if a node is not an op node, or does not have
+                the wires of its input dag.
+        """
+        topo_order = self._cached_topological_order()
+        # Quantum wires, classical wires and operations of each input dag
+        templates = {}
+        replacements = {}
+        for node, input_dag in mapping.items():
+            if node.type != "op":
+                raise DAGCircuitError("expected node type \"op\", got %s"
+                                      % node.type)
+            template = templates.get(id(input_dag))
+            if template is None:
+                qwires = [w for w in input_dag.wires if isinstance(w[0], QuantumRegister)]
+                cwires = [w for w in input_dag.wires if isinstance(w[0], ClassicalRegister)]
+                ops = [(sorted_node.op, sorted_node.qargs, sorted_node.cargs,
+                        sorted_node.condition)
+                       for sorted_node in input_dag.topological_op_nodes()]
+                template = templates[id(input_dag)] = (qwires, cwires, ops)
+            qwires, cwires, ops = template
+
+            if len(qwires) != len(node.qargs) or len(cwires) != len(node.cargs):
+                raise DAGCircuitError("expected %d qubits and %d bits, got %d and %d"
+                                      % (len(node.qargs), len(node.cargs),
+                                         len(qwires), len(cwires)))
+            wire_map = dict(zip(qwires, node.qargs))
+            wire_map.update(zip(cwires, node.cargs))
+
+            pred_map, succ_map = self._make_pred_succ_maps(node)
+            self._remove_node(node)
+            replacements[node] = self._splice_ops(pred_map, ops, wire_map, node.condition)
+            for w in pred_map:
+                self._add_wire_edge(pred_map[w], succ_map[w], w)
+
+        self._patch_topological_order(topo_order, replacements)
+
+    def _splice_ops(self, pred_map, ops, wire_map, condition=None):
+        """Add op nodes after the nodes of pred_map.
+
+        Args:
+            pred_map (dict): map from each wire of self to the node to add
+                the next op after. It is updated to the last added node.
+            ops (list[tuple]): (op, qargs, cargs, condition) of the op nodes
+                to add, in topological order.
+            wire_map (dict): map from the wires of ops to wires of self.
+            condition (tuple or None): condition to apply to every op,
+                replacing their own.
+
+        Returns:
+            list[DAGNode]: the added nodes.
+        """
+        new_nodes = []
+        for op, qargs, cargs, op_condition in ops:
             # Insert a new node
-            condition = self._map_condition(wire_map, sorted_node.condition)
-            m_qargs = list(map(lambda x: wire_map.get(x, x),
-                               sorted_node.qargs))
-            m_cargs = list(map(lambda x: wire_map.get(x, x),
-                               sorted_node.cargs))
-            self._add_op_node(sorted_node.op, m_qargs, m_cargs, condition)
+            if condition is None:
+                op_condition = self._map_condition(wire_map, op_condition)
+            else:
+                op_condition = condition
+            m_qargs = [wire_map.get(x, x) for x in qargs]
+            m_cargs = [wire_map.get(x, x) for x in cargs]
+            self._add_op_node(op, m_qargs, m_cargs, op_condition)
+            new_node = self._id_to_node[self._max_node_id]
+            new_nodes.append(new_node)
             # Add edges from predecessor nodes to new node
             # and update predecessor nodes that change
-            all_cbits = self._bits_in_condition(condition)
+            all_cbits = self._bits_in_condition(op_condition)
             all_cbits.extend(m_cargs)
-            al = [m_qargs, all_cbits]
-            for q in itertools.chain(*al):
-                self._multi_graph.add_edge(full_pred_map[q],
-                                           self._id_to_node[self._max_node_id],
-                                           name="%s[%s]" % (q[0].name, q[1]),
-                                           wire=q)
-                full_pred_map[q] = self._id_to_node[self._max_node_id]
-
-        # Connect all predecessors and successors, and remove
-        # residual edges between input and output nodes
-        for w in full_pred_map:
-            self._multi_graph.add_edge(full_pred_map[w],
-                                       full_succ_map[w],
-                                       name="%s[%s]" % (w[0].name, w[1]),
-                                       wire=w)
-            o_pred = list(self._multi_graph.predecessors(self.output_map[w]))
-            if len(o_pred) > 1:
-                if len(o_pred) != 2:
-                    raise DAGCircuitError("expected 2 predecessors here")
-
-                p = [x for x in o_pred if x != full_pred_map[w]]
-                if len(p) != 1:
-                    raise DAGCircuitError("expected 1 predecessor to pass filter")
-
-                self._multi_graph.remove_edge(p[0], self.output_map[w])
+            for q in itertools.chain(m_qargs, all_cbits):
+                self._add_wire_edge(pred_map[q], new_node, q)
+                pred_map[q] = new_node
+        return new_nodes
 
     def node(self, node_id):
         """Get the node in the dag.
@@ -923,6 +1259,8 @@ class DAGCircuit:
         Returns:
             node: the node.
         """
+        if self._uses_array():
+            return self._multi_graph._nodes[node_id]
         return self._multi_graph.nodes[node_id]
 
     def nodes(self):
@@ -931,7 +1269,7 @@ class DAGCircuit:
         Yield:
             node: the node.
         """
-        for node in self._multi_graph.nodes:
+        for node in self._multi_graph.nodes():
             yield node
 
     def edges(self, nodes=None):
@@ -1098,14 +1436,27 @@ class DAGCircuit:
 
     def quantum_predecessors(self, node):
         """Returns list of the predecessors of a node that are
-        connected by a quantum edge as DAGNodes."""
+        connected by a quantum edge as DAGNodes, in the order of the
+        node's wires."""
+        if isinstance(node, int):
+            warnings.warn('Calling quantum_predecessors() with a node id is deprecated,'
+                          ' use a DAGNode instead',
+                          DeprecationWarning, 2)
+            node = self._id_to_node[node]
 
-        predecessors = []
-        for predecessor in self.predecessors(node):
-            if isinstance(self._multi_graph.get_edge_data(predecessor, node, key=0)['wire'][0],
-                          QuantumRegister):
-                predecessors.append(predecessor)
-        return predecessors
+        return self._wire_neighbors(node, self._wire_prev, quantum_only=True)
+
+    def _wire_neighbors(self, node, index, quantum_only=False):
+        """Return the distinct neighbors of node along its wires in index."""
+        node_index = index.get(node, {})
+        neighbors = []
+        for wire in self._node_wires(node):
+            if quantum_only and not isinstance(wire[0], QuantumRegister):
+                continue
+            neighbor = node_index.get(wire)
+            if neighbor is not None and neighbor not in neighbors:
+                neighbors.append(neighbor)
+        return neighbors
 
     def ancestors(self, node):
         """Returns set of the ancestors of a node as DAGNodes."""
@@ -1115,7 +1466,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.ancestors(self._multi_graph, node)
+        return self._ancestors(node)
 
     def descendants(self, node):
         """Returns set of the descendants of a node as DAGNodes."""
@@ -1125,7 +1476,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        return nx.descendants(self._multi_graph, node)
+        return self._descendants(node)
 
     def bfs_successors(self, node):
         """
@@ -1138,24 +1489,31 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
+        if self._uses_array():
+            return self._multi_graph.bfs_successors(node)
         return nx.bfs_successors(self._multi_graph, node)
 
     def quantum_successors(self, node):
         """Returns list of the successors of a node that are
-        connected by a quantum edge as DAGNodes."""
+        connected by a quantum edge as DAGNodes, in the order of the
+        node's wires."""
         if isinstance(node, int):
             warnings.warn('Calling quantum_successors() with a node id is deprecated,'
                           ' use a DAGNode instead',
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        successors = []
-        for successor in self.successors(node):
-            if isinstance(self._multi_graph.get_edge_data(
-                    node, successor, key=0)['wire'][0],
-                          QuantumRegister):
-                successors.append(successor)
-        return successors
+        return self._wire_neighbors(node, self._wire_next, quantum_only=True)
+
+    def _ancestors(self, node):
+        if self._uses_array():
+            return self._multi_graph.ancestors(node)
+        return nx.ancestors(self._multi_graph, node)
+
+    def _descendants(self, node):
+        if self._uses_array():
+            return self._multi_graph.descendants(node)
+        return nx.descendants(self._multi_graph, node)
 
     def remove_op_node(self, node):
         """Remove an operation node n.
@@ -1172,14 +1530,16 @@ class DAGCircuit:
             raise DAGCircuitError('The method remove_op_node only works on op node types. An "%s" '
                                   'node type was wrongly provided.' % node.type)
 
+        topo_order = self._cached_topological_order()
         pred_map, succ_map = self._make_pred_succ_maps(node)
 
         # remove from graph and map
-        self._multi_graph.remove_node(node)
+        self._remove_node(node)
 
         for w in pred_map.keys():
-            self._multi_graph.add_edge(pred_map[w], succ_map[w],
-                                       name="%s[%s]" % (w[0].name, w[1]), wire=w)
+            self._add_wire_edge(pred_map[w], succ_map[w], w)
+
+        self._patch_topological_order(topo_order, {node: []})
 
     def remove_ancestors_of(self, node):
         """Remove all of the ancestor operation nodes of node."""
@@ -1189,7 +1549,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self._ancestors(node)
         # TODO: probably better to do all at once using
         # multi_graph.remove_nodes_from; same for related functions ...
         for anc_node in anc:
@@ -1204,7 +1564,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        desc = nx.descendants(self._multi_graph, node)
+        desc = self._descendants(node)
         for desc_node in desc:
             if desc_node.type == "op":
                 self.remove_op_node(desc_node)
@@ -1217,7 +1577,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        anc = nx.ancestors(self._multi_graph, node)
+        anc = self._ancestors(node)
         comp = list(set(self._multi_graph.nodes()) - set(anc))
         for n in comp:
             if n.type == "op":
@@ -1231,7 +1591,7 @@ class DAGCircuit:
                           DeprecationWarning, 2)
             node = self._id_to_node[node]
 
-        dec = nx.descendants(self._multi_graph, node)
+        dec = self._descendants(node)
         comp = list(set(self._multi_graph.nodes()) - set(dec))
         for n in comp:
             if n.type == "op":
@@ -1257,11 +1617,6 @@ class DAGCircuit:
         except StopIteration:
             return
 
-        def add_nodes_from(layer, nodes):
-            """ Convert DAGNodes into a format that can be added to a
-             multigraph and then add to graph"""
-            layer._multi_graph.add_nodes_from(nodes)
-
         for graph_layer in graph_layers:
 
             # Get the op nodes from the layer, removing any input and output nodes.
@@ -1271,42 +1626,96 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
+            # Construct a shallow copy of self, sharing its registers and
+            # its input and output nodes
+            new_layer = DAGCircuit(storage=self._storage)
             new_layer.name = self.name
-
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-
-            add_nodes_from(new_layer, self.input_map.values())
-            add_nodes_from(new_layer, self.output_map.values())
-            add_nodes_from(new_layer, op_nodes)
+            new_layer.qregs = self.qregs.copy()
+            new_layer.cregs = self.cregs.copy()
+            new_layer.wires = list(self.wires)
+            new_layer.input_map = self.input_map.copy()
+            new_layer.output_map = self.output_map.copy()
+            new_layer._max_node_id = self._max_node_id
+
+            new_layer._multi_graph.add_nodes_from(self.input_map.values())
+            new_layer._multi_graph.add_nodes_from(self.output_map.values())
+            new_layer._multi_graph.add_nodes_from(op_nodes)
+            for op_node in op_nodes:
+                new_layer._op_counts[op_node.name] = \
+                    new_layer._op_counts.get(op_node.name, 0) + 1
 
             # The quantum registers that have an operation in this layer.
-            support_list = [
-                op_node.qargs
-                for op_node in op_nodes
-                if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
-            ]
+            support_list = self._layer_partition(op_nodes)
 
             # Now add the edges to the multi_graph
             # By default we just wire inputs to the outputs.
-            wires = {self.input_map[wire]: self.output_map[wire]
-                     for wire in self.wires}
+            last_nodes = self.input_map.copy()
             # Wire inputs to op nodes, and op nodes to outputs.
             for op_node in op_nodes:
                 args = self._bits_in_condition(op_node.condition) \
                        + op_node.cargs + op_node.qargs
-                arg_ids = (self.input_map[(arg[0], arg[1])] for arg in args)
-                for arg_id in arg_ids:
-                    wires[arg_id], wires[op_node] = op_node, wires[arg_id]
+                for arg in args:
+                    new_layer._add_wire_edge(last_nodes[arg], op_node, arg)
+                    last_nodes[arg] = op_node
 
-            # Add wiring to/from the operations and between unused inputs & outputs.
-            new_layer._multi_graph.add_edges_from(wires.items())
+            # Add wiring from the operations and unused inputs to the outputs.
+            for wire, last_node in last_nodes.items():
+                new_layer._add_wire_edge(last_node, self.output_map[wire], wire)
             yield {"graph": new_layer, "partition": support_list}
 
+    @staticmethod
+    def _layer_partition(op_nodes):
+        """Return the qargs of the op nodes of a layer that take part in mapping."""
+        return [op_node.qargs
+                for op_node in op_nodes
+                if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}]
+
+    def layer_views(self):
+        """Yield the op nodes of each layer of this circuit, without copying them.
+
+        The layers are the same as those of layers(), but no DAGCircuit is
+        built for them. Each returned layer is a dict containing
+        {"nodes": list of op nodes of self, "partition": list of qubit lists}.
+        The nodes belong to self and should not be modified.
+        """
+        graph_layers = self.multigraph_layers()
+        try:
+            next(graph_layers)  # Remove input nodes
+        except StopIteration:
+            return
+
+        for graph_layer in graph_layers:
+            op_nodes = [node for node in graph_layer if node.type == "op"]
+            if not op_nodes:
+                return
+            yield {"nodes": op_nodes, "partition": self._layer_partition(op_nodes)}
+
+    def serial_layer_views(self, nodes=None):
+        """Yield a view on a layer for each op node, without copying it.
+
+        The layers have the same structure as in layer_views().
+
+        Args:
+            nodes (list[DAGNode]): the op nodes of a layer view to yield a
+                layer for, in the order serial_layers() uses for the layer.
+                Defaults to all op nodes in topological order.
+
+        Yields:
+            dict: the layer of an op node, with its "nodes" list and the
+                "partition" of its qubits.
+        """
+        if nodes is None:
+            nodes = self.topological_op_nodes()
+        else:
+            # Order the nodes as the topological sort of the layer's
+            # DAGCircuit would, where an op follows its input nodes.
+            nodes = sorted(nodes, key=lambda node: (
+                max((self.input_map[wire]._node_id for wire in self._node_wires(node)),
+                    default=-1),
+                str(node.qargs)))
+        for node in nodes:
+            yield {"nodes": [node], "partition": self._layer_partition([node])}
+
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
 
@@ -1314,7 +1723,7 @@ class DAGCircuit:
         same structure as in layers().
         """
         for next_node in self.topological_op_nodes():
-            new_layer = DAGCircuit()
+            new_layer = DAGCircuit(storage=self._storage)
             for qreg in self.qregs.values():
                 new_layer.add_qreg(qreg)
             for creg in self.cregs.values():
@@ -1362,6 +1771,29 @@ class DAGCircuit:
             cur_layer = next_layer
             next_layer = []
 
+    def front_layer(self):
+        """Return the op nodes that have no op predecessors.
+
+        The returned FrontLayer is updated incrementally: calling its
+        consume(node) method removes node and adds the nodes it unblocks,
+        so a whole circuit can be walked layer by layer without rebuilding
+        any layer.
+
+        Returns:
+            FrontLayer: the front layer of the circuit.
+        """
+        return FrontLayer(self)
+
+    def back_layer(self):
+        """Return the op nodes that have no op successors.
+
+        Same as front_layer(), walking the circuit from the outputs.
+
+        Returns:
+            FrontLayer: the back layer of the circuit.
+        """
+        return FrontLayer(self, reverse=True)
+
     def collect_runs(self, namelist):
         """Return a set of non-conditional runs of "op" nodes with the given names.
 
@@ -1417,33 +1849,22 @@ class DAGCircuit:
             raise DAGCircuitError('The given wire %s is not present in the circuit'
                                   % str(wire))
 
-        more_nodes = True
-        while more_nodes:
-            more_nodes = False
+        while current_node is not None:
             # allow user to just get ops on the wire - not the input/output nodes
             if current_node.type == 'op' or not only_ops:
                 yield current_node
 
-            # find the adjacent node that takes the wire being looked at as input
-            for node, edges in self._multi_graph.adj[current_node].items():
-                if any(wire == edge['wire'] for edge in edges.values()):
-                    current_node = node
-                    more_nodes = True
-                    break
+            # follow the per-wire index to the node that takes the wire as input
+            current_node = self._wire_next.get(current_node, {}).get(wire)
 
     def count_ops(self):
         """Count the occurrences of operation names.
 
+        The counts are kept up to date as operations are added and removed.
+
         Returns a dictionary of counts keyed on the operation name.
         """
-        op_dict = {}
-        for node in self.topological_op_nodes():
-            name = node.name
-            if name not in op_dict:
-                op_dict[name] = 1
-            else:
-                op_dict[name] += 1
-        return op_dict
+        return dict(self._op_counts)
 
     def properties(self):
         """Return a dictionary of circuit properties."""
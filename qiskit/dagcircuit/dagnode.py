@@ -8,6 +8,8 @@
 """Object to represent the information at a node in the DAGCircuit
 """
 
+from collections.abc import MutableMapping
+
 from qiskit.exceptions import QiskitError
 
 
@@ -17,34 +19,57 @@ class DAGNode:
 
     It is used as the return value from *_nodes() functions and can
     be supplied to functions that take a node.
+
+    The fields are stored in slots rather than in a per-node dict, and nodes
+    hash and compare by identity.
     """
 
-    def __init__(self, data_dict, nid=-1):
-        """Create a node """
-        self._node_id = nid
-        self.data_dict = data_dict
+    __slots__ = ['type', '_op', 'name', '_qargs', 'cargs', 'condition', '_wire', '_node_id']
 
-    @property
-    def type(self):
-        """Returns a str which is the type of the node else None"""
-        return self.data_dict.get('type')
+    def __init__(self, data_dict=None, nid=-1, type=None, op=None, name=None, qargs=None,
+                 cargs=None, condition=None, wire=None):
+        """Create a node
+
+        Args:
+            data_dict (dict): deprecated way of giving the fields below.
+            nid (int): the node id.
+            type (str): 'op', 'in' or 'out'.
+            op (Instruction): the operation of an op node.
+            name (str): the name of the node.
+            qargs (list[(QuantumRegister, int)]): qubits of an op node.
+            cargs (list[(ClassicalRegister, int)]): bits of an op node.
+            condition (tuple or None): (ClassicalRegister, int) condition of an op node.
+            wire (tuple): the (Register, int) wire of an input or output node.
+        """
+        # pylint: disable=redefined-builtin
+        if data_dict is not None:
+            type = data_dict.get('type')
+            op = data_dict.get('op')
+            name = data_dict.get('name')
+            qargs = data_dict.get('qargs')
+            cargs = data_dict.get('cargs')
+            condition = data_dict.get('condition')
+            wire = data_dict.get('wire')
+        self._node_id = nid
+        self.type = type
+        self._op = op
+        self.name = name
+        self._qargs = qargs if qargs is not None else []
+        self.cargs = cargs if cargs is not None else []
+        self.condition = condition
+        self._wire = wire
 
     @property
     def op(self):
         """Returns the Instruction object corresponding to the op for the node else None"""
-        if 'type' not in self.data_dict or self.data_dict['type'] != 'op':
+        if self.type != 'op':
             raise QiskitError("The node %s is not an op node" % (str(self)))
-        return self.data_dict.get('op')
-
-    @property
-    def name(self):
-        """Returns a str which is the name of the node else None"""
-        return self.data_dict.get('name')
+        return self._op
 
-    @name.setter
-    def name(self, new_name):
-        """Sets the name of the node to be the given value"""
-        self.data_dict['name'] = new_name
+    @op.setter
+    def op(self, new_op):
+        """Sets the Instruction object of the node"""
+        self._op = new_op
 
     @property
     def qargs(self):
@@ -52,28 +77,12 @@ class DAGNode:
         Returns list of (QuantumRegister, int) tuples where the int is the index
         of the qubit else an empty list
         """
-        return self.data_dict.get('qargs', [])
+        return self._qargs
 
     @qargs.setter
     def qargs(self, new_qargs):
         """Sets the qargs to be the given list of qargs"""
-        self.data_dict['qargs'] = new_qargs
-
-    @property
-    def cargs(self):
-        """
-        Returns list of (ClassicalRegister, int) tuples where the int is the index
-        of the cbit else an empty list
-        """
-        return self.data_dict.get('cargs', [])
-
-    @property
-    def condition(self):
-        """
-        Returns a tuple (ClassicalRegister, int) where the int is the
-        value of the condition else None
-        """
-        return self.data_dict.get('condition')
+        self._qargs = new_qargs
 
     @property
     def wire(self):
@@ -81,9 +90,17 @@ class DAGNode:
         Returns (Register, int) tuple where the int is the index of
         the wire else None
         """
-        if self.data_dict['type'] not in ['in', 'out']:
+        if self.type not in ['in', 'out']:
             raise QiskitError('The node %s is not an input/output node' % str(self))
-        return self.data_dict.get('wire')
+        return self._wire
+
+    @property
+    def data_dict(self):
+        """Deprecated. Returns a dict-like view of the fields of the node.
+
+        Setting or deleting a key of the view sets or clears that field of the node.
+        """
+        return _DataDictView(self)
 
     def __lt__(self, other):
         return self._node_id < other._node_id
@@ -91,20 +108,18 @@ class DAGNode:
     def __gt__(self, other):
         return self._node_id > other._node_id
 
-    def __hash__(self):
-        """Needed for ancestors function, which returns a set
-        to be in a set requires the object to be hashable
-        """
-        return hash(id(self))
-
     def __str__(self):
         # TODO is this used anywhere other than in DAG drawing?
         # needs to be unique as it is what pydot uses to distinguish nodes
         return str(id(self))
 
     def pop(self, val):
-        """Remove the provided value from the dictionary"""
-        del self.data_dict[val]
+        """Clear the provided field of the node"""
+        if val == 'op':
+            val = '_op'
+        elif val in ('qargs', 'wire'):
+            val = '_' + val
+        setattr(self, val, [] if val in ('_qargs', 'cargs') else None)
 
     @staticmethod
     def semantic_eq(node1, node2):
@@ -121,4 +136,49 @@ class DAGNode:
         # For barriers, qarg order is not significant so compare as sets
         if 'barrier' == node1.name == node2.name:
             return set(node1.qargs) == set(node2.qargs)
-        return node1.data_dict == node2.data_dict
+        return (node1.type == node2.type and node1.name == node2.name and
+                node1._qargs == node2._qargs and node1.cargs == node2.cargs and
+                node1.condition == node2.condition and node1._wire == node2._wire and
+                node1._op == node2._op)
+
+
+class _DataDictView(MutableMapping):
+    """Write-through mapping over the fields of a DAGNode, for the deprecated
+    DAGNode.data_dict."""
+
+    __slots__ = ['_node']
+
+    # The slot holding each key, if it is not the key itself
+    _SLOTS = {'op': '_op', 'qargs': '_qargs', 'wire': '_wire'}
+
+    def __init__(self, node):
+        self._node = node
+
+    def _keys(self):
+        if self._node.type == 'op':
+            return ('type', 'name', 'op', 'qargs', 'cargs', 'condition')
+        return ('type', 'name', 'wire')
+
+    def __getitem__(self, key):
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self._node, self._SLOTS.get(key, key))
+
+    def __setitem__(self, key, value):
+        if key not in self._keys():
+            raise KeyError(key)
+        setattr(self._node, self._SLOTS.get(key, key), value)
+
+    def __delitem__(self, key):
+        if key not in self._keys():
+            raise KeyError(key)
+        self._node.pop(key)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return repr(dict(self))
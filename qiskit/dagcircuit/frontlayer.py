@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Front (or back) layer of a DAGCircuit that advances as nodes are consumed.
+"""
+
+from collections import OrderedDict
+
+from .exceptions import DAGCircuitError
+
+
+class FrontLayer:
+    """
+    The op nodes of a DAGCircuit whose predecessors have all been consumed.
+
+    Consuming a node of the layer only visits the nodes that follow it on
+    its wires, using the per-wire index of the DAG, so walking a whole
+    circuit costs O(number of edges) in total. With reverse=True the layer
+    starts at the outputs and walks the circuit backwards.
+
+    The DAG must not be modified while the layer is in use.
+    """
+
+    def __init__(self, dag, reverse=False):
+        """Create the first layer of dag.
+
+        Args:
+            dag (DAGCircuit): the circuit to walk.
+            reverse (bool): walk from the outputs instead of the inputs.
+        """
+        self._dag = dag
+        if reverse:
+            self._start, self._next, self._prev = dag.output_map, dag._wire_prev, dag._wire_next
+        else:
+            self._start, self._next, self._prev = dag.input_map, dag._wire_next, dag._wire_prev
+        # Number of wires of a pending node still waiting on an unconsumed op
+        self._pending = {}
+        # Current layer, kept in insertion order
+        self._nodes = OrderedDict()
+        for wire, boundary in self._start.items():
+            node = self._next[boundary].get(wire)
+            if node is not None:
+                self._visit(node)
+
+    def _visit(self, node):
+        if node.type != 'op':
+            return
+        if node not in self._pending:
+            self._pending[node] = len(self._prev[node])
+        self._pending[node] -= 1
+        if not self._pending[node]:
+            del self._pending[node]
+            self._nodes[node] = None
+
+    @property
+    def nodes(self):
+        """list[DAGNode]: the op nodes of the current layer."""
+        return list(self._nodes)
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, node):
+        return node in self._nodes
+
+    def consume(self, node):
+        """Remove node from the layer and add the nodes it unblocks.
+
+        Args:
+            node (DAGNode): an op node of the current layer.
+
+        Returns:
+            list[DAGNode]: the nodes that entered the layer.
+
+        Raises:
+            DAGCircuitError: if node is not in the current layer.
+        """
+        if node not in self._nodes:
+            raise DAGCircuitError("node %s is not in the front layer" % node)
+        del self._nodes[node]
+        before = len(self._nodes)
+        for successor in self._next[node].values():
+            self._visit(successor)
+        return list(self._nodes)[before:]
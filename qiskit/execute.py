@@ -20,7 +20,9 @@ running quickly we have provided this wrapper module.
 """
 import logging
 
+from qiskit.circuit import QuantumCircuit
 from qiskit.compiler import transpile, assemble
+from qiskit.converters import circuit_to_dag
 
 logger = logging.getLogger(__name__)
 
@@ -167,13 +169,15 @@ def execute(experiments, backend,
             The delay between experiments will be rep_time.
             Must be from the list provided by the device.
 
-        parameter_binds (list[dict{Parameter: Value}]):
+        parameter_binds (list[dict] or dict):
             List of Parameter bindings over which the set of experiments will be
             executed. Each list element (bind) should be of the form
             {Parameter1: value1, Parameter2: value2, ...}. All binds will be
             executed across all experiments, e.g. if parameter_binds is a
             length-n list, and there are m experiments, a total of m x n
             experiments will be run (one for each experiment/bind pair).
+            The bindings can also be given as a dict of each Parameter to
+            its sequence of values.
 
         run_config (dict):
             Extra arguments used to configure the run (e.g. for Aer configurable backends)
@@ -187,7 +191,13 @@ def execute(experiments, backend,
     Raises:
         QiskitError: if the execution cannot be interpreted as either circuits or schedules
     """
-    # transpiling the circuits using given transpile options
+    # transpiling the circuits using given transpile options. They are
+    # transpiled and assembled as DAGs, without converting them back.
+    if isinstance(experiments, list):
+        experiments = [circuit_to_dag(experiment) if isinstance(experiment, QuantumCircuit)
+                       else experiment for experiment in experiments]
+    elif isinstance(experiments, QuantumCircuit):
+        experiments = circuit_to_dag(experiments)
     experiments = transpile(experiments,
                             basis_gates=basis_gates,
                             coupling_map=coupling_map,
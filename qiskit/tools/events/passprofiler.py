@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Per-pass profile of a transpile() call."""
+
+import sys
+import tracemalloc
+from collections import OrderedDict
+
+from qiskit.tools.events.pubsub import Subscriber
+
+
+class PassProfiler(Subscriber):
+    """
+    Aggregates the passes run by the next transpile() call and prints a
+    table of their cost when it finishes.
+
+    For each pass class, the table reports how many times it ran, its total
+    wall time and share of the pass time, the largest peak allocation of a
+    single run, the total change of the circuit size and depth, and the
+    largest do-while iteration it ran in. The circuits of the call are
+    transpiled in this process so that every pass is recorded.
+
+    output_handler : the handler the table should be written to, default
+                     is sys.stdout, another option is sys.stderr
+    memory : if True, trace allocations with tracemalloc during the call to
+             measure the peak allocation of each pass. This slows the passes
+             down.
+    """
+
+    def __init__(self, output_handler=None, memory=False):
+        super().__init__()
+        self.output_handler = output_handler if output_handler else sys.stdout
+        self.memory = memory
+        # Per pass name: calls, time, memory, size and depth deltas, iterations
+        self.stats = OrderedDict()
+        self._started_tracing = False
+        self._init_subscriber()
+
+    def _init_subscriber(self):
+        def _start_pass_profile(num_circuits):
+            """ """
+            # pylint: disable=unused-argument
+            self.start()
+        self.subscribe("terra.transpiler.transpile.start", _start_pass_profile)
+
+        def _record_pass(**measurements):
+            """ """
+            self.record(**measurements)
+        self.subscribe("terra.transpiler.pass.done", _record_pass)
+
+        def _finish_pass_profile():
+            """ """
+            self.unsubscribe("terra.transpiler.transpile.start", _start_pass_profile)
+            self.unsubscribe("terra.transpiler.pass.done", _record_pass)
+            self.unsubscribe("terra.transpiler.transpile.done", _finish_pass_profile)
+            self.finished()
+        self.subscribe("terra.transpiler.transpile.done", _finish_pass_profile)
+
+    def start(self):
+        """Start profiling a transpile() call."""
+        self.stats.clear()
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def record(self, name, time, memory, size_before, depth_before,
+               size_after, depth_after, iteration, **_):
+        """Add the measurements of a pass run.
+
+        Parameters:
+            name (str): the name of the pass.
+            time (float): its wall time, in seconds.
+            memory (int or None): its peak allocation, in bytes, if measured.
+            size_before (int): the circuit size before the pass.
+            depth_before (int): the circuit depth before the pass.
+            size_after (int): the circuit size after the pass.
+            depth_after (int): the circuit depth after the pass.
+            iteration (int): the do-while iteration the pass ran in.
+            _ (dict): the other measurements of the pass, which are not used.
+        """
+        # pylint: disable=redefined-outer-name
+        stat = self.stats.get(name)
+        if stat is None:
+            stat = self.stats[name] = {'calls': 0, 'time': 0.0, 'memory': None,
+                                       'size': 0, 'depth': 0, 'iterations': 0}
+        stat['calls'] += 1
+        stat['time'] += time
+        if memory is not None:
+            stat['memory'] = max(stat['memory'] or 0, memory)
+        stat['size'] += size_after - size_before
+        stat['depth'] += depth_after - depth_before
+        stat['iterations'] = max(stat['iterations'], iteration)
+
+    def table(self):
+        """Return the profile as a text table, most expensive passes first."""
+        total = sum(stat['time'] for stat in self.stats.values()) or 1.0
+        width = max([len('Pass')] + [len(name) for name in self.stats])
+        lines = ['%-*s %6s %10s %6s %12s %8s %8s %5s'
+                 % (width, 'Pass', 'Calls', 'Time (s)', '%', 'Peak (KiB)',
+                    'Size', 'Depth', 'Iter')]
+        for name, stat in sorted(self.stats.items(), key=lambda item: -item[1]['time']):
+            memory = '-' if stat['memory'] is None else '%.1f' % (stat['memory'] / 1024)
+            lines.append('%-*s %6d %10.4f %6.1f %12s %+8d %+8d %5d'
+                         % (width, name, stat['calls'], stat['time'],
+                            100 * stat['time'] / total, memory, stat['size'],
+                            stat['depth'], stat['iterations']))
+        return '\n'.join(lines)
+
+    def finished(self):
+        """Print the profile once the transpile() call has finished."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self.output_handler.write(self.table() + '\n')
+        self.output_handler.flush()
@@ -96,6 +96,14 @@ class _Broker:
         for subscriber in self._subscribers[event]:
             subscriber.callback(*args, **kwargs)
 
+    def has_subscribers(self, event):
+        """Return True if any callback is subscribed to the event.
+
+        Args
+            event (String): The event to check
+        """
+        return bool(self._subscribers.get(event))
+
     def unsubscribe(self, event, callback):
         """ Unsubscribe the specific callback to the event.
 
@@ -134,6 +142,11 @@ class Publisher:
         subscribers, their callback will be called synchronously. """
         return self._broker.dispatch(event, *args, **kwargs)
 
+    def has_subscribers(self, event):
+        """ Return True if publishing the event would call any callback, so that
+        publishers can skip preparing data nobody listens to. """
+        return self._broker.has_subscribers(event)
+
 
 class Subscriber:
     """ Represents a Subscriber, every component (class) can become a Subscriber and
@@ -50,9 +50,12 @@ Routines for running Python functions in parallel using process pools
 from the multiprocessing library.
 """
 
+import atexit
 import os
+import pickle
 import platform
-from multiprocessing import Pool
+from functools import partial
+from multiprocessing import Pool, TimeoutError as PoolTimeoutError
 from qiskit.exceptions import QiskitError
 from qiskit.util import local_hardware_info
 from qiskit.tools.events.pubsub import Publisher
@@ -60,8 +63,112 @@ from qiskit.tools.events.pubsub import Publisher
 # Set parallel flag
 os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
 
-# Number of local physical cpus
-CPU_COUNT = local_hardware_info()['cpus']
+# Number of local physical cpus, unless set by the QISKIT_NUM_PROCS env var
+CPU_COUNT = int(os.getenv('QISKIT_NUM_PROCS', '0')) or local_hardware_info()['cpus']
+
+# The worker pool shared by the calls to parallel_map(), its number of
+# processes, the process that owns it, and the ids of its worker processes
+_POOL = None
+_POOL_PROCESSES = 0
+_POOL_PID = None
+_POOL_WORKERS = frozenset()
+
+# Seconds between two checks that the workers are alive, while waiting for results
+_POLL_INTERVAL = 0.1
+
+
+class _PoolFailure(Exception):
+    """The shared pool could not run a task: a worker died, or could not
+    unpickle a task, e.g. one referencing code defined after the pool was
+    forked."""
+
+
+def should_run_in_parallel(num_processes=CPU_COUNT):
+    """Return True if parallel_map() would run its tasks in other processes.
+
+    Args:
+        num_processes (int): the number of processes parallel_map() is given.
+
+    Returns:
+        bool: False on Windows, with a single process, or inside a task
+            already run by parallel_map().
+    """
+    return (platform.system() != 'Windows' and num_processes > 1
+            and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE')
+
+
+def get_pool(num_processes=CPU_COUNT):
+    """Return the worker pool of parallel_map(), creating it if needed.
+
+    The pool is created on first use and kept for the following calls. It is
+    created again if a different number of processes is requested, or if one
+    of its workers has died.
+
+    Args:
+        num_processes (int): the number of worker processes.
+
+    Returns:
+        multiprocessing.pool.Pool: the shared pool.
+    """
+    global _POOL, _POOL_PROCESSES, _POOL_PID, _POOL_WORKERS  # pylint: disable=global-statement
+    if _POOL is not None and _POOL_PID != os.getpid():
+        # Inherited through a fork: the pool belongs to the parent process
+        _POOL = None
+    if _POOL is not None and _POOL_PROCESSES != num_processes:
+        shutdown_pool()
+    if _POOL is not None and _workers_died():
+        shutdown_pool(wait=False)
+    if _POOL is None:
+        # The workers inherit the flag, so the tasks they run do not start
+        # pools of their own
+        in_parallel = os.environ['QISKIT_IN_PARALLEL']
+        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+        try:
+            _POOL = Pool(processes=num_processes)
+        finally:
+            os.environ['QISKIT_IN_PARALLEL'] = in_parallel
+        _POOL_PROCESSES = num_processes
+        _POOL_PID = os.getpid()
+        _POOL_WORKERS = _worker_pids(_POOL)
+    return _POOL
+
+
+def _worker_pids(pool):
+    """Return the ids of the live worker processes of a pool."""
+    # pylint: disable=protected-access
+    return frozenset(process.pid for process in list(pool._pool) if process.exitcode is None)
+
+
+def _workers_died():
+    """Return True if a worker of the shared pool has exited since it was created.
+
+    The pool replaces a dead worker, but the tasks it was running are lost.
+    """
+    return _worker_pids(_POOL) != _POOL_WORKERS
+
+
+def shutdown_pool(wait=True):
+    """Shut down the worker pool of parallel_map(), if there is one.
+
+    The next parallel_map() call creates a new pool. This is called when
+    the interpreter exits.
+
+    Args:
+        wait (bool): if True, let the workers finish their current tasks,
+            otherwise terminate them right away.
+    """
+    global _POOL  # pylint: disable=global-statement
+    pool, _POOL = _POOL, None
+    if pool is None or _POOL_PID != os.getpid():
+        return
+    if wait:
+        pool.close()
+    else:
+        pool.terminate()
+    pool.join()
+
+
+atexit.register(shutdown_pool)
 
 
 def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: disable=W0102
@@ -75,6 +182,11 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
     On Windows this function defaults to a serial implementation to avoid the
     overhead from spawning processes in Windows.
 
+    The tasks run in a pool of worker processes that is kept between calls.
+    Values are sent to the workers in chunks. If a worker dies, or cannot
+    unpickle a task, e.g. because it uses code defined after the pool was
+    created, the unfinished tasks are run once more on a new pool.
+
     Args:
         task (func): Function that is to be called for each value in ``values``.
         values (array_like): List or array of values for which the ``task``
@@ -89,7 +201,8 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
                     each value in ``values``.
 
     Raises:
-        QiskitError: If user interrupts via keyboard.
+        QiskitError: If user interrupts via keyboard, or if the tasks fail
+            to run on the new pool too.
 
     Events:
         terra.parallel.start: The collection of parallel tasks are about to start.
@@ -107,31 +220,36 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
         Publisher().publish("terra.parallel.done", nfinished[0])
 
     # Run in parallel if not Win and not in parallel already
-    if platform.system() != 'Windows' and num_processes > 1 \
-       and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
+    if should_run_in_parallel(num_processes):
+        # The task and the values are unpickled by _run_tasks, so that a worker
+        # that cannot unpickle them reports it instead of dying
+        payload = pickle.dumps((task, task_args, task_kwargs))
+        indexed_values = [(index, pickle.dumps(value)) for index, value in enumerate(values)]
+        results = {}
         os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
         try:
-            pool = Pool(processes=num_processes)
-
-            async_res = [pool.apply_async(task, (value,) + task_args, task_kwargs,
-                                          _callback) for value in values]
-
-            while not all([item.ready() for item in async_res]):
-                for item in async_res:
-                    item.wait(timeout=0.1)
-
-            pool.terminate()
-            pool.join()
+            for attempt in range(2):
+                remaining = [(index, value) for index, value in indexed_values
+                             if index not in results]
+                try:
+                    _map_on_pool(get_pool(num_processes), payload, remaining, results,
+                                 _callback)
+                    break
+                except _PoolFailure as error:
+                    # The next attempt runs on a pool forked from the current
+                    # state of this process
+                    shutdown_pool(wait=False)
+                    if attempt:
+                        raise QiskitError('parallel_map could not run its tasks: %s' % error)
 
         except KeyboardInterrupt:
-            pool.terminate()
-            pool.join()
-            Publisher().publish("terra.parallel.finish")
+            shutdown_pool(wait=False)
             raise QiskitError('Keyboard interrupt in parallel_map.')
 
-        Publisher().publish("terra.parallel.finish")
-        os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
-        return [ar.get() for ar in async_res]
+        finally:
+            Publisher().publish("terra.parallel.finish")
+            os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
+        return [results[index] for index in range(len(values))]
 
     # Cannot do parallel on Windows , if another parallel_map is running in parallel,
     # or len(values) == 1.
@@ -142,3 +260,39 @@ def parallel_map(task, values, task_args=tuple(), task_kwargs={},  # pylint: dis
         _callback(0)
     Publisher().publish("terra.parallel.finish")
     return results
+
+
+def _map_on_pool(pool, payload, indexed_values, results, callback):
+    """Run the tasks of parallel_map() on the pool, and store their results by index.
+
+    Raises:
+        _PoolFailure: if a worker died or could not unpickle a task.
+    """
+    # Like Pool.map(), send about four chunks to each worker
+    chunksize, extra = divmod(len(indexed_values), 4 * _POOL_PROCESSES)
+    chunksize += bool(extra)
+    chunks = [indexed_values[start:start + chunksize]
+              for start in range(0, len(indexed_values), chunksize)]
+    iterator = pool.imap_unordered(partial(_run_tasks, payload), chunks)
+    for _ in chunks:
+        while True:
+            try:
+                chunk_results = iterator.next(timeout=_POLL_INTERVAL)
+                break
+            except PoolTimeoutError:
+                if _workers_died():
+                    raise _PoolFailure('a worker process died')
+        for index, result in chunk_results:
+            results[index] = result
+            callback(result)
+
+
+def _run_tasks(payload, indexed_values):
+    """Run a chunk of tasks in a worker, and return their results with the
+    indices of their values."""
+    try:
+        task, task_args, task_kwargs = pickle.loads(payload)
+        values = [(index, pickle.loads(value)) for index, value in indexed_values]
+    except Exception as error:  # pylint: disable=broad-except
+        raise _PoolFailure('a worker could not unpickle a task: %r' % error)
+    return [(index, task(value, *task_args, **task_kwargs)) for index, value in values]
@@ -20,5 +20,6 @@ from .exceptions import TranspilerError, TranspilerAccessError
 from .fencedobjs import FencedDAGCircuit, FencedPropertySet
 from .basepasses import AnalysisPass, TransformationPass
 from .coupling import CouplingMap
-from .layout import Layout
-from .transpile_circuit import transpile_circuit
+from .layout import Layout, IntLayout
+from .transpile_circuit import transpile_circuit, transpile_dag
+from .transpile_cache import TranspileCache
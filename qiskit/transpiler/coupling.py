@@ -21,13 +21,23 @@ The nodes of the graph correspond to physical qubits (represented as integers) a
 directed edges indicate which physical qubits are coupled and the permitted direction of
 CNOT gates. The object has a distance function that can be used to map quantum circuits
 onto a device with this coupling.
+
+The distances and shortest paths between all pairs of physical qubits are computed
+once per set of undirected edges and shared by all CouplingMap objects with the same
+edges, so that building a CouplingMap per circuit does not repeat the search.
 """
+from collections import OrderedDict
+
 import numpy as np
 import scipy.sparse as sp
 import scipy.sparse.csgraph as cs
 import networkx as nx
 from qiskit.transpiler.exceptions import CouplingError
 
+# The distance tables of the last coupling graphs, by graph
+_PATH_TABLES = OrderedDict()
+_PATH_TABLES_SIZE = 16
+
 
 class CouplingMap:
     """
@@ -48,8 +58,12 @@ class CouplingMap:
 
         # the coupling map graph
         self.graph = nx.DiGraph()
-        # a dict of dicts from node pairs to distances
+        # a matrix of the distances between pairs of nodes
         self._dist_matrix = None
+        # the distance table of the undirected graph
+        self._path_tables = None
+        # the shortest undirected paths found, by pair of nodes
+        self._paths = {}
         # a sorted list of physical qubits (integers) in this coupling map
         self._qubit_list = None
 
@@ -85,6 +99,8 @@ class CouplingMap:
                 "The physical qubit %s is already in the coupling graph" % physical_qubit)
         self.graph.add_node(physical_qubit)
         self._dist_matrix = None  # invalidate
+        self._path_tables = None  # invalidate
+        self._paths = {}  # invalidate
         self._qubit_list = None  # invalidate
 
     def add_edge(self, src, dst):
@@ -100,6 +116,8 @@ class CouplingMap:
             self.add_physical_qubit(dst)
         self.graph.add_edge(src, dst)
         self._dist_matrix = None  # invalidate
+        self._path_tables = None  # invalidate
+        self._paths = {}  # invalidate
 
     def subgraph(self, nodelist):
         """Return a CouplingMap object for a subgraph of self.
@@ -134,19 +152,40 @@ class CouplingMap:
     def _compute_distance_matrix(self):
         """Compute the full distance matrix on pairs of nodes.
 
-        The distance map self._dist_matrix is computed from the graph using
-        all_pairs_shortest_path_length.
+        The distance map self._dist_matrix is a float copy of the distance
+        table of the undirected graph, shared with the CouplingMaps of the
+        same graph.
         """
         if not self.is_connected():
             raise CouplingError("coupling graph not connected")
-        lengths = nx.all_pairs_shortest_path_length(self.graph.to_undirected(as_view=True))
-        lengths = dict(lengths)
-        size = len(lengths)
-        cmap = np.zeros((size, size))
-        for idx in range(size):
-            cmap[idx, np.fromiter(lengths[idx].keys(), dtype=int)] = np.fromiter(
-                lengths[idx].values(), dtype=int)
-        self._dist_matrix = cmap
+        tables = self._get_path_tables()
+        if tables['dist_matrix'] is None:
+            tables['dist_matrix'] = tables['dist'].astype(float)
+        self._dist_matrix = tables['dist_matrix']
+
+    def _get_path_tables(self):
+        """Return the distance table of the undirected graph.
+
+        The table is indexed by physical qubit. ``dist[i, j]`` is the
+        distance from i to j, or -1 if j cannot be reached from i. It is
+        computed with a breadth-first search from every qubit over the
+        sparse adjacency matrix, and memoized by graph.
+
+        Returns:
+            dict: the 'dist' table, and the float 'dist_matrix' once it is
+                computed.
+        """
+        if self._path_tables is None:
+            key = (tuple(self.physical_qubits),
+                   tuple(sorted({(min(edge), max(edge)) for edge in self.graph.edges()})))
+            tables = _PATH_TABLES.pop(key, None)
+            if tables is None:
+                tables = _compute_path_tables(key[0][-1] + 1 if key[0] else 0, key[1])
+            _PATH_TABLES[key] = tables
+            while len(_PATH_TABLES) > _PATH_TABLES_SIZE:
+                _PATH_TABLES.popitem(last=False)
+            self._path_tables = tables
+        return self._path_tables
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
@@ -161,9 +200,9 @@ class CouplingMap:
         Raises:
             CouplingError: if the qubits do not exist in the CouplingMap
         """
-        if physical_qubit1 not in self.physical_qubits:
+        if physical_qubit1 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit1,))
-        if physical_qubit2 not in self.physical_qubits:
+        if physical_qubit2 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit2,))
         if self._dist_matrix is None:
             self._compute_distance_matrix()
@@ -179,12 +218,23 @@ class CouplingMap:
         Raises:
             CouplingError: When there is no path between physical_qubit1, physical_qubit2.
         """
-        try:
-            return nx.shortest_path(self.graph.to_undirected(as_view=True), source=physical_qubit1,
-                                    target=physical_qubit2)
-        except nx.exception.NetworkXNoPath:
-            raise CouplingError(
-                "Nodes %s and %s are not connected" % (str(physical_qubit1), str(physical_qubit2)))
+        for physical_qubit in (physical_qubit1, physical_qubit2):
+            if physical_qubit not in self.graph:
+                raise CouplingError("%s not in coupling graph" % (physical_qubit,))
+        # The paths are those of networkx, which breaks ties between paths of
+        # the same length by the order of the edges, so they are memoized by
+        # map rather than derived from the tables shared between maps
+        path = self._paths.get((physical_qubit1, physical_qubit2))
+        if path is None:
+            try:
+                path = nx.shortest_path(self.graph.to_undirected(as_view=True),
+                                        source=physical_qubit1, target=physical_qubit2)
+            except nx.exception.NetworkXNoPath:
+                raise CouplingError(
+                    "Nodes %s and %s are not connected" % (str(physical_qubit1),
+                                                           str(physical_qubit2)))
+            self._paths[(physical_qubit1, physical_qubit2)] = path
+        return list(path)
 
     def reduce(self, mapping):
         """Returns a reduced coupling map that
@@ -233,3 +283,26 @@ class CouplingMap:
             string += ", ".join(["[%s, %s]" % (src, dst) for (src, dst) in self.get_edges()])
             string += "]"
         return string
+
+
+def _compute_path_tables(num_qubits, edges):
+    """Compute the distance table of an undirected graph.
+
+    Args:
+        num_qubits (int): the number of rows and columns of the table.
+        edges (tuple): the (source, target) pairs of the undirected edges.
+
+    Returns:
+        dict: the 'dist' table of _get_path_tables.
+    """
+    rows = np.array([edge[0] for edge in edges], dtype=int)
+    cols = np.array([edge[1] for edge in edges], dtype=int)
+    adjacency = sp.coo_matrix((np.ones(len(edges)), (rows, cols)),
+                              shape=(num_qubits, num_qubits)).tocsr()
+    # With unweighted=True, each search from a qubit is a breadth-first search
+    dist = cs.shortest_path(adjacency, directed=False, unweighted=True)
+    dist_dtype = np.int16 if num_qubits < np.iinfo(np.int16).max else np.int32
+    dist_table = np.where(np.isfinite(dist), dist, -1).astype(dist_dtype)
+    # The table is shared by every CouplingMap of this graph
+    dist_table.flags.writeable = False
+    return {'dist': dist_table, 'dist_matrix': None}
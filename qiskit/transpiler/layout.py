@@ -18,8 +18,13 @@ A two-ways dict to represent a layout.
 Layout is the relation between virtual (qu)bits and physical (qu)bits.
 Virtual (qu)bits are tuples, e.g. `(QuantumRegister(3, 'qr'), 2)` or simply `qr[2]`.
 Physical (qu)bits are integers.
+
+IntLayout is a layout of virtual qubits numbered by their index in a list of
+qubits, e.g. `dag.qubits()`, held in two int arrays for the mapping passes.
 """
 
+from array import array
+
 from qiskit.circuit.register import Register
 from qiskit.transpiler.exceptions import LayoutError
 
@@ -309,3 +314,157 @@ class Layout():
                 raise LayoutError("The list should contain elements of the form"
                                   " (Register, integer) or None")
         return out
+
+
+class IntLayout():
+    """Layout of virtual qubits 0..n-1 on physical qubits 0..m-1, held in two int arrays.
+
+    A physical qubit without a virtual qubit maps to -1.
+    """
+
+    def __init__(self, virtual_to_physical, num_physical=None):
+        """construct an IntLayout from the physical qubit of each virtual qubit
+
+        Args:
+            virtual_to_physical (list[int]): the physical qubit of each virtual qubit.
+            num_physical (int): the number of physical qubits. If None, one more
+                than the largest physical qubit.
+
+        Raises:
+            LayoutError: if a physical qubit is out of range or repeated.
+        """
+        self._v2p = array('i', virtual_to_physical)
+        if num_physical is None:
+            num_physical = max(self._v2p) + 1 if self._v2p else 0
+        self._p2v = array('i', [-1]) * num_physical
+        for virtual, physical in enumerate(self._v2p):
+            if not 0 <= physical < num_physical or self._p2v[physical] != -1:
+                raise LayoutError('Physical qubit %s is out of range or repeated.' % physical)
+            self._p2v[physical] = virtual
+
+    def __repr__(self):
+        """Representation of an IntLayout"""
+        return "IntLayout(%s, %s)" % (self._v2p.tolist(), len(self._p2v))
+
+    def __len__(self):
+        return len(self._v2p)
+
+    def __eq__(self, other):
+        return isinstance(other, IntLayout) and self._v2p == other._v2p and \
+            self._p2v == other._p2v
+
+    def copy(self):
+        """Returns a copy of an IntLayout instance."""
+        layout_copy = IntLayout.__new__(IntLayout)
+        layout_copy._v2p = array('i', self._v2p)
+        layout_copy._p2v = array('i', self._p2v)
+        return layout_copy
+
+    def get_virtual_bits(self):
+        """
+        Returns the array of the physical qubit of each virtual qubit. The
+        array is updated in place by swap().
+        """
+        return self._v2p
+
+    def get_physical_bits(self):
+        """
+        Returns the array of the virtual qubit of each physical qubit, or -1.
+        The array is updated in place by swap().
+        """
+        return self._p2v
+
+    def swap(self, left, right):
+        """Swaps the virtual qubits of two physical qubits.
+        Args:
+            left (int): Physical qubit to swap with right.
+            right (int): Physical qubit to swap with left.
+        """
+        p2v = self._p2v
+        virtual_left, virtual_right = p2v[left], p2v[right]
+        p2v[left], p2v[right] = virtual_right, virtual_left
+        if virtual_left != -1:
+            self._v2p[virtual_left] = right
+        if virtual_right != -1:
+            self._v2p[virtual_right] = left
+
+    def combine_into_edge_map(self, another_layout):
+        """Combines self and another_layout into an "edge map" of virtual qubits.
+
+        Each virtual qubit of self maps to the virtual qubit of another_layout
+        on the same physical qubit, as in Layout.combine_into_edge_map().
+
+        Args:
+            another_layout (IntLayout): The other layout to combine.
+        Returns:
+            list[int]: The virtual qubit of another_layout for each virtual qubit.
+        Raises:
+            LayoutError: another_layout can be bigger than self, but not smaller. Otherwise, raises.
+        """
+        p2v = another_layout._p2v
+        if len(p2v) < len(self._p2v) or any(p2v[physical] == -1 for physical in self._v2p):
+            raise LayoutError('The combine_into_edge_map() method does not support when the'
+                              ' other layout (another_layout) is smaller.')
+        return [p2v[physical] for physical in self._v2p]
+
+    @staticmethod
+    def from_layout(layout, qubits, num_physical=None):
+        """Converts a Layout to an IntLayout.
+
+        Args:
+            layout (Layout): The layout to convert.
+            qubits (list): The virtual qubits, numbered by their index.
+            num_physical (int): the number of physical qubits, as in IntLayout().
+        Returns:
+            IntLayout: The corresponding IntLayout object.
+        Raises:
+            LayoutError: If a qubit is not in the layout.
+        """
+        v2p = layout.get_virtual_bits()
+        try:
+            return IntLayout([v2p[qubit] for qubit in qubits], num_physical)
+        except KeyError as error:
+            raise LayoutError('The qubit %s is not in the layout.' % (error.args[0],))
+
+    def to_layout(self, qubits):
+        """Converts an IntLayout to a Layout.
+
+        Args:
+            qubits (list): The virtual qubits, numbered by their index.
+        Returns:
+            Layout: The corresponding Layout object.
+        """
+        layout = Layout()
+        layout._v2p = dict(zip(qubits, self._v2p))
+        layout._p2v = dict(zip(self._v2p, qubits))
+        return layout
+
+    @staticmethod
+    def from_nlayout(nlayout):
+        """Converts a numeric NLayout of the StochasticSwap mapper to an IntLayout.
+
+        Args:
+            nlayout (NLayout): The layout to convert.
+        Returns:
+            IntLayout: The corresponding IntLayout object.
+        """
+        layout = IntLayout.__new__(IntLayout)
+        layout._v2p = array('i', nlayout.logic_to_phys.tobytes())
+        layout._p2v = array('i', nlayout.phys_to_logic.tobytes())
+        return layout
+
+    def to_nlayout(self):
+        """Converts an IntLayout to a numeric NLayout of the StochasticSwap mapper.
+
+        Returns:
+            NLayout: The corresponding NLayout object.
+        Raises:
+            LayoutError: If a physical qubit has no virtual qubit.
+        """
+        # pylint: disable=cyclic-import, no-name-in-module, import-error
+        from qiskit.transpiler.passes.mapping.cython.stochastic_swap.utils import \
+            nlayout_from_arrays
+
+        if len(self._v2p) != len(self._p2v):
+            raise LayoutError('NLayout requires a virtual qubit on every physical qubit.')
+        return nlayout_from_arrays(self._v2p, self._p2v)
@@ -49,3 +49,7 @@ from .mapping.lookahead_swap import LookaheadSwap
 from .remove_diagonal_gates_before_measure import RemoveDiagonalGatesBeforeMeasure
 from .mapping.stochastic_swap import StochasticSwap
 from .mapping.legacy_swap import LegacySwap
+from .mapping.sabre_swap import SabreSwap
+from .mapping.sabre_layout import SabreLayout
+from .mapping.vf2_layout import VF2Layout
+from .mapping.apply_layout import ApplyLayout
@@ -38,7 +38,7 @@ class ConsolidateBlocks(TransformationPass):
         """iterate over each block and replace it with an equivalent Unitary
         on the same wires.
         """
-        new_dag = DAGCircuit()
+        new_dag = DAGCircuit(storage=dag.storage)
         for qreg in dag.qregs.values():
             new_dag.add_qreg(qreg)
         for creg in dag.cregs.values():
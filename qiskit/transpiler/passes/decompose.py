@@ -39,6 +39,7 @@ class Decompose(TransformationPass):
         Returns:
             DAGCircuit: output dag where gate was expanded.
         """
+        substitutions = {}
         # Walk through the DAG and expand each non-basis node
         for node in dag.op_nodes(self.gate):
             # opaque or built-in gates are not decomposable
@@ -54,5 +55,6 @@ class Decompose(TransformationPass):
                 decomposition.add_creg(rule[0][2][0][0])
             for inst in rule:
                 decomposition.apply_operation_back(*inst)
-            dag.substitute_node_with_dag(node, decomposition)
+            substitutions[node] = decomposition
+        dag.substitute_nodes(substitutions)
         return dag
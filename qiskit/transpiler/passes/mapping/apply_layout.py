@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Rewrites a circuit onto the physical qubits of property_set['layout'].
+
+The circuit is expected to fit its layout already, for example under a layout
+found by VF2Layout, so no SWAPs are needed and the routing can be skipped. As
+the routing passes do, the output has a single quantum register 'q' of the
+physical qubits.
+"""
+
+from qiskit import QuantumRegister
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.exceptions import TranspilerError
+
+
+class ApplyLayout(TransformationPass):
+    """
+    Maps each virtual qubit of a DAGCircuit onto its physical qubit in the layout.
+    """
+
+    def run(self, dag):
+        """
+        Runs the ApplyLayout pass on `dag`.
+
+        Args:
+            dag (DAGCircuit): DAG to map.
+
+        Returns:
+            DAGCircuit: A DAG on the physical qubits.
+
+        Raises:
+            TranspilerError: if there is no layout in the property set, or it
+            does not match the qubits of the DAG
+        """
+        layout = self.property_set['layout']
+        if layout is None:
+            raise TranspilerError('ApplyLayout requires property_set["layout"] to run')
+
+        if len(dag.qubits()) != len(layout):
+            raise TranspilerError('The layout does not match the amount of qubits in the DAG')
+
+        new_dag = DAGCircuit(storage=dag.storage)
+        new_dag.name = dag.name
+        for creg in dag.cregs.values():
+            new_dag.add_creg(creg)
+        device_qreg = QuantumRegister(len(layout), 'q')
+        new_dag.add_qreg(device_qreg)
+
+        for node in dag.topological_op_nodes():
+            new_dag.apply_operation_back(node.op, [(device_qreg, layout[qubit])
+                                                   for qubit in node.qargs],
+                                         node.cargs, node.condition)
+        return new_dag
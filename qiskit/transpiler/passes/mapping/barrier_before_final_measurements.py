@@ -33,20 +33,17 @@ class BarrierBeforeFinalMeasurements(TransformationPass):
         """Return a circuit with a barrier before last measurements."""
 
         # Collect DAG nodes which are followed only by barriers or other measures.
+        # Walking the circuit backwards, a node is final if it is a measure or
+        # barrier and all of its successors are final.
         final_op_types = ['measure', 'barrier']
-        final_ops = []
-        for candidate_node in dag.named_nodes(*final_op_types):
-            is_final_op = True
-
-            for _, child_successors in dag.bfs_successors(candidate_node):
-
-                if any(suc.type == 'op' and suc.name not in final_op_types
-                       for suc in child_successors):
-                    is_final_op = False
-                    break
-
-            if is_final_op:
-                final_ops.append(candidate_node)
+        final_nodes = set()
+        for node in reversed(list(dag.topological_op_nodes())):
+            if node.name not in final_op_types:
+                continue
+            if all(suc.type != 'op' or suc in final_nodes for suc in dag.successors(node)):
+                final_nodes.add(node)
+        final_ops = [node for node in dag.named_nodes(*final_op_types)
+                     if node in final_nodes]
 
         if not final_ops:
             return dag
@@ -65,7 +62,7 @@ class BarrierBeforeFinalMeasurements(TransformationPass):
 
         # Preserve order of final ops collected earlier from the original DAG.
         ordered_final_nodes = [node for node in dag.topological_op_nodes()
-                               if node in set(final_ops)]
+                               if node in final_nodes]
 
         # Move final ops to the new layer and append the new layer to the DAG.
         for final_node in ordered_final_nodes:
@@ -23,7 +23,7 @@ compatible.
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
-from qiskit.transpiler import Layout
+from qiskit.transpiler import Layout, IntLayout
 from qiskit.extensions.standard import SwapGate
 
 
@@ -58,7 +58,7 @@ class BasicSwap(TransformationPass):
             TranspilerError: if the coupling map or the layout are not
             compatible with the DAG
         """
-        new_dag = DAGCircuit()
+        new_dag = DAGCircuit(storage=dag.storage)
 
         if self.initial_layout is None:
             if self.property_set["layout"]:
@@ -73,30 +73,36 @@ class BasicSwap(TransformationPass):
             raise TranspilerError(
                 "Mappers require to have the layout to be the same size as the coupling map")
 
-        current_layout = self.initial_layout.copy()
+        # Virtual qubits are numbered in the order of dag.qubits()
+        qubits = dag.qubits()
+        qubit_indices = {qubit: index for index, qubit in enumerate(qubits)}
+        initial_layout = IntLayout.from_layout(self.initial_layout, qubits)
+        current_layout = initial_layout.copy()
+        current_v2p = current_layout.get_virtual_bits()
+        current_p2v = current_layout.get_physical_bits()
+        edge_map = {qubit: qubit for qubit in qubits}
 
         for layer in dag.serial_layers():
             subdag = layer['graph']
 
             for gate in subdag.twoQ_gates():
-                physical_q0 = current_layout[gate.qargs[0]]
-                physical_q1 = current_layout[gate.qargs[1]]
+                physical_q0 = current_v2p[qubit_indices[gate.qargs[0]]]
+                physical_q1 = current_v2p[qubit_indices[gate.qargs[1]]]
                 if self.coupling_map.distance(physical_q0, physical_q1) != 1:
                     # Insert a new layer with the SWAP(s).
                     swap_layer = DAGCircuit()
 
+                    # create qregs
+                    for qreg in dag.qregs.values():
+                        swap_layer.add_qreg(qreg)
+
                     path = self.coupling_map.shortest_undirected_path(physical_q0, physical_q1)
                     for swap in range(len(path) - 2):
                         connected_wire_1 = path[swap]
                         connected_wire_2 = path[swap + 1]
 
-                        qubit_1 = current_layout[connected_wire_1]
-                        qubit_2 = current_layout[connected_wire_2]
-
-                        # create qregs
-                        for qreg in current_layout.get_registers():
-                            if qreg not in swap_layer.qregs.values():
-                                swap_layer.add_qreg(qreg)
+                        qubit_1 = qubits[current_p2v[connected_wire_1]]
+                        qubit_2 = qubits[current_p2v[connected_wire_2]]
 
                         # create the swap operation
                         swap_layer.apply_operation_back(SwapGate(),
@@ -104,14 +110,16 @@ class BasicSwap(TransformationPass):
                                                         cargs=[])
 
                     # layer insertion
-                    edge_map = current_layout.combine_into_edge_map(self.initial_layout)
                     new_dag.compose_back(swap_layer, edge_map)
 
-                    # update current_layout
+                    # update current_layout, and the edge map only when it changes
                     for swap in range(len(path) - 2):
                         current_layout.swap(path[swap], path[swap + 1])
+                    edge_map = {qubits[virtual]: qubits[initial_virtual]
+                                for virtual, initial_virtual in
+                                enumerate(current_layout.combine_into_edge_map(initial_layout))}
 
-            edge_map = current_layout.combine_into_edge_map(self.initial_layout)
-            new_dag.extend_back(subdag, edge_map)
+            # extend_back adds the clbits to the edge map it is given
+            new_dag.extend_back(subdag, dict(edge_map))
 
         return new_dag
@@ -55,18 +55,22 @@ class CXDirection(TransformationPass):
         Args:
             dag (DAGCircuit): DAG to map.
         Returns:
-            DAGCircuit: The rearranged dag for the coupling map
+            DAGCircuit: The rearranged dag for the coupling map, or the input
+                dag if no cx node had to be flipped.
 
         Raises:
             TranspilerError: If the circuit cannot be mapped just by flipping the
                 cx nodes.
         """
-        new_dag = DAGCircuit()
-
         if self.layout is None:
             # LegacySwap renames the register in the DAG and does not match the property set
             self.layout = Layout.generate_trivial_layout(*dag.qregs.values())
 
+        if not any(self._needs_flip(cnot_node) for cnot_node in dag.named_nodes('cx', 'CX')):
+            return dag
+
+        new_dag = DAGCircuit(storage=dag.storage)
+
         for layer in dag.serial_layers():
             subdag = layer['graph']
 
@@ -74,13 +78,7 @@ class CXDirection(TransformationPass):
                 control = cnot_node.qargs[0]
                 target = cnot_node.qargs[1]
 
-                physical_q0 = self.layout[control]
-                physical_q1 = self.layout[target]
-                if self.coupling_map.distance(physical_q0, physical_q1) != 1:
-                    raise TranspilerError('The circuit requires a connection between physical '
-                                          'qubits %s and %s' % (physical_q0, physical_q1))
-
-                if (physical_q0, physical_q1) not in self.coupling_map.get_edges():
+                if self._needs_flip(cnot_node):
                     # A flip needs to be done
 
                     # Create the involved registers
@@ -101,3 +99,22 @@ class CXDirection(TransformationPass):
             new_dag.extend_back(subdag)
 
         return new_dag
+
+    def _needs_flip(self, cnot_node):
+        """Return whether a cx node is against the direction of the coupling map.
+
+        Args:
+            cnot_node (DAGNode): the cx node.
+
+        Returns:
+            bool: True if the cx must be flipped to match the coupling map.
+
+        Raises:
+            TranspilerError: If its qubits are not connected in the coupling map.
+        """
+        physical_q0 = self.layout[cnot_node.qargs[0]]
+        physical_q1 = self.layout[cnot_node.qargs[1]]
+        if self.coupling_map.distance(physical_q0, physical_q1) != 1:
+            raise TranspilerError('The circuit requires a connection between physical '
+                                  'qubits %s and %s' % (physical_q0, physical_q1))
+        return not self.coupling_map.graph.has_edge(physical_q0, physical_q1)
@@ -16,19 +16,23 @@
 # that they have been altered from the originals.
 
 cimport cython
-from libcpp.set cimport set as cset
+from cython.parallel cimport prange
+from libc.stdlib cimport calloc, malloc, realloc, free
+from libc.string cimport memcpy
+import numpy as np
 from .utils cimport NLayout, EdgeCollection
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef double compute_cost(double[:, ::1] dist, unsigned int * logic_to_phys,
-                          int[::1] gates, unsigned int num_gates) nogil:
+
+cdef inline double compute_cost(double * dist, unsigned int num_qubits,
+                                unsigned int * logic_to_phys,
+                                int * gates, unsigned int num_gates) nogil:
     """ Computes the cost (distance) of a logical to physical mapping.
     
     Args:
-        dist (ndarray): An array of doubles that specifies the distance.
+        dist (double *): Row-major num_qubits x num_qubits distance array.
+        num_qubits (int): Number of physical qubits.
         logic_to_phys (int *): Pointer to logical to physical array.
-        gates (ndarray): Array of ints giving gates in layer.
+        gates (int *): Array of ints giving gates in layer.
         num_gates (int): The number of gates (length of gates//2).
     
     Returns:
@@ -39,145 +43,133 @@ cdef double compute_cost(double[:, ::1] dist, unsigned int * logic_to_phys,
     for kk in range(num_gates):
         ii = logic_to_phys[gates[2*kk]]
         jj = logic_to_phys[gates[2*kk+1]]
-        cost += dist[ii,jj]
+        cost += dist[ii*num_qubits+jj]
     return cost
 
-@cython.nonecheck(False)
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cdef compute_random_scaling(double[:, ::1] scale, double[:, ::1] cdist2,
-                            double * rand, unsigned int num_qubits):
+
+cdef void compute_random_scaling(double * scale, double * cdist2,
+                                 double * rand, unsigned int num_qubits) nogil:
     """ Computes the symmetric random scaling (perturbation) matrix, 
     and places the values in the 'scale' array.
 
     Args:
-        scale (ndarray): An array of doubles where the values are to be stored.
-        cdist2 (ndarray): Array representing the coupling map distance squared.
+        scale (double *): Row-major array where the values are to be stored.
+        cdist2 (double *): Array representing the coupling map distance squared.
         rand (double *): Array of rands of length num_qubits*(num_qubits+1)//2.
         num_qubits (int): Number of physical qubits.
     """
     cdef size_t ii, jj, idx=0
     for ii in range(num_qubits):
         for jj in range(ii):
-            scale[ii,jj] = rand[idx]*cdist2[ii,jj]
-            scale[jj,ii] = scale[ii,jj]
+            scale[ii*num_qubits+jj] = rand[idx]*cdist2[ii*num_qubits+jj]
+            scale[jj*num_qubits+ii] = scale[ii*num_qubits+jj]
             idx += 1
 
 
-@cython.nonecheck(False)
+cdef inline void swap(unsigned int * logic_to_phys, unsigned int * phys_to_logic,
+                      unsigned int idx1, unsigned int idx2) nogil:
+    """ Swaps two physical qubits of a layout given by its two arrays.
+    """
+    cdef unsigned int temp = phys_to_logic[idx1]
+    phys_to_logic[idx1] = phys_to_logic[idx2]
+    phys_to_logic[idx2] = temp
+    logic_to_phys[phys_to_logic[idx1]] = idx1
+    logic_to_phys[phys_to_logic[idx2]] = idx2
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
-               int[::1] gates, double[:, ::1] cdist2, double[:, ::1] cdist, 
-               int[::1] edges, double[:, ::1] scale, object rng):
-    """ A single iteration of the tchastic swap mapping routine.
+cdef void run_trial(unsigned int trial, unsigned int num_qubits,
+                    unsigned int num_logical, int * qubit_subset,
+                    unsigned int subset_size, int * gates, unsigned int num_gates,
+                    double * cdist2, double * cdist, int * edges,
+                    unsigned int num_edges, double * rand,
+                    unsigned int * logic_to_phys, unsigned int * phys_to_logic,
+                    unsigned int ** opt_edges, unsigned int * num_opt_edges,
+                    double * dists, unsigned int * depths,
+                    int * depth_one) nogil:
+    """ A single iteration of the stochastic swap mapping routine.
 
-    Args:
-        num_qubits (int): The number of physical qubits.
-        int_layout (NLayout): The numeric (integer) representation of 
-                              the initial_layout.
-        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
-        gates (ndarray): Int array with integers giving qubits on which
-                         two-qubits gates act on.
-        cdist2 (ndarray): Array of doubles that gives the square of the 
-                          distance graph.
-        cdist (ndarray): Array of doubles that gives the distance graph.
-        edges (ndarray): Int array of edges in coupling map.
-        scale (ndarray): A double array that holds the perturbed cdist2 array.
-        rng (RandomState): An instance of the NumPy RandomState.
-
-    Returns:
-        double: Best distance achieved in this trial.
-        EdgeCollection: Collection of optimal edges found.
-        NLayout: The optimal layout found.
-        int: The number of depth steps required in mapping.
+    The layout arrays hold the initial layout on entry and the layout found
+    on exit. Trials after one that reached depth 1 are skipped, leaving their
+    depth at 0, as they cannot be chosen over it.
     """
-    cdef EdgeCollection opt_edges = EdgeCollection()
-    cdef NLayout optimal_layout, new_layout, trial_layout = int_layout.copy()
-    
-    cdef unsigned int num_gates = gates.shape[0]//2
-    cdef unsigned int num_edges = edges.shape[0]//2
-    
-    cdef unsigned int need_copy, cost_reduced
     cdef unsigned int depth_step = 1
     cdef unsigned int depth_max = 2 * num_qubits + 1
-    cdef double min_cost, new_cost, dist
-    
+    cdef unsigned int num_available, capacity = 0, size = 0
     cdef unsigned int start_edge, end_edge, start_qubit, end_qubit
-    cdef unsigned int optimal_start, optimal_end, optimal_start_qubit, optimal_end_qubit
-    
+    cdef unsigned int optimal_start = 0, optimal_end = 0
+    cdef int cost_reduced
+    cdef double min_cost, new_cost, dist
     cdef size_t idx
-    
+    cdef double * scale
+    cdef char * available
+    cdef unsigned int * buffer = NULL
+
+    for idx in range(trial):
+        if depth_one[idx]:
+            return
+
     # Compute randomized distance
-    cdef double[::1] rand = 1.0 + rng.normal(0.0, 1.0/num_qubits,
-                                             size=num_qubits*(num_qubits+1)//2)
-    
-    compute_random_scaling(scale, cdist2, &rand[0], num_qubits)
-    
-    # Convert int qubit array to c++ set
-    cdef cset[unsigned int] qubit_set
-    cdef cset[unsigned int] input_qubit_set
-    
-    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
-        input_qubit_set.insert(int_qubit_subset[idx])
-    
+    scale = <double *>calloc(num_qubits * num_qubits, sizeof(double))
+    available = <char *>malloc(num_logical * sizeof(char))
+    compute_random_scaling(scale, cdist2, rand, num_qubits)
+
     # Loop over depths from 1 up to a maximum depth
     while depth_step < depth_max:
-        qubit_set = input_qubit_set
+        for idx in range(num_logical):
+            available[idx] = 0
+        for idx in range(subset_size):
+            available[qubit_subset[idx]] = 1
+        num_available = subset_size
         # While there are still qubits available
-        while not qubit_set.empty():
+        while num_available:
             # Compute the objective function
-            min_cost = compute_cost(scale, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+            min_cost = compute_cost(scale, num_qubits, logic_to_phys,
+                                    gates, num_gates)
             # Try to decrease objective function
             cost_reduced = 0
 
             # Loop over edges of coupling graph
-            need_copy = 1
             for idx in range(num_edges):
                 start_edge = edges[2*idx]
                 end_edge = edges[2*idx+1]
-                start_qubit = trial_layout.phys_to_logic[start_edge]
-                end_qubit =  trial_layout.phys_to_logic[end_edge]
+                start_qubit = phys_to_logic[start_edge]
+                end_qubit = phys_to_logic[end_edge]
                 # Are the qubits available?
-                if  qubit_set.count(start_qubit) and qubit_set.count(end_qubit):
+                if available[start_qubit] and available[end_qubit]:
                     # Try this edge to reduce the cost
-                    if need_copy:
-                        new_layout = trial_layout.copy()
-                        need_copy = 0
-                    new_layout.swap(start_edge, end_edge)
-                    # Compute the objective function
-                    new_cost = compute_cost(scale, new_layout.logic_to_phys,
-                                   gates, num_gates)
+                    swap(logic_to_phys, phys_to_logic, start_edge, end_edge)
+                    new_cost = compute_cost(scale, num_qubits, logic_to_phys,
+                                            gates, num_gates)
+                    swap(logic_to_phys, phys_to_logic, start_edge, end_edge)
                     # Record progress if we succceed
                     if new_cost < min_cost:
-                        cost_reduced = True
+                        cost_reduced = 1
                         min_cost = new_cost
-                        optimal_layout = new_layout
                         optimal_start = start_edge
                         optimal_end = end_edge
-                        optimal_start_qubit = start_qubit
-                        optimal_end_qubit = end_qubit
-                        need_copy = 1
-                    else:
-                        new_layout.swap(start_edge, end_edge)
 
             # After going over all edges
             # Were there any good swap choices?
-            if cost_reduced:
-                qubit_set.erase(optimal_start_qubit)
-                qubit_set.erase(optimal_end_qubit)
-                trial_layout = optimal_layout
-                opt_edges.add(optimal_start, optimal_end)
-            else:
+            if not cost_reduced:
                 break
+            available[phys_to_logic[optimal_start]] = 0
+            available[phys_to_logic[optimal_end]] = 0
+            num_available -= 2
+            swap(logic_to_phys, phys_to_logic, optimal_start, optimal_end)
+            if size == capacity:
+                capacity = 2 * capacity + 2 * num_qubits
+                buffer = <unsigned int *>realloc(buffer, capacity * sizeof(unsigned int))
+            buffer[size] = optimal_start
+            buffer[size+1] = optimal_end
+            size += 2
 
         # We have either run out of swap pairs to try or
         # failed to improve the cost.
 
         # Compute the coupling graph distance
-        dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+        dist = compute_cost(cdist, num_qubits, logic_to_phys, gates, num_gates)
         # If all gates can be applied now, we are finished.
         # Otherwise we need to consider a deeper swap circuit
         if dist == num_gates:
@@ -187,7 +179,112 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         depth_step += 1
 
     # Either we have succeeded at some depth d < dmax or failed
-    dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
-    
-    return dist, opt_edges, trial_layout, depth_step
+    dists[trial] = compute_cost(cdist, num_qubits, logic_to_phys, gates, num_gates)
+    depths[trial] = depth_step
+    opt_edges[trial] = buffer
+    num_opt_edges[trial] = size
+    if dists[trial] == num_gates and depth_step == 1:
+        depth_one[trial] = 1
+    free(available)
+    free(scale)
+
+
+@cython.nonecheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def swap_trials(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
+                int[::1] gates, double[:, ::1] cdist2, double[:, ::1] cdist,
+                int[::1] edges, double[:, ::1] rands, int num_threads=1):
+    """ Runs iterations of the stochastic swap mapping routine in parallel.
+
+    Each trial perturbs the distance matrix with its own row of ``rands``,
+    so the result only depends on the random numbers and not on the number
+    of threads. The trials run without the GIL.
+
+    Args:
+        num_qubits (int): The number of physical qubits.
+        int_layout (NLayout): The numeric (integer) representation of 
+                              the initial_layout.
+        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
+        gates (ndarray): Int array with integers giving qubits on which
+                         two-qubits gates act on.
+        cdist2 (ndarray): Array of doubles that gives the square of the 
+                          distance graph.
+        cdist (ndarray): Array of doubles that gives the distance graph.
+        edges (ndarray): Int array of edges in coupling map.
+        rands (ndarray): A (trials, num_qubits*(num_qubits+1)//2) array of
+                         the random scaling factors of each trial.
+        num_threads (int): The number of threads to run the trials on.
+
+    Returns:
+        int: Index of the best trial, the first one with the smallest depth
+             among those that succeeded, or -1 if they all failed.
+        double: Best distance achieved in this trial.
+        EdgeCollection: Collection of optimal edges found.
+        NLayout: The optimal layout found.
+        int: The number of depth steps required in mapping.
+    """
+    cdef unsigned int num_trials = rands.shape[0]
+    cdef unsigned int num_gates = gates.shape[0]//2
+    cdef unsigned int num_edges = edges.shape[0]//2
+    cdef unsigned int subset_size = int_qubit_subset.shape[0]
+    cdef unsigned int num_logical = int_layout.l2p_len
+    cdef unsigned int num_physical = int_layout.p2l_len
+    cdef int trial, best = -1
+    cdef size_t idx
+    cdef int * subset_ptr = &int_qubit_subset[0] if subset_size else NULL
+    cdef int * gates_ptr = &gates[0] if num_gates else NULL
+    cdef int * edges_ptr = &edges[0] if num_edges else NULL
+
+    cdef unsigned int[:, ::1] logic_to_phys = np.empty((num_trials, num_logical),
+                                                       dtype=np.uint32)
+    cdef unsigned int[:, ::1] phys_to_logic = np.empty((num_trials, num_physical),
+                                                       dtype=np.uint32)
+    cdef double[::1] dists = np.zeros(num_trials)
+    cdef unsigned int[::1] depths = np.zeros(num_trials, dtype=np.uint32)
+    cdef unsigned int[::1] num_opt_edges = np.zeros(num_trials, dtype=np.uint32)
+    cdef int[::1] depth_one = np.zeros(num_trials, dtype=np.int32)
+    cdef unsigned int ** opt_edges = <unsigned int **>calloc(num_trials,
+                                                            sizeof(unsigned int *))
+    cdef EdgeCollection best_edges = EdgeCollection()
+    cdef NLayout best_layout = NLayout(num_logical, num_physical)
+
+    for trial in range(num_trials):
+        memcpy(&logic_to_phys[trial, 0], int_layout.logic_to_phys,
+               num_logical * sizeof(unsigned int))
+        memcpy(&phys_to_logic[trial, 0], int_layout.phys_to_logic,
+               num_physical * sizeof(unsigned int))
+
+    for trial in prange(num_trials, nogil=True, num_threads=num_threads,
+                        schedule='static', chunksize=1):
+        run_trial(trial, num_qubits, num_logical, subset_ptr, subset_size,
+                  gates_ptr, num_gates, &cdist2[0, 0], &cdist[0, 0],
+                  edges_ptr, num_edges, &rands[trial, 0],
+                  &logic_to_phys[trial, 0], &phys_to_logic[trial, 0],
+                  opt_edges, &num_opt_edges[0], &dists[0], &depths[0],
+                  &depth_one[0])
+
+    # Pick the trial the sequential algorithm would: the first one with the
+    # smallest depth, stopping at the first of depth 1.
+    for trial in range(num_trials):
+        if depths[trial] and dists[trial] == num_gates and \
+                (best == -1 or depths[trial] < depths[best]):
+            best = trial
+            if depths[best] == 1:
+                break
+
+    if best != -1:
+        for idx in range(num_opt_edges[best] // 2):
+            best_edges.add(opt_edges[best][2*idx], opt_edges[best][2*idx+1])
+        memcpy(best_layout.logic_to_phys, &logic_to_phys[best, 0],
+               num_logical * sizeof(unsigned int))
+        memcpy(best_layout.phys_to_logic, &phys_to_logic[best, 0],
+               num_physical * sizeof(unsigned int))
+
+    for trial in range(num_trials):
+        free(opt_edges[trial])
+    free(opt_edges)
+
+    if best == -1:
+        return -1, None, None, None, None
+    return best, dists[best], best_edges, best_layout, depths[best]
@@ -34,6 +34,8 @@ cpdef NLayout nlayout_from_layout(object layout,
                                   object dag, 
                                   unsigned int physical_qubits)
 
+cpdef NLayout nlayout_from_arrays(int[::1] logic_to_phys, int[::1] phys_to_logic)
+
 
 # Edge collection -------------------------------------------------------------
 cdef class EdgeCollection:
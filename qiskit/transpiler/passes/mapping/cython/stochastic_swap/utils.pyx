@@ -193,3 +193,22 @@ cpdef NLayout nlayout_from_layout(object layout, object qregs,
         else:
             out.phys_to_logic[key] = reg_idx[regint[val[0]]]+val[1]
     return out
+
+
+@cython.boundscheck(False)
+cpdef NLayout nlayout_from_arrays(int[::1] logic_to_phys, int[::1] phys_to_logic):
+    """ Converts the int arrays of an IntLayout to numerical NLayout.
+
+    Args:
+        logic_to_phys (array): The physical qubit of each logical qubit.
+        phys_to_logic (array): The logical qubit of each physical qubit.
+    Returns:
+        NLayout: The corresponding numerical layout.
+    """
+    cdef NLayout out = NLayout(logic_to_phys.shape[0], phys_to_logic.shape[0])
+    cdef size_t kk
+    for kk in range(<unsigned int>out.l2p_len):
+        out.logic_to_phys[kk] = logic_to_phys[kk]
+    for kk in range(<unsigned int>out.p2l_len):
+        out.phys_to_logic[kk] = phys_to_logic[kk]
+    return out
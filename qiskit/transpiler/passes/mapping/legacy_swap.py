@@ -69,7 +69,7 @@ class LegacySwap(TransformationPass):
             raise TranspilerError("Not enough qubits in CouplingGraph")
 
         # Schedule the input circuit
-        layerlist = list(dag.layers())
+        layerlist = list(dag.layer_views())
 
         if self.initial_layout is None and self.property_set["layout"]:
             self.initial_layout = self.property_set["layout"]
@@ -110,23 +110,12 @@ class LegacySwap(TransformationPass):
 
         # Construct an empty DAGCircuit with one qreg "q"
         # and the same set of cregs as the input circuit
-        dagcircuit_output = DAGCircuit()
+        dagcircuit_output = DAGCircuit(storage=dag.storage)
         dagcircuit_output.name = dag.name
         dagcircuit_output.add_qreg(QuantumRegister(self.coupling_map.size(), "q"))
         for creg in dag.cregs.values():
             dagcircuit_output.add_creg(creg)
 
-        # Make a trivial wire mapping between the subcircuits
-        # returned by swap_mapper_layer_update and the circuit
-        # we are building
-        identity_wire_map = {}
-        q = QuantumRegister(self.coupling_map.size(), 'q')
-        for j in range(self.coupling_map.size()):
-            identity_wire_map[(q, j)] = (q, j)
-        for creg in dag.cregs.values():
-            for j in range(creg.size):
-                identity_wire_map[(creg, j)] = (creg, j)
-
         first_layer = True  # True until first layer is output
 
         # Iterate over layers
@@ -138,7 +127,7 @@ class LegacySwap(TransformationPass):
 
             # If this fails, try one gate at a time in this layer
             if not success_flag:
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = list(dag.serial_layer_views(layer["nodes"]))
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
@@ -160,14 +149,13 @@ class LegacySwap(TransformationPass):
                     # Update the record of qubit positions for each inner iteration
                     layout = best_layout
                     # Update the QASM
-                    dagcircuit_output.compose_back(
-                        self.swap_mapper_layer_update(j,
-                                                      first_layer,
-                                                      best_layout,
-                                                      best_d,
-                                                      best_circ,
-                                                      serial_layerlist),
-                        identity_wire_map)
+                    self.swap_mapper_layer_update(j,
+                                                  first_layer,
+                                                  best_layout,
+                                                  best_d,
+                                                  best_circ,
+                                                  serial_layerlist,
+                                                  dagcircuit_output)
                     # Update initial layout
                     if first_layer:
                         initial_layout = layout
@@ -178,14 +166,13 @@ class LegacySwap(TransformationPass):
                 layout = best_layout
 
                 # Update the QASM
-                dagcircuit_output.compose_back(
-                    self.swap_mapper_layer_update(i,
-                                                  first_layer,
-                                                  best_layout,
-                                                  best_d,
-                                                  best_circ,
-                                                  layerlist),
-                    identity_wire_map)
+                self.swap_mapper_layer_update(i,
+                                              first_layer,
+                                              best_layout,
+                                              best_d,
+                                              best_circ,
+                                              layerlist,
+                                              dagcircuit_output)
                 # Update initial layout
                 if first_layer:
                     initial_layout = layout
@@ -196,7 +183,7 @@ class LegacySwap(TransformationPass):
         if first_layer:
             layout = initial_layout
             for i, layer in enumerate(layerlist):
-                dagcircuit_output.compose_back(layer["graph"], layout)
+                dagcircuit_output.compose_nodes_back(layer["nodes"], layout)
 
         return dagcircuit_output
 
@@ -352,7 +339,7 @@ class LegacySwap(TransformationPass):
         return True, best_circ, best_d, best_layout, False
 
     def swap_mapper_layer_update(self, i, first_layer, best_layout, best_d,
-                                 best_circ, layer_list):
+                                 best_circ, layer_list, dagcircuit_output=None):
         """Update the QASM string for an iteration of swap_mapper.
 
         i = layer number
@@ -360,14 +347,25 @@ class LegacySwap(TransformationPass):
         best_layout = layout returned from swap algorithm
         best_d = depth returned from swap algorithm
         best_circ = swap circuit returned from swap algorithm
-        layer_list = list of circuit objects for each layer
+        layer_list = list of layer views, output of DAGCircuit layer_views()
+        dagcircuit_output = DAGCircuit to append the layer to, or None
+            to output it in a new DAGCircuit
 
-        Return DAGCircuit object to append to the output DAGCircuit.
+        Return the DAGCircuit the layer was appended to.
         """
         layout = best_layout
-        dagcircuit_output = DAGCircuit()
         QR = QuantumRegister(self.coupling_map.size(), 'q')
-        dagcircuit_output.add_qreg(QR)
+        if dagcircuit_output is None:
+            dagcircuit_output = DAGCircuit()
+            dagcircuit_output.add_qreg(QR)
+            for layer in layer_list:
+                for node in layer["nodes"]:
+                    cregs = [carg[0] for carg in node.cargs]
+                    if node.condition:
+                        cregs.append(node.condition[0])
+                    for creg in cregs:
+                        if creg.name not in dagcircuit_output.cregs:
+                            dagcircuit_output.add_creg(creg)
         # Identity wire-map for composing the circuits
         identity_wire_map = {(QR, j): (QR, j) for j in range(self.coupling_map.size())}
 
@@ -377,7 +375,7 @@ class LegacySwap(TransformationPass):
         if first_layer:
             # Output all layers up to this point
             for j in range(i + 1):
-                dagcircuit_output.compose_back(layer_list[j]["graph"], layout)
+                dagcircuit_output.compose_nodes_back(layer_list[j]["nodes"], layout)
         # Otherwise, we output the current layer and the associated swap gates.
         else:
             # Output any swaps
@@ -385,5 +383,5 @@ class LegacySwap(TransformationPass):
                 dagcircuit_output.compose_back(best_circ, identity_wire_map)
 
             # Output this layer
-            dagcircuit_output.compose_back(layer_list[i]["graph"], layout)
+            dagcircuit_output.compose_nodes_back(layer_list[i]["nodes"], layout)
         return dagcircuit_output
@@ -49,13 +49,14 @@ https://medium.com/qiskit/improving-a-quantum-compiler-48410d7a7084
 
 from copy import deepcopy
 
+import numpy as np
+
 from qiskit import QuantumRegister
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.extensions.standard import SwapGate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler import Layout
-from qiskit.dagcircuit import DAGNode
 
 
 SEARCH_DEPTH = 4
@@ -90,7 +91,6 @@ class LookaheadSwap(TransformationPass):
             compatible with the DAG
         """
         coupling_map = self._coupling_map
-        ordered_virtual_gates = list(dag.serial_layers())
 
         if self.initial_layout is None:
             if self.property_set["layout"]:
@@ -105,161 +105,230 @@ class LookaheadSwap(TransformationPass):
             raise TranspilerError(
                 "Mappers require to have the layout to be the same size as the coupling map")
 
+        state = _SearchState(dag, self.initial_layout, coupling_map)
         mapped_gates = []
-        layout = self.initial_layout.copy()
-        gates_remaining = ordered_virtual_gates.copy()
+        gates_remaining = list(range(len(state.nodes)))
 
         while gates_remaining:
-            best_step = _search_forward_n_swaps(layout, gates_remaining,
-                                                coupling_map)
+            best_step = _search_forward_n_swaps(state, gates_remaining)
 
-            layout = best_step['layout']
-            gates_mapped = best_step['gates_mapped']
-            gates_remaining = best_step['gates_remaining']
+            gates_mapped = best_step[2]
+            gates_remaining = best_step[3]
 
+            # The search leaves the layout as it found it, apply the chosen swaps.
+            for index, qargs in gates_mapped:
+                if index == -1:
+                    state.swap(*qargs)
             mapped_gates.extend(gates_mapped)
 
         # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
         mapped_dag = _copy_circuit_metadata(dag, coupling_map)
+        device_qreg = QuantumRegister(len(coupling_map.physical_qubits), 'q')
 
-        for node in mapped_gates:
-            mapped_dag.apply_operation_back(op=node.op, qargs=node.qargs, cargs=node.cargs)
+        for index, qargs in mapped_gates:
+            if index == -1:
+                op, cargs = SwapGate(), []
+            else:
+                op = _transform_gate_for_layout(state.nodes[index], qargs, device_qreg)
+                cargs = state.nodes[index].cargs
+            mapped_dag.apply_operation_back(op=op, qargs=[(device_qreg, i) for i in qargs],
+                                            cargs=cargs)
 
         return mapped_dag
 
 
-def _search_forward_n_swaps(layout, gates, coupling_map,
-                            depth=SEARCH_DEPTH, width=SEARCH_WIDTH):
+class _SearchState:
+    """The gates of a circuit and a layout, as integer arrays for the search.
+
+    Virtual qubits are numbered in the order of ``dag.qubits()``. The layout
+    is kept in the ``virtual_to_physical`` and ``physical_to_virtual`` lists,
+    which the search swaps in place and restores.
+    """
+
+    def __init__(self, dag, layout, coupling_map):
+        qubits = dag.qubits()
+        qubit_indices = {qubit: index for index, qubit in enumerate(qubits)}
+        num_physical = len(coupling_map.physical_qubits)
+
+        self.virtual_to_physical = [layout[qubit] for qubit in qubits]
+        self.physical_to_virtual = [-1] * num_physical
+        for virtual, physical in enumerate(self.virtual_to_physical):
+            self.physical_to_virtual[physical] = virtual
+
+        # Gates without qubits are never mapped, leave them out from the start.
+        self.nodes = []
+        self.qargs = []
+        # Gates without a partition (barrier, snapshot, save, load, noise) are
+        # mapped with their qargs, but do not take part in the distances.
+        self.partitioned = []
+        for layer in dag.serial_layer_views():
+            node = layer['nodes'][0]
+            if not node.qargs:
+                continue
+            qargs = tuple(qubit_indices[qubit] for qubit in node.qargs)
+            if layer['partition'] and len(qargs) > 2:
+                raise TranspilerError("Layer contains > 2-qubit gates")
+            self.nodes.append(node)
+            self.qargs.append(qargs)
+            self.partitioned.append(bool(layer['partition']))
+
+        self.num_qubits = len(qubits)
+        self.two_qubit = [len(qargs) == 2 for qargs in self.qargs]
+        pairs = [qargs if partitioned and len(qargs) == 2 else (-1, -1)
+                 for qargs, partitioned in zip(self.qargs, self.partitioned)]
+        self.pairs = np.array(pairs, dtype=int).reshape(-1, 2)
+        self.max_gates = 50 + 10 * num_physical
+
+        self.edges = coupling_map.get_edges()
+        self.edge_array = np.array(self.edges, dtype=int).reshape(-1, 2)
+        if coupling_map._dist_matrix is None:
+            coupling_map._compute_distance_matrix()
+        self.dist = coupling_map._dist_matrix
+        self.dist_rows = self.dist.tolist()
+
+    def swap(self, physical1, physical2):
+        """Swap the virtual qubits on two physical qubits."""
+        p2v = self.physical_to_virtual
+        virtual1, virtual2 = p2v[physical1], p2v[physical2]
+        p2v[physical1], p2v[physical2] = virtual2, virtual1
+        if virtual1 != -1:
+            self.virtual_to_physical[virtual1] = physical2
+        if virtual2 != -1:
+            self.virtual_to_physical[virtual2] = physical1
+
+
+def _search_forward_n_swaps(state, gates, depth=SEARCH_DEPTH, width=SEARCH_WIDTH):
     """Search for SWAPs which allow for application of largest number of gates.
 
     Arguments:
-        layout (Layout): Map from virtual qubit index to physical qubit index.
-        gates (list): Gates to be mapped.
-        coupling_map (CouplingMap): CouplingMap of the target backend.
+        state (_SearchState): The gates and current layout. The layout is
+            the same on return.
+        gates (list): Indices of the gates to be mapped.
         depth (int): Number of SWAP layers to search before choosing a result.
         width (int): Number of SWAPs to consider at each layer.
     Returns:
-        dict: Describes solution step found.
-            layout (Layout): Virtual to physical qubit map after SWAPs.
-            gates_remaining (list): Gates that could not be mapped.
-            gates_mapped (list): Gates that were mapped, including added SWAPs.
-
+        tuple: Describes solution step found.
+            int: Number of mapped two-qubit gates, SWAPs included.
+            int: Number of SWAPs added.
+            list: Gates that were mapped, including added SWAPs, as pairs of
+                the gate index, -1 for SWAPs, and the physical qubits.
+            list: Gates that could not be mapped.
     """
 
-    gates_mapped, gates_remaining = _map_free_gates(layout, gates, coupling_map)
-
-    base_step = {'layout': layout,
-                 'swaps_added': 0,
-                 'gates_mapped': gates_mapped,
-                 'gates_remaining': gates_remaining}
+    gates_mapped, gates_remaining = _map_free_gates(state, gates)
+    two_qubit = state.two_qubit
+    num_two_qubit = sum(two_qubit[index] for index, _ in gates_mapped)
 
     if not gates_remaining or depth == 0:
-        return base_step
-
-    possible_swaps = coupling_map.get_edges()
+        return num_two_qubit, 0, gates_mapped, gates_remaining
 
-    def _score_swap(swap):
-        """Calculate the relative score for a given SWAP."""
-        trial_layout = layout.copy()
-        trial_layout.swap(*swap)
-        return _calc_layout_distance(gates, coupling_map, trial_layout)
-
-    ranked_swaps = sorted(possible_swaps, key=_score_swap)
+    scores = _score_swaps(state, gates)
+    # A stable sort keeps the coupling map order between SWAPs of equal score.
+    ranked_swaps = np.argsort(scores, kind='stable')[:width]
 
     best_swap, best_step = None, None
-    for swap in ranked_swaps[:width]:
-        trial_layout = layout.copy()
-        trial_layout.swap(*swap)
-        next_step = _search_forward_n_swaps(trial_layout, gates_remaining,
-                                            coupling_map, depth - 1, width)
+    for edge in ranked_swaps:
+        swap = state.edges[edge]
+        state.swap(*swap)
+        next_step = _search_forward_n_swaps(state, gates_remaining, depth - 1, width)
+        state.swap(*swap)
 
         # ranked_swaps already sorted by distance, so distance is the tie-breaker.
         if best_swap is None or _score_step(next_step) > _score_step(best_step):
             best_swap, best_step = swap, next_step
 
-    best_swap_gate = _swap_ops_from_edge(best_swap, layout)
-    return {
-        'layout': best_step['layout'],
-        'swaps_added': 1 + best_step['swaps_added'],
-        'gates_remaining': best_step['gates_remaining'],
-        'gates_mapped': gates_mapped + best_swap_gate + best_step['gates_mapped'],
-    }
+    return (num_two_qubit + 1 + best_step[0],
+            1 + best_step[1],
+            gates_mapped + [(-1, tuple(best_swap))] + best_step[2],
+            best_step[3])
 
 
-def _map_free_gates(layout, gates, coupling_map):
+def _map_free_gates(state, gates):
     """Map all gates that can be executed with the current layout.
 
     Args:
-        layout (Layout): Map from virtual qubit index to physical qubit index.
-        gates (list): Gates to be mapped.
-        coupling_map (CouplingMap): CouplingMap for target device topology.
+        state (_SearchState): The gates and current layout.
+        gates (list): Indices of the gates to be mapped.
 
     Returns:
         tuple:
-            mapped_gates (list): ops for gates that can be executed, mapped onto layout.
+            mapped_gates (list): pairs of gate index and physical qubits for
+                gates that can be executed.
             remaining_gates (list): gates that cannot be executed on the layout.
 
     """
 
-    blocked_qubits = set()
+    blocked = [False] * state.num_qubits
+    num_blocked = 0
 
     mapped_gates = []
     remaining_gates = []
 
-    for gate in gates:
-        # Gates without a partition (barrier, snapshot, save, load, noise) may
-        # still have associated qubits. Look for them in the qargs.
-        if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+    v2p = state.virtual_to_physical
+    dist = state.dist_rows
+    all_qargs = state.qargs
+    partitioned = state.partitioned
 
-            if not qubits:
-                continue
+    for position, gate in enumerate(gates):
+        qubits = all_qargs[gate]
 
-            if blocked_qubits.intersection(qubits):
-                blocked_qubits.update(qubits)
-                remaining_gates.append(gate)
-            else:
-                mapped_gate = _transform_gate_for_layout(gate, layout)
-                mapped_gates.append(mapped_gate)
+        if len(qubits) == 2:
+            is_blocked = blocked[qubits[0]] or blocked[qubits[1]]
+        else:
+            is_blocked = any(blocked[qubit] for qubit in qubits)
+
+        if not is_blocked and (not partitioned[gate] or len(qubits) == 1 or
+                               dist[v2p[qubits[0]]][v2p[qubits[1]]] == 1):
+            mapped_gates.append((gate, tuple(v2p[qubit] for qubit in qubits)))
             continue
 
-        qubits = gate['partition'][0]
-
-        if blocked_qubits.intersection(qubits):
-            blocked_qubits.update(qubits)
-            remaining_gates.append(gate)
-        elif len(qubits) == 1:
-            mapped_gate = _transform_gate_for_layout(gate, layout)
-            mapped_gates.append(mapped_gate)
-        elif coupling_map.distance(*[layout[q] for q in qubits]) == 1:
-            mapped_gate = _transform_gate_for_layout(gate, layout)
-            mapped_gates.append(mapped_gate)
-        else:
-            blocked_qubits.update(qubits)
-            remaining_gates.append(gate)
+        remaining_gates.append(gate)
+        for qubit in qubits:
+            if not blocked[qubit]:
+                blocked[qubit] = True
+                num_blocked += 1
+        if num_blocked == state.num_qubits:
+            # Every later gate is blocked as well.
+            remaining_gates.extend(gates[position + 1:])
+            break
 
     return mapped_gates, remaining_gates
 
 
-def _calc_layout_distance(gates, coupling_map, layout, max_gates=None):
-    """Return the sum of the distances of two-qubit pairs in each CNOT in gates
-    according to the layout and the coupling.
+def _score_swaps(state, gates):
+    """Return, for each coupling map edge, the change of the sum of the
+    distances of the two-qubit gates among the first ``max_gates`` of gates
+    if it were swapped.
+
+    The sum only changes for gates with a qubit on the edge, so with ``C``
+    the number of gates on each pair of physical qubits and ``D`` the
+    distance matrix, swapping ``(p, q)`` changes it by ``M[p, q] + M[q, p]``
+    plus ``2 D[p, q]`` for each gate on ``(p, q)``, where
+    ``M[x, y] = sum_b (C + C^T)[x, b] (D[y, b] - D[x, b])``.
     """
+    num_physical = len(state.physical_to_virtual)
+    pairs = state.pairs[gates[:state.max_gates]]
+    pairs = pairs[pairs[:, 0] != -1]
+    physical = np.asarray(state.virtual_to_physical)[pairs]
 
-    if max_gates is None:
-        max_gates = 50 + 10 * len(coupling_map.physical_qubits)
+    counts = np.reshape(np.bincount(physical[:, 0] * num_physical + physical[:, 1],
+                                    minlength=num_physical * num_physical),
+                        (num_physical, num_physical))
+    counts = counts + counts.T
+    dist = state.dist
+    moved = (counts * dist).sum(axis=1)
 
-    return sum(coupling_map.distance(*[layout[q] for q in gate['partition'][0]])
-               for gate in gates[:max_gates]
-               if gate['partition'] and len(gate['partition'][0]) == 2)
+    start, end = state.edge_array[:, 0], state.edge_array[:, 1]
+    return ((counts[start] * dist[end]).sum(axis=1) - moved[start]
+            + (counts[end] * dist[start]).sum(axis=1) - moved[end]
+            + 2 * counts[start, end] * dist[start, end])
 
 
 def _score_step(step):
 
     """Count the mapped two-qubit gates, less the number of added SWAPs."""
     # Each added swap will add 3 ops to gates_mapped, so subtract 3.
-    return len([g for g in step['gates_mapped']
-                if len(g.qargs) == 2]) - 3 * step['swaps_added']
+    return step[0] - 3 * step[1]
 
 
 def _copy_circuit_metadata(source_dag, coupling_map):
@@ -267,7 +336,7 @@ def _copy_circuit_metadata(source_dag, coupling_map):
     Generate only a single qreg in the output DAG, matching the size of the
     coupling_map."""
 
-    target_dag = DAGCircuit()
+    target_dag = DAGCircuit(storage=source_dag.storage)
     target_dag.name = source_dag.name
 
     for creg in source_dag.cregs.values():
@@ -279,28 +348,12 @@ def _copy_circuit_metadata(source_dag, coupling_map):
     return target_dag
 
 
-def _transform_gate_for_layout(gate, layout):
-    """Return op implementing a virtual gate on given layout."""
+def _transform_gate_for_layout(node, qargs, device_qreg):
+    """Return a copy of the op of a virtual gate node for the physical qubits qargs."""
 
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    mapped_op = deepcopy(node.op)
 
     # Workaround until #1816, apply mapped to qargs to both DAGNode and op
-    device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
-    mapped_qargs = [(device_qreg, layout[a]) for a in mapped_op_node.qargs]
-    mapped_op_node.qargs = mapped_op_node.op.qargs = mapped_qargs
-
-    mapped_op_node.pop('name')
-
-    return mapped_op_node
-
-
-def _swap_ops_from_edge(edge, layout):
-    """Generate list of ops to implement a SWAP gate along a coupling edge."""
-
-    device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
-    qreg_edge = [(device_qreg, i) for i in edge]
+    mapped_op.qargs = [(device_qreg, i) for i in qargs]
 
-    # TODO shouldn't be making other nodes not by the DAG!!
-    return [
-        DAGNode({'op': SwapGate(), 'qargs': qreg_edge, 'cargs': [], 'type': 'op'})
-    ]
+    return mapped_op
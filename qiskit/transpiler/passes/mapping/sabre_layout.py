@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A pass for choosing a Layout of a circuit onto a Coupling graph, by
+routing the circuit back and forth with the SABRE heuristic.
+
+Starting from a random layout, the circuit is routed forwards, and then its
+reverse is routed from the final layout. The final layout of the reverse
+circuit is a layout under which the first gates of the circuit need few
+SWAPs. Each round trip refines the layout further.
+"""
+
+from qiskit.transpiler import Layout
+from qiskit.transpiler.basepasses import AnalysisPass
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.passes.mapping.sabre_swap import SabreDAG, SabreRouter
+
+
+class SabreLayout(AnalysisPass):
+    """
+    Chooses a Layout by routing the circuit forwards and backwards with SABRE.
+    """
+
+    def __init__(self, coupling_map, heuristic='decay', max_iterations=3, seed=None):
+        """
+        Chooses a SabreLayout
+
+        Args:
+            coupling_map (CouplingMap): directed graph representing a coupling map.
+            heuristic (str): the SabreSwap heuristic to route with.
+            max_iterations (int): number of forward and backward round trips.
+            seed (int): seed for the random initial layout and the routing.
+        """
+        super().__init__()
+        self.coupling_map = coupling_map
+        self.heuristic = heuristic
+        self.max_iterations = max_iterations
+        self.seed = seed
+
+    def run(self, dag):
+        """
+        Pick a layout by routing the circuit back and forth, and set the
+        property `layout`.
+
+        Args:
+            dag (DAGCircuit): DAG to find layout for.
+
+        Raises:
+            TranspilerError: if dag wider than self.coupling_map
+        """
+        num_physical = len(self.coupling_map.physical_qubits)
+        if len(dag.qubits()) > num_physical:
+            raise TranspilerError('Number of qubits greater than device.')
+
+        sabre_dag = SabreDAG(dag)
+        router = SabreRouter(self.coupling_map, self.heuristic, self.seed)
+        virtual_to_physical = list(router.rng.permutation(num_physical)[:len(sabre_dag.qubits)])
+        for _ in range(self.max_iterations):
+            for reverse in (False, True):
+                _, virtual_to_physical = router.route(sabre_dag, virtual_to_physical, reverse)
+
+        self.property_set['layout'] = Layout({qubit: int(physical) for qubit, physical
+                                              in zip(sabre_dag.qubits, virtual_to_physical)})
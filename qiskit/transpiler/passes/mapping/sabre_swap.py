@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+A swap mapper based on the SABRE heuristic search.
+
+SABRE (G. Li, Y. Ding and Y. Xie, "Tackling the Qubit Mapping Problem for
+NISQ-Era Quantum Devices", arXiv:1809.02573) routes a circuit gate by gate:
+
+- The front layer holds the gates whose predecessors have all been mapped.
+  Gates of the front layer that can be executed with the current layout are
+  mapped, and their successors join the front layer once they are ready.
+- When no gate of the front layer can be executed, every SWAP on a coupling
+  map edge touching a qubit of the front layer is scored by the distances
+  its application would give the gates of the front layer and of an extended
+  set of upcoming two-qubit gates. The best SWAP is applied.
+- A decay factor on the recently swapped qubits makes the search prefer
+  SWAPs that can run in parallel, and so keeps the depth low.
+
+The scores are kept up to date as SWAPs are applied and gates are routed,
+rather than computed anew for each SWAP: a SWAP only changes the distances
+of the gates on its two qubits, so each step costs time in the number of
+those gates and of the SWAP candidates, not in the size of the circuit.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from qiskit import QuantumRegister
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.extensions.standard import SwapGate
+from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler import Layout
+
+EXTENDED_SET_SIZE = 20  # Number of upcoming two-qubit gates in the extended set
+EXTENDED_SET_WEIGHT = 0.5  # Weight of the extended set in the score of a SWAP
+DECAY_RATE = 0.001  # Decay added to a qubit each time it is swapped
+DECAY_RESET_INTERVAL = 5  # Number of SWAPs after which the decay is reset
+
+# Operations that do not need their qubits to be coupled
+_DIRECTIVES = {"barrier", "snapshot", "save", "load", "noise"}
+
+
+class SabreSwap(TransformationPass):
+    """
+    Maps a DAGCircuit onto a `coupling_map` adding swap gates, with the SABRE
+    heuristic search.
+    """
+
+    def __init__(self, coupling_map, initial_layout=None, heuristic='decay', seed=None):
+        """
+        Maps a DAGCircuit onto a `coupling_map` using swap gates.
+
+        Args:
+            coupling_map (CouplingMap): Directed graph representing a coupling map.
+            initial_layout (Layout): initial layout of qubits in mapping
+            heuristic (str): the score of a SWAP. 'basic' sums the distances
+                of the front layer gates, 'lookahead' adds those of the
+                extended set, and 'decay' also penalizes recently swapped
+                qubits.
+            seed (int): seed for the random choice between equally good SWAPs
+
+        Raises:
+            TranspilerError: if the heuristic is not known
+        """
+        super().__init__()
+        if heuristic not in ('basic', 'lookahead', 'decay'):
+            raise TranspilerError('Heuristic %s not recognized.' % heuristic)
+        self.coupling_map = coupling_map
+        self.initial_layout = initial_layout
+        self.heuristic = heuristic
+        self.seed = seed
+
+    def run(self, dag):
+        """
+        Runs the SabreSwap pass on `dag`.
+
+        Args:
+            dag (DAGCircuit): DAG to map.
+
+        Returns:
+            DAGCircuit: A mapped DAG.
+
+        Raises:
+            TranspilerError: if the coupling map or the layout are not
+            compatible with the DAG
+        """
+        if self.initial_layout is None:
+            if self.property_set["layout"]:
+                self.initial_layout = self.property_set["layout"]
+            else:
+                self.initial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
+
+        if len(dag.qubits()) != len(self.initial_layout):
+            raise TranspilerError('The layout does not match the amount of qubits in the DAG')
+
+        if len(self.coupling_map.physical_qubits) != len(self.initial_layout):
+            raise TranspilerError(
+                "Mappers require to have the layout to be the same size as the coupling map")
+
+        sabre_dag = SabreDAG(dag)
+        router = SabreRouter(self.coupling_map, self.heuristic, self.seed)
+        virtual_to_physical = [self.initial_layout[qubit] for qubit in sabre_dag.qubits]
+        steps, _ = router.route(sabre_dag, virtual_to_physical)
+
+        # Preserve input DAG's name and cregs, on a single register of the
+        # physical qubits.
+        new_dag = DAGCircuit(storage=dag.storage)
+        new_dag.name = dag.name
+        for creg in dag.cregs.values():
+            new_dag.add_creg(creg)
+        device_qreg = QuantumRegister(len(self.coupling_map.physical_qubits), 'q')
+        new_dag.add_qreg(device_qreg)
+
+        for index, physical in steps:
+            if index == -1:
+                new_dag.apply_operation_back(SwapGate(), [(device_qreg, p) for p in physical], [])
+            else:
+                node = sabre_dag.nodes[index]
+                new_dag.apply_operation_back(node.op, [(device_qreg, p) for p in physical],
+                                             node.cargs, node.condition)
+        return new_dag
+
+
+class SabreDAG:
+    """The dependencies between the op nodes of a DAGCircuit, by node index.
+
+    Virtual qubits are numbered in the order of ``dag.qubits()``.
+    """
+
+    def __init__(self, dag):
+        """Index the op nodes of a DAGCircuit.
+
+        Args:
+            dag (DAGCircuit): the circuit to route.
+
+        Raises:
+            TranspilerError: if the circuit has gates on more than two qubits
+        """
+        self.qubits = dag.qubits()
+        qubit_indices = {qubit: index for index, qubit in enumerate(self.qubits)}
+        self.nodes = list(dag.topological_op_nodes())
+        # The two virtual qubits of each gate that needs them coupled, or None
+        self.pairs = []
+        # Virtual qubits of each gate
+        self.qargs = []
+        self.predecessors = []
+        self.successors = [[] for _ in self.nodes]
+
+        last_on_wire = {}
+        for index, node in enumerate(self.nodes):
+            qargs = tuple(qubit_indices[qubit] for qubit in node.qargs)
+            if node.name in _DIRECTIVES or len(qargs) < 2:
+                self.pairs.append(None)
+            elif len(qargs) == 2:
+                self.pairs.append(qargs)
+            else:
+                raise TranspilerError("SabreSwap cannot map %s, a gate on more than two "
+                                      "qubits" % node.name)
+            self.qargs.append(qargs)
+
+            wires = list(node.qargs) + list(node.cargs)
+            if node.condition:
+                wires.extend((node.condition[0], bit) for bit in range(node.condition[0].size))
+            predecessors = set()
+            for wire in wires:
+                previous = last_on_wire.get(wire)
+                if previous is not None:
+                    predecessors.add(previous)
+                last_on_wire[wire] = index
+            self.predecessors.append(sorted(predecessors))
+            for previous in self.predecessors[-1]:
+                self.successors[previous].append(index)
+
+
+class SabreRouter:
+    """Routes a SabreDAG on a coupling map, forwards or backwards."""
+
+    def __init__(self, coupling_map, heuristic='decay', seed=None):
+        """
+        Args:
+            coupling_map (CouplingMap): the coupling map to route on.
+            heuristic (str): 'basic', 'lookahead' or 'decay', as in SabreSwap.
+            seed (int): seed for the random choice between equally good SWAPs.
+        """
+        self.heuristic = heuristic
+        self.rng = np.random.RandomState(seed)
+        self.num_physical = len(coupling_map.physical_qubits)
+        if coupling_map._dist_matrix is None:
+            coupling_map._compute_distance_matrix()
+        self.dist = coupling_map._dist_matrix.tolist()
+        neighbors = [set() for _ in range(self.num_physical)]
+        for source, target in coupling_map.get_edges():
+            neighbors[source].add(target)
+            neighbors[target].add(source)
+        self.neighbors = [sorted(qubits) for qubits in neighbors]
+        # The undirected edges, sorted, and the (edge, qubit at its other end)
+        # pairs incident to each physical qubit
+        self.edge_list = sorted({(min(source, target), max(source, target))
+                                 for source, target in coupling_map.get_edges()})
+        self.incident = [[] for _ in range(self.num_physical)]
+        for edge, (source, target) in enumerate(self.edge_list):
+            self.incident[source].append((edge, target))
+            self.incident[target].append((edge, source))
+
+    def route(self, sabre_dag, virtual_to_physical, reverse=False):
+        """Route the gates of a SabreDAG from an initial layout.
+
+        Args:
+            sabre_dag (SabreDAG): the gates to route.
+            virtual_to_physical (list[int]): the initial physical qubit of
+                each virtual qubit.
+            reverse (bool): route the gates from the last to the first.
+
+        Returns:
+            tuple(list, list[int]): the routed gates, as pairs of the gate
+                index, or -1 for a SWAP, and the physical qubits, followed by
+                the final physical qubit of each virtual qubit.
+        """
+        v2p = [int(physical) for physical in virtual_to_physical]
+        p2v = [-1] * self.num_physical
+        for virtual, physical in enumerate(v2p):
+            p2v[physical] = virtual
+        dist = self.dist
+        pairs = sabre_dag.pairs
+        all_qargs = sabre_dag.qargs
+        if reverse:
+            successors, predecessors = sabre_dag.predecessors, sabre_dag.successors
+        else:
+            successors, predecessors = sabre_dag.successors, sabre_dag.predecessors
+
+        waiting = [len(gates) for gates in predecessors]
+        front = [index for index, count in enumerate(waiting) if count == 0]
+        if reverse:
+            front.reverse()
+        steps = []
+        # The decay of the qubits swapped since the last reset; the others are at 1
+        decay = {}
+        scores = _SwapScores(self, pairs)
+        scored = False
+        # Swaps since a gate was last routed, and the steps at that point
+        num_swaps = 0
+        progress = 0
+        max_swaps = 10 * max(len(v2p), 1)
+
+        while front:
+            blocked = []
+            routed = False
+            for index in front:
+                pair = pairs[index]
+                if pair is None or dist[v2p[pair[0]]][v2p[pair[1]]] == 1:
+                    steps.append((index, tuple(v2p[qubit] for qubit in all_qargs[index])))
+                    for successor in successors[index]:
+                        waiting[successor] -= 1
+                        if not waiting[successor]:
+                            blocked.append(successor)
+                    routed = True
+                else:
+                    blocked.append(index)
+            front = blocked
+            if routed:
+                decay.clear()
+                scored = False
+                num_swaps = 0
+                progress = len(steps)
+                continue
+
+            if num_swaps >= max_swaps:
+                # The search is not converging: give up its swaps and bring
+                # the closest gate of the front layer together along a
+                # shortest path.
+                for _, (physical1, physical2) in reversed(steps[progress:]):
+                    _swap(v2p, p2v, physical1, physical2)
+                del steps[progress:]
+                for physical1, physical2 in self._path_swaps(front, pairs, v2p):
+                    steps.append((-1, (physical1, physical2)))
+                    _swap(v2p, p2v, physical1, physical2)
+                scores = _SwapScores(self, pairs)
+                scored = False
+                num_swaps = 0
+                continue
+
+            if not scored:
+                extended = [] if self.heuristic == 'basic' else \
+                    _extended_set(front, successors, pairs)
+                scores.update(front, extended, v2p)
+                scored = True
+            physical1, physical2 = scores.best(decay, self.rng)
+            steps.append((-1, (physical1, physical2)))
+            scores.swap(physical1, physical2, v2p, p2v)
+            _swap(v2p, p2v, physical1, physical2)
+            num_swaps += 1
+            if num_swaps % DECAY_RESET_INTERVAL == 0:
+                decay.clear()
+            elif self.heuristic == 'decay':
+                decay[physical1] = decay.get(physical1, 1.0) + DECAY_RATE
+                decay[physical2] = decay.get(physical2, 1.0) + DECAY_RATE
+
+        return steps, v2p
+
+    def _path_swaps(self, front, pairs, v2p):
+        """Return the SWAPs that bring the qubits of the closest front layer
+        gate next to each other."""
+        dist = self.dist
+        index = min(front, key=lambda index: dist[v2p[pairs[index][0]]][v2p[pairs[index][1]]])
+        physical, target = v2p[pairs[index][0]], v2p[pairs[index][1]]
+        swaps = []
+        while dist[physical][target] > 1:
+            step = min(self.neighbors[physical], key=lambda neighbor: dist[neighbor][target])
+            swaps.append((physical, step))
+            physical = step
+        return swaps
+
+
+class _SwapScores:
+    """The scores of the SWAPs on the qubits of the front layer, kept up to
+    date as SWAPs are applied and gates are routed.
+
+    The score of a SWAP is the weighted sum of the distances of the front
+    layer and extended set gates after it. A SWAP only changes the distances
+    of the gates on its two qubits, so the change it brings is summed from
+    each gate qubit moving across each of its incident edges, and applying
+    a SWAP only updates the changes brought by the gates it moves. The sums
+    are kept apart for the front layer and the extended set, in integers,
+    and weighted when the SWAPs are compared.
+    """
+
+    def __init__(self, router, pairs):
+        """
+        Args:
+            router (SabreRouter): the router whose coupling map the SWAPs are on.
+            pairs (list): the two virtual qubits of each gate of the SabreDAG.
+        """
+        self.dist = router.dist
+        self.incident = router.incident
+        self.edges = router.edge_list
+        self.pairs = pairs
+        # The set, 0 for the front layer and 1 for the extended set, of each
+        # scored gate, and the scored gates on each virtual qubit
+        self.gates = {}
+        self.gates_of = {}
+        self.sizes = [0, 0]
+        # The sum of the distances of each set, and its change under the SWAP
+        # on each edge
+        self.total = [0, 0]
+        self.change = [[0] * len(self.edges), [0] * len(self.edges)]
+        # The number of front layer qubits on the ends of each edge
+        self.front_count = [0] * len(self.edges)
+
+    def update(self, front, extended, v2p):
+        """Score the SWAPs for a new front layer and extended set.
+
+        Args:
+            front (list[int]): the gates of the front layer.
+            extended (list[int]): the gates of the extended set.
+            v2p (list[int]): the physical qubit of each virtual qubit.
+        """
+        gates = dict.fromkeys(extended, 1)
+        gates.update(dict.fromkeys(front, 0))
+        for gate, which in list(self.gates.items()):
+            if gates.get(gate) != which:
+                self._remove(gate, v2p)
+        for gate, which in gates.items():
+            if gate not in self.gates:
+                self._add(gate, which, v2p)
+
+    def _add(self, gate, which, v2p):
+        """Score a gate of the front layer (which 0) or extended set (which 1)."""
+        self.gates[gate] = which
+        self.sizes[which] += 1
+        for virtual in self.pairs[gate]:
+            self.gates_of.setdefault(virtual, set()).add(gate)
+            if not which:
+                for edge, _ in self.incident[v2p[virtual]]:
+                    self.front_count[edge] += 1
+        virtual1, virtual2 = self.pairs[gate]
+        self._add_distance(which, 1, v2p[virtual1], v2p[virtual2])
+
+    def _remove(self, gate, v2p):
+        """Stop scoring a gate."""
+        which = self.gates.pop(gate)
+        self.sizes[which] -= 1
+        for virtual in self.pairs[gate]:
+            self.gates_of[virtual].discard(gate)
+            if not which:
+                for edge, _ in self.incident[v2p[virtual]]:
+                    self.front_count[edge] -= 1
+        virtual1, virtual2 = self.pairs[gate]
+        self._add_distance(which, -1, v2p[virtual1], v2p[virtual2])
+
+    def _add_distance(self, which, sign, physical1, physical2):
+        """Add (sign 1) or remove (sign -1) the distance between two physical
+        qubits to the sum of a set, and its changes under the SWAPs."""
+        dist = self.dist
+        distance = dist[physical1][physical2]
+        self.total[which] += sign * distance
+        change = self.change[which]
+        for physical, other in ((physical1, physical2), (physical2, physical1)):
+            row = dist[other]
+            for edge, across in self.incident[physical]:
+                # Under the SWAP of its own qubits, a gate keeps its distance
+                if across != other:
+                    change[edge] += sign * (row[across] - distance)
+
+    def swap(self, physical1, physical2, v2p, p2v):
+        """Update the scores for a SWAP, before it is applied to the layout.
+
+        Args:
+            physical1 (int): a physical qubit of the SWAP.
+            physical2 (int): the other physical qubit of the SWAP.
+            v2p (list[int]): the physical qubit of each virtual qubit.
+            p2v (list[int]): the virtual qubit on each physical qubit, or -1.
+        """
+        moved = {physical1: physical2, physical2: physical1}
+        virtuals = (p2v[physical1], p2v[physical2])
+        for gate in self.gates_of.get(virtuals[0], set()) | self.gates_of.get(virtuals[1], set()):
+            which = self.gates[gate]
+            virtual1, virtual2 = self.pairs[gate]
+            before1, before2 = v2p[virtual1], v2p[virtual2]
+            self._add_distance(which, -1, before1, before2)
+            self._add_distance(which, 1, moved.get(before1, before1), moved.get(before2, before2))
+            if not which:
+                for source in (before1, before2):
+                    if source in moved:
+                        for edge, _ in self.incident[source]:
+                            self.front_count[edge] -= 1
+                        for edge, _ in self.incident[moved[source]]:
+                            self.front_count[edge] += 1
+
+    def best(self, decay, rng):
+        """Return the SWAP of lowest score among those on the front layer qubits.
+
+        Args:
+            decay (dict): the decay of the recently swapped physical qubits,
+                multiplying the scores of the SWAPs on them.
+            rng (RandomState): the generator choosing between equally good SWAPs.
+
+        Returns:
+            tuple(int, int): the physical qubits of the SWAP.
+        """
+        # The average front layer distance plus EXTENDED_SET_WEIGHT times the
+        # average extended set distance, times 2 * num_front * num_extended
+        num_front, num_extended = self.sizes[0], max(self.sizes[1], 1)
+        front_weight = 2 * num_extended
+        extended_weight = round(2 * EXTENDED_SET_WEIGHT * num_front)
+        base = front_weight * self.total[0] + extended_weight * self.total[1]
+        front_change, extended_change = self.change
+        front_count = self.front_count
+        scores = {edge: base + front_weight * front + extended_weight * extended
+                  for edge, (count, front, extended)
+                  in enumerate(zip(front_count, front_change, extended_change)) if count}
+        factors = {edge: max(factor, decay.get(across, 1.0))
+                   for physical, factor in decay.items()
+                   for edge, across in self.incident[physical] if front_count[edge]}
+        for edge, factor in factors.items():
+            scores[edge] *= factor
+        cutoff = min(scores.values()) + 1e-10 * 2 * num_front * num_extended
+        best = [edge for edge, value in scores.items() if value <= cutoff]
+        return self.edges[best[rng.randint(len(best))]]
+
+
+def _swap(v2p, p2v, physical1, physical2):
+    """Swap the virtual qubits on two physical qubits."""
+    virtual1, virtual2 = p2v[physical1], p2v[physical2]
+    p2v[physical1], p2v[physical2] = virtual2, virtual1
+    if virtual1 != -1:
+        v2p[virtual1] = physical2
+    if virtual2 != -1:
+        v2p[virtual2] = physical1
+
+
+def _extended_set(front, successors, pairs):
+    """Return the first EXTENDED_SET_SIZE two-qubit gates following the front
+    layer, in breadth-first order."""
+    extended = []
+    seen = set(front)
+    queue = deque(front)
+    while queue and len(extended) < EXTENDED_SET_SIZE:
+        for successor in successors[queue.popleft()]:
+            if successor not in seen:
+                seen.add(successor)
+                queue.append(successor)
+                if pairs[successor] is not None:
+                    extended.append(successor)
+    return extended[:EXTENDED_SET_SIZE]
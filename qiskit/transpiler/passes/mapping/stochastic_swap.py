@@ -16,6 +16,7 @@
 A pass implementing the default Qiskit stochastic mapper.
 """
 
+import os
 from logging import getLogger
 from pprint import pformat
 from math import inf
@@ -26,10 +27,11 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.extensions.standard import SwapGate
 from qiskit.transpiler import Layout
+from qiskit.tools.parallel import CPU_COUNT
 # pylint: disable=no-name-in-module, import-error
 from .cython.stochastic_swap.utils import nlayout_from_layout
 # pylint: disable=no-name-in-module, import-error
-from .cython.stochastic_swap.swap_trial import swap_trial
+from .cython.stochastic_swap.swap_trial import swap_trials
 logger = getLogger(__name__)
 
 
@@ -50,7 +52,7 @@ class StochasticSwap(TransformationPass):
     """
 
     def __init__(self, coupling_map, initial_layout=None,
-                 trials=20, seed=None):
+                 trials=20, seed=None, num_threads=None):
         """
         Map a DAGCircuit onto a `coupling_map` using swap gates.
 
@@ -74,6 +76,10 @@ class StochasticSwap(TransformationPass):
             initial_layout (Layout): initial layout of qubits in mapping
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            num_threads (int): number of threads to run the trials on. The
+                default is the number of CPUs. It is always 1 when the circuit
+                is transpiled in a parallel worker process. The result does
+                not depend on it.
         """
         super().__init__()
         self.coupling_map = coupling_map
@@ -81,6 +87,7 @@ class StochasticSwap(TransformationPass):
         self.input_layout = None
         self.trials = trials
         self.seed = seed
+        self.num_threads = num_threads
         self.qregs = None
         self.rng = None
 
@@ -119,13 +126,20 @@ class StochasticSwap(TransformationPass):
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
         self.rng = np.random.RandomState(self.seed)
         logger.debug("StochasticSwap RandomState seeded with seed=%s", self.seed)
+        # Parallel transpilation already keeps every CPU busy, and OpenMP
+        # threads cannot run in a worker forked after the parent used them
+        if os.getenv('QISKIT_IN_PARALLEL') == 'TRUE':
+            num_threads = 1
+        else:
+            num_threads = self.num_threads or CPU_COUNT
 
-        new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
+        new_dag = self._mapper(dag, self.coupling_map, trials=self.trials,
+                               num_threads=num_threads)
         # self.property_set["layout"] = self.initial_layout
         return new_dag
 
     def _layer_permutation(self, layer_partition, layout, qubit_subset,
-                           coupling, trials):
+                           coupling, trials, num_threads=1):
         """Find a swap circuit that implements a permutation for this layer.
 
         The goal is to swap qubits such that qubits in the same two-qubit gates
@@ -145,6 +159,7 @@ class StochasticSwap(TransformationPass):
             This coupling map should be one that was provided to the
             stochastic mapper.
         trials (int): Number of attempts the randomized algorithm makes.
+        num_threads (int): Number of threads to run the trials on.
 
         Returns:
             Tuple: success_flag, best_circuit, best_depth, best_layout, trivial_flag
@@ -161,11 +176,11 @@ class StochasticSwap(TransformationPass):
         return _layer_permutation(layer_partition, self.initial_layout,
                                   layout, qubit_subset,
                                   coupling, trials,
-                                  self.qregs, self.rng)
+                                  self.qregs, self.rng, num_threads)
 
     def _layer_update(self, i, first_layer, best_layout, best_depth,
-                      best_circuit, layer_list):
-        """Provide a DAGCircuit for a new mapped layer.
+                      best_circuit, layer_list, dagcircuit_output):
+        """Append a new mapped layer to the output DAGCircuit.
 
         i (int) = layer number
         first_layer (bool) = True if this is the first layer in the
@@ -174,19 +189,18 @@ class StochasticSwap(TransformationPass):
         best_depth (int) = depth returned from _layer_permutation
         best_circuit (DAGCircuit) = swap circuit returned
             from _layer_permutation
-        layer_list (list) = list of DAGCircuit objects for each layer,
-            output of DAGCircuit layers() method
-
-        Return a DAGCircuit object to append to the output DAGCircuit
-        that the _mapper method is building.
+        layer_list (list) = list of layer views for each layer,
+            output of DAGCircuit layer_views() method
+        dagcircuit_output (DAGCircuit) = the DAGCircuit that the
+            _mapper method is building
         """
         layout = best_layout
         logger.debug("layer_update: layout = %s", pformat(layout))
         logger.debug("layer_update: self.initial_layout = %s", pformat(self.initial_layout))
-        dagcircuit_output = DAGCircuit()
-        for register in layout.get_virtual_bits().keys():
-            if register[0] not in dagcircuit_output.qregs.values():
-                dagcircuit_output.add_qreg(register[0])
+        # Make qubit edge map and extend by classical bits
+        edge_map = layout.combine_into_edge_map(self.initial_layout)
+        for bit in dagcircuit_output.clbits():
+            edge_map[bit] = bit
 
         # If this is the first layer with multi-qubit gates,
         # output all layers up to this point and ignore any
@@ -195,11 +209,7 @@ class StochasticSwap(TransformationPass):
             logger.debug("layer_update: first multi-qubit gate layer")
             # Output all layers up to this point
             for j in range(i + 1):
-                # Make qubit edge map and extend by classical bits
-                edge_map = layout.combine_into_edge_map(self.initial_layout)
-                for bit in dagcircuit_output.clbits():
-                    edge_map[bit] = bit
-                dagcircuit_output.compose_back(layer_list[j]["graph"], edge_map)
+                dagcircuit_output.compose_nodes_back(layer_list[j]["nodes"], edge_map)
         # Otherwise, we output the current layer and the associated swap gates.
         else:
             # Output any swaps
@@ -209,17 +219,11 @@ class StochasticSwap(TransformationPass):
                 dagcircuit_output.extend_back(best_circuit)
             else:
                 logger.debug("layer_update: there are no swaps in this layer")
-            # Make qubit edge map and extend by classical bits
-            edge_map = layout.combine_into_edge_map(self.initial_layout)
-            for bit in dagcircuit_output.clbits():
-                edge_map[bit] = bit
             # Output this layer
-            dagcircuit_output.compose_back(layer_list[i]["graph"], edge_map)
-
-        return dagcircuit_output
+            dagcircuit_output.compose_nodes_back(layer_list[i]["nodes"], edge_map)
 
     def _mapper(self, circuit_graph, coupling_graph,
-                trials=20):
+                trials=20, num_threads=1):
         """Map a DAGCircuit onto a CouplingMap using swap gates.
 
         Use self.initial_layout for the initial layout.
@@ -228,6 +232,7 @@ class StochasticSwap(TransformationPass):
             circuit_graph (DAGCircuit): input DAG circuit
             coupling_graph (CouplingMap): coupling graph to map onto
             trials (int): number of trials.
+            num_threads (int): number of threads to run the trials on.
 
         Returns:
             DAGCircuit: object containing a circuit equivalent to
@@ -243,8 +248,8 @@ class StochasticSwap(TransformationPass):
             TranspilerError: if there was any error during the mapping
                 or with the parameters.
         """
-        # Schedule the input circuit by calling layers()
-        layerlist = list(circuit_graph.layers())
+        # Schedule the input circuit by calling layer_views()
+        layerlist = list(circuit_graph.layer_views())
         logger.debug("schedule:")
         for i, v in enumerate(layerlist):
             logger.debug("    %d: %s", i, v["partition"])
@@ -272,21 +277,13 @@ class StochasticSwap(TransformationPass):
 
         # Construct an empty DAGCircuit with the same set of
         # qregs and cregs as the input circuit
-        dagcircuit_output = DAGCircuit()
+        dagcircuit_output = DAGCircuit(storage=circuit_graph.storage)
         dagcircuit_output.name = circuit_graph.name
         for qreg in circuit_graph.qregs.values():
             dagcircuit_output.add_qreg(qreg)
         for creg in circuit_graph.cregs.values():
             dagcircuit_output.add_creg(creg)
 
-        # Make a trivial wire mapping between the subcircuits
-        # returned by _layer_update and the circuit we build
-        identity_wire_map = {}
-        for qubit in circuit_graph.qubits():
-            identity_wire_map[qubit] = qubit
-        for bit in circuit_graph.clbits():
-            identity_wire_map[bit] = bit
-
         first_layer = True  # True until first layer is output
         logger.debug("initial_layout = %s", layout)
 
@@ -297,7 +294,7 @@ class StochasticSwap(TransformationPass):
             success_flag, best_circuit, best_depth, best_layout, trivial_flag \
                 = self._layer_permutation(layer["partition"], layout,
                                           qubit_subset, coupling_graph,
-                                          trials)
+                                          trials, num_threads)
             logger.debug("mapper: layer %d", i)
             logger.debug("mapper: success_flag=%s,best_depth=%s,trivial_flag=%s",
                          success_flag, str(best_depth), trivial_flag)
@@ -306,7 +303,8 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = list(
+                    circuit_graph.serial_layer_views(layer["nodes"]))
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
@@ -316,7 +314,7 @@ class StochasticSwap(TransformationPass):
                             serial_layer["partition"],
                             layout, qubit_subset,
                             coupling_graph,
-                            trials)
+                            trials, num_threads)
                     logger.debug("mapper: layer %d, sublayer %d", i, j)
                     logger.debug("mapper: success_flag=%s,best_depth=%s,"
                                  "trivial_flag=%s",
@@ -341,14 +339,13 @@ class StochasticSwap(TransformationPass):
                     # for each inner iteration
                     layout = best_layout
                     # Update the DAG
-                    dagcircuit_output.extend_back(
-                        self._layer_update(j,
-                                           first_layer,
-                                           best_layout,
-                                           best_depth,
-                                           best_circuit,
-                                           serial_layerlist),
-                        identity_wire_map)
+                    self._layer_update(j,
+                                       first_layer,
+                                       best_layout,
+                                       best_depth,
+                                       best_circuit,
+                                       serial_layerlist,
+                                       dagcircuit_output)
                     if first_layer:
                         first_layer = False
 
@@ -360,14 +357,13 @@ class StochasticSwap(TransformationPass):
                     self.initial_layout = layout
 
                 # Update the DAG
-                dagcircuit_output.extend_back(
-                    self._layer_update(i,
-                                       first_layer,
-                                       best_layout,
-                                       best_depth,
-                                       best_circuit,
-                                       layerlist),
-                    identity_wire_map)
+                self._layer_update(i,
+                                   first_layer,
+                                   best_layout,
+                                   best_depth,
+                                   best_circuit,
+                                   layerlist,
+                                   dagcircuit_output)
 
                 if first_layer:
                     first_layer = False
@@ -387,13 +383,13 @@ class StochasticSwap(TransformationPass):
             layout = self.initial_layout
             for i, layer in enumerate(layerlist):
                 edge_map = layout.combine_into_edge_map(self.initial_layout)
-                dagcircuit_output.compose_back(layer["graph"], edge_map)
+                dagcircuit_output.compose_nodes_back(layer["nodes"], edge_map)
 
         return dagcircuit_output
 
 
 def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
-                       coupling, trials, qregs, rng):
+                       coupling, trials, qregs, rng, num_threads=1):
     """Find a swap circuit that implements a permutation for this layer.
 
     Args:
@@ -412,6 +408,7 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
         trials (int): Number of attempts the randomized algorithm makes.
         qregs (OrderedDict): Ordered dict of registers from input DAG.
         rng (RandomState): Random number generator.
+        num_threads (int): Number of threads to run the trials on.
 
     Returns:
         Tuple: success_flag, best_circuit, best_depth, best_layout, trivial_flag
@@ -455,8 +452,6 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
     best_layout = None  # initialize best final layout
 
     cdist2 = coupling._dist_matrix**2
-    # Scaling matrix
-    scale = np.zeros((num_qubits, num_qubits))
 
     int_qubit_subset = regtuple_to_numeric(qubit_subset, qregs)
     int_gates = gates_to_idx(gates, qregs)
@@ -473,27 +468,32 @@ def _layer_permutation(layer_partition, initial_layout, layout, qubit_subset,
             slice_circuit.add_qreg(register[0])
     edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
     cdist = coupling._dist_matrix
-    for trial in range(trials):
-        logger.debug("layer_permutation: trial %s", trial)
-        # This is one Trial --------------------------------------
-        dist, optim_edges, trial_layout, depth_step = swap_trial(num_qubits, int_layout,
-                                                                 int_qubit_subset,
-                                                                 int_gates, cdist2,
-                                                                 cdist, edges, scale,
-                                                                 rng)
-
-        logger.debug("layer_permutation: final distance for this trial = %s", dist)
-        if dist == len(gates) and depth_step < best_depth:
+    # Each trial draws its random numbers in turn from rng. The trials run
+    # in batches of num_threads, and the numbers of the trials after one of
+    # depth 1 are given back, so that rng ends up where it would have had the
+    # trials run one by one.
+    num_rands = num_qubits * (num_qubits + 1) // 2
+    num_threads = max(1, min(num_threads, trials))
+    trial = 0
+    while trial < trials and best_depth != 1:
+        batch = min(num_threads, trials - trial)
+        state = rng.get_state()
+        rands = 1.0 + rng.normal(0.0, 1.0 / num_qubits, size=(batch, num_rands))
+        index, dist, optim_edges, trial_layout, depth_step = swap_trials(
+            num_qubits, int_layout, int_qubit_subset, int_gates, cdist2, cdist,
+            edges, rands, num_threads)
+        logger.debug("layer_permutation: trials %s-%s, best distance = %s",
+                     trial, trial + batch - 1, dist)
+        if index != -1 and depth_step < best_depth:
             logger.debug("layer_permutation: got circuit with improved depth %s",
                          depth_step)
             best_edges = optim_edges
             best_layout = trial_layout
-            best_depth = min(best_depth, depth_step)
-
-        # Break out of trial loop if we found a depth 1 circuit
-        # since we can't improve it further
-        if best_depth == 1:
-            break
+            best_depth = depth_step
+        if best_depth == 1 and index < batch - 1:
+            rng.set_state(state)
+            rng.normal(0.0, 1.0 / num_qubits, size=(index + 1, num_rands))
+        trial += batch
 
     # If we have no best circuit for this layer, all of the
     # trials have failed
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A pass for choosing a Layout of a circuit onto a Coupling graph, under which
+every two-qubit gate of the circuit acts on coupled qubits.
+
+The interaction graph of the circuit, with an edge between every two qubits
+sharing a gate, is matched onto the undirected coupling graph with a VF2-style
+depth-first search: the qubits are placed one at a time, each next to an
+already placed neighbor, on a physical qubit coupled to the physical qubits of
+all its placed neighbors. If such a layout exists and is found within the call
+and time limits, it is set in `property_set` and the circuit needs no SWAPs.
+Otherwise the layout is left unset, for another layout pass to choose. The
+outcome of the search is set in the property `VF2Layout_stop_reason`.
+"""
+
+import time
+
+from qiskit.transpiler import Layout
+from qiskit.transpiler.basepasses import AnalysisPass
+from qiskit.transpiler.exceptions import TranspilerError
+
+# Operations that do not need their qubits to be coupled
+_DIRECTIVES = {"barrier", "snapshot", "save", "load", "noise"}
+
+# Values of the property VF2Layout_stop_reason
+SOLUTION_FOUND = 'solution found'
+NO_SOLUTION = 'nonexistent solution'
+CALL_LIMIT_REACHED = 'call limit reached'
+TIME_LIMIT_REACHED = 'time limit reached'
+
+
+class VF2Layout(AnalysisPass):
+    """
+    Chooses a Layout under which the circuit fits the coupling map without SWAPs,
+    if there is one.
+    """
+
+    def __init__(self, coupling_map, call_limit=100000, time_limit=None):
+        """
+        Chooses a VF2Layout
+
+        Args:
+            coupling_map (CouplingMap): directed graph representing a coupling map.
+            call_limit (int): maximum number of placements tried by the search,
+                or None for no limit.
+            time_limit (float): maximum time of the search in seconds, or None
+                for no limit.
+        """
+        super().__init__()
+        self.coupling_map = coupling_map
+        self.call_limit = call_limit
+        self.time_limit = time_limit
+
+    def run(self, dag):
+        """
+        Search a layout under which the two-qubit gates of the circuit are on
+        coupled qubits, set the property `layout` if one is found, and the
+        property `VF2Layout_stop_reason` to the outcome of the search.
+
+        Args:
+            dag (DAGCircuit): DAG to find layout for.
+
+        Raises:
+            TranspilerError: if dag wider than self.coupling_map
+        """
+        qubits = dag.qubits()
+        if len(qubits) > self.coupling_map.size():
+            raise TranspilerError('Number of qubits greater than device.')
+
+        qubit_indices = {qubit: index for index, qubit in enumerate(qubits)}
+        virtual_neighbors = [set() for _ in qubits]
+        for node in dag.op_nodes():
+            if node.name in _DIRECTIVES or len(node.qargs) < 2:
+                continue
+            indices = [qubit_indices[qubit] for qubit in node.qargs]
+            for virtual in indices:
+                virtual_neighbors[virtual].update(indices)
+                virtual_neighbors[virtual].discard(virtual)
+
+        physical_neighbors = {physical: set() for physical in self.coupling_map.physical_qubits}
+        for source, target in self.coupling_map.get_edges():
+            physical_neighbors[source].add(target)
+            physical_neighbors[target].add(source)
+
+        deadline = None if self.time_limit is None else time.time() + self.time_limit
+        mapping, stop_reason = _match(virtual_neighbors, physical_neighbors,
+                                      self.call_limit, deadline)
+        self.property_set['VF2Layout_stop_reason'] = stop_reason
+        if mapping is None:
+            return
+
+        # The qubits without two-qubit gates go on the unused physical qubits
+        free = iter(sorted(set(physical_neighbors) - set(mapping.values())))
+        self.property_set['layout'] = Layout({
+            qubit: mapping[index] if index in mapping else next(free)
+            for index, qubit in enumerate(qubits)})
+
+
+def _match(virtual_neighbors, physical_neighbors, call_limit, deadline):
+    """Search a mapping of the interacting virtual qubits onto physical qubits
+    that maps every virtual edge onto a physical edge.
+
+    Args:
+        virtual_neighbors (list[set]): the neighbors of each virtual qubit.
+        physical_neighbors (dict): the set of neighbors of each physical qubit.
+        call_limit (int): maximum number of placements tried, or None.
+        deadline (float): time at which the search gives up, or None.
+
+    Returns:
+        tuple(dict, str): the physical qubit of each virtual qubit with
+            neighbors, or None if no mapping was found, and the reason the
+            search stopped.
+    """
+    order, placed_neighbors = _search_order(virtual_neighbors)
+    if not order:
+        return {}, SOLUTION_FOUND
+    physical_degree = {physical: len(neighbors)
+                       for physical, neighbors in physical_neighbors.items()}
+    # The i-th highest virtual degree cannot exceed the i-th highest physical one
+    virtual_degrees = sorted((len(virtual_neighbors[virtual]) for virtual in order),
+                             reverse=True)
+    physical_degrees = sorted(physical_degree.values(), reverse=True)
+    if any(virtual > physical for virtual, physical in zip(virtual_degrees, physical_degrees)):
+        return None, NO_SOLUTION
+    all_physical = sorted(physical_neighbors)
+
+    mapping = {}
+    used = set()
+
+    def candidates(position):
+        virtual = order[position]
+        placed = [mapping[neighbor] for neighbor in placed_neighbors[position]]
+        pool = physical_neighbors[placed[0]] if placed else all_physical
+        degree = len(virtual_neighbors[virtual])
+        return iter(sorted(physical for physical in pool
+                           if physical not in used and physical_degree[physical] >= degree
+                           and all(other in physical_neighbors[physical]
+                                   for other in placed[1:])))
+
+    stack = [candidates(0)]
+    calls = 0
+    while stack:
+        position = len(stack) - 1
+        virtual = order[position]
+        if virtual in mapping:
+            used.discard(mapping.pop(virtual))
+        physical = next(stack[-1], None)
+        if physical is None:
+            stack.pop()
+            continue
+        calls += 1
+        if call_limit is not None and calls > call_limit:
+            return None, CALL_LIMIT_REACHED
+        if deadline is not None and calls % 1000 == 0 and time.time() > deadline:
+            return None, TIME_LIMIT_REACHED
+        mapping[virtual] = physical
+        used.add(physical)
+        if position + 1 == len(order):
+            return mapping, SOLUTION_FOUND
+        stack.append(candidates(position + 1))
+    return None, NO_SOLUTION
+
+
+def _search_order(virtual_neighbors):
+    """Return the order in which the interacting virtual qubits are placed.
+
+    Each qubit is the one with the most placed neighbors, and then the most
+    neighbors, so that its candidates are the most constrained.
+
+    Returns:
+        tuple(list, list): the virtual qubits in order, and the neighbors of
+            each that are placed before it.
+    """
+    remaining = {virtual for virtual, neighbors in enumerate(virtual_neighbors) if neighbors}
+    num_placed_neighbors = dict.fromkeys(remaining, 0)
+    order = []
+    placed_neighbors = []
+    while remaining:
+        virtual = max(remaining, key=lambda qubit: (num_placed_neighbors[qubit],
+                                                    len(virtual_neighbors[qubit]), -qubit))
+        remaining.remove(virtual)
+        order.append(virtual)
+        placed_neighbors.append([neighbor for neighbor in virtual_neighbors[virtual]
+                                 if neighbor not in remaining])
+        for neighbor in virtual_neighbors[virtual]:
+            if neighbor in remaining:
+                num_placed_neighbors[neighbor] += 1
+    return order, placed_neighbors
@@ -56,7 +56,7 @@ class MergeAdjacentBarriers(TransformationPass):
             return dag
 
         # add the merged barriers to a new DAG
-        new_dag = DAGCircuit()
+        new_dag = DAGCircuit(storage=dag.storage)
 
         for qreg in dag.qregs.values():
             new_dag.add_qreg(qreg)
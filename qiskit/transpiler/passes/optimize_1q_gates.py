@@ -165,6 +165,11 @@ class Optimize1qGates(TransformationPass):
                 if right_name == "u1" and np.mod(right_parameters[2], (2 * np.pi)) == 0:
                     right_name = "nop"
 
+            # A lone gate that simplifies to a gate of its own kind is left as
+            # it is, so that the DAG is only modified when something changed.
+            if len(run) == 1 and right_name == run[0].name:
+                continue
+
             # Replace the the first node in the run with a dummy DAG which contains a dummy
             # qubit. The name is irrelevant, because substitute_node_with_dag will take care of
             # putting it in the right place.
@@ -17,7 +17,7 @@
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.exceptions import QiskitError
-from qiskit.circuit import Parameter
+from qiskit.circuit import Instruction, Parameter
 
 
 class Unroller(TransformationPass):
@@ -47,6 +47,12 @@ class Unroller(TransformationPass):
         Returns:
             DAGCircuit: output unrolled dag
         """
+        return self._unroll(dag, {})
+
+    def _unroll(self, dag, unrolled):
+        """Expand all op nodes of dag, reusing the unrolled decompositions
+        of equivalent operations collected in unrolled."""
+        substitutions = {}
         # Walk through the DAG and expand each non-basis node
         for node in dag.op_nodes():
             basic_insts = ['measure', 'reset', 'barrier', 'snapshot']
@@ -58,28 +64,52 @@ class Unroller(TransformationPass):
             if node.name in self.basis:  # If already a base, ignore.
                 continue
 
-            # TODO: allow choosing other possible decompositions
-            try:
-                rule = node.op.definition
-            except TypeError as err:
-                if any(isinstance(p, Parameter) for p in node.op.params):
-                    raise QiskitError('Unrolling gates parameterized by expressions '
-                                      'is currently unsupported.')
-                else:
-                    raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
-
-            if not rule:
-                raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
-                                  "No rule to expand instruction %s." %
-                                  (str(self.basis), node.op.name))
-
-            # hacky way to build a dag on the same register as the rule is defined
-            # TODO: need anonymous rules to address wires by index
-            decomposition = DAGCircuit()
-            decomposition.add_qreg(rule[0][1][0][0])
-            for inst in rule:
-                decomposition.apply_operation_back(*inst)
-
-            unrolled_dag = self.run(decomposition)  # recursively unroll ops
-            dag.substitute_node_with_dag(node, unrolled_dag)
+            key = _decomposition_key(node.op)
+            unrolled_dag = unrolled.get(key) if key is not None else None
+            if unrolled_dag is None:
+                # TODO: allow choosing other possible decompositions
+                try:
+                    rule = node.op.definition
+                except TypeError as err:
+                    if any(isinstance(p, Parameter) for p in node.op.params):
+                        raise QiskitError('Unrolling gates parameterized by expressions '
+                                          'is currently unsupported.')
+                    else:
+                        raise QiskitError('Error decomposing node {}: {}'.format(node.name, err))
+
+                if not rule:
+                    raise QiskitError("Cannot unroll the circuit to the given basis, %s. "
+                                      "No rule to expand instruction %s." %
+                                      (str(self.basis), node.op.name))
+
+                # hacky way to build a dag on the same register as the rule is defined
+                # TODO: need anonymous rules to address wires by index
+                decomposition = DAGCircuit()
+                decomposition.add_qreg(rule[0][1][0][0])
+                for inst in rule:
+                    decomposition.apply_operation_back(*inst)
+
+                unrolled_dag = self._unroll(decomposition, unrolled)  # recursively unroll ops
+                if key is not None:
+                    unrolled[key] = unrolled_dag
+            substitutions[node] = unrolled_dag
+        dag.substitute_nodes(substitutions)
         return dag
+
+
+def _decomposition_key(op):
+    """Return a key shared by the operations having the same decomposition
+    as op, or None if op must be decomposed on its own.
+
+    Operations of a class that builds its definition from its parameters have
+    the same decomposition when their parameters are equal. Other definitions
+    may have been attached to a single instance.
+    """
+    if type(op)._define is Instruction._define:
+        return None
+    key = (type(op), op.name, op.num_qubits, op.num_clbits, tuple(op.params))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
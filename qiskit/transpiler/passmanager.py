@@ -13,10 +13,13 @@
 
 """PassManager class for the transpiler."""
 
+import time
+import tracemalloc
 from functools import partial
 from collections import OrderedDict
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.tools.events.pubsub import Publisher
 from .propertyset import PropertySet
 from .basepasses import BasePass
 from .fencedobjs import FencedPropertySet, FencedDAGCircuit
@@ -24,12 +27,20 @@ from .exceptions import TranspilerError
 
 
 class PassManager():
-    """A PassManager schedules the passes"""
+    """A PassManager schedules the passes
+
+    Events:
+        terra.transpiler.pass.done: A pass has run. It is published with the
+            same keyword arguments as the PassManager callback, and only
+            measured when there is a subscriber or a callback.
+    """
 
     def __init__(self, passes=None,
                  ignore_requires=None,
                  ignore_preserves=None,
-                 max_iteration=None):
+                 max_iteration=None,
+                 callback=None,
+                 skip_unchanged=False):
         """
         Initialize an empty PassManager object (with no passes scheduled).
 
@@ -42,6 +53,26 @@ class PassManager():
                 default setting in the pass is False.
             max_iteration (int): The schedule looping iterates until the condition is met or until
                 max_iteration is reached.
+            skip_unchanged (bool): The schedule skips the passes that already ran on the
+                same dag, and ends do-while loops after an iteration leaves the dag
+                unchanged. This requires passes to only modify the dag through its
+                methods, and to only depend on the dag and the property set. The
+                default setting is False.
+            callback (callable): Called after each pass with the keyword arguments:
+
+                * pass_ (BasePass): the pass that ran.
+                * name (str): the name of the pass class.
+                * time (float): the wall time of the pass, in seconds.
+                * memory (int or None): the peak memory allocated by the pass, in
+                  bytes, if ``tracemalloc`` is tracing, else None. The traces are
+                  not reset, so for a pass that stays below an earlier peak of
+                  the traced memory, this is the memory it kept allocated.
+                * size_before, depth_before, size_after, depth_after (int): the
+                  size and depth of the dag before and after the pass.
+                * iteration (int): the iteration of the enclosing do-while loop,
+                  counting from 1, or 1 outside of a loop.
+                * dag (DAGCircuit): the dag after the pass.
+                * property_set (PropertySet): the property set after the pass.
         """
         # the pass manager's schedule of passes, including any control-flow.
         # Populated via PassManager.append().
@@ -56,10 +87,20 @@ class PassManager():
         # passes already run that have not been invalidated
         self.valid_passes = set()
 
+        # number of transformation passes that changed the dag in this run
+        self.dag_changes = 0
+        # number of runs, which separates the do-while iterations of each run
+        self._runs = 0
+
         # pass manager's overriding options for the passes it runs (for debugging)
         self.passmanager_options = {'ignore_requires': ignore_requires,
                                     'ignore_preserves': ignore_preserves,
                                     'max_iteration': max_iteration}
+        # called after each pass with its measurements
+        self.callback = callback
+        # skip the passes that would run on an unchanged dag
+        self.skip_unchanged = skip_unchanged
+
         if passes is not None:
             self.append(passes)
 
@@ -119,6 +160,10 @@ class PassManager():
             else:
                 raise TranspilerError('The flow controller parameter %s is not callable' % name)
 
+        if 'do_while' in flow_controller_conditions:
+            flow_controller_conditions['do_while'] = self._while_changing(
+                flow_controller_conditions['do_while'])
+
         self.working_list.append(
             FlowController.controller_factory(passes, options, **flow_controller_conditions))
 
@@ -126,6 +171,22 @@ class PassManager():
         """ "Resets the pass manager instance """
         self.valid_passes = set()
         self.property_set.clear()
+        self.dag_changes = 0
+        self._runs += 1
+
+    def _while_changing(self, do_while):
+        """Return a do-while condition that is also False, when skip_unchanged
+        is set, after an iteration in which no transformation pass changed the dag."""
+        last = {'run': None, 'dag_changes': None}
+
+        def _do_while():
+            if self.skip_unchanged and last['run'] == self._runs and \
+                    last['dag_changes'] == self.dag_changes:
+                return False
+            last['run'], last['dag_changes'] = self._runs, self.dag_changes
+            return do_while()
+
+        return _do_while
 
     def run(self, circuit):
         """Run all the passes on a QuantumCircuit
@@ -139,59 +200,146 @@ class PassManager():
         name = circuit.name
         dag = circuit_to_dag(circuit)
         del circuit
+        circuit = dag_to_circuit(self.run_dag(dag))
+        circuit.name = name
+        return circuit
+
+    def run_dag(self, dag):
+        """Run all the passes on a DAGCircuit
+
+        Pipelines chaining several pass managers, or feeding the result to
+        ``assemble()``, can use it to avoid converting to a QuantumCircuit
+        and back between them. The passes may modify the input dag.
+
+        Args:
+            dag (DAGCircuit): dag to transform via all the registered passes
+
+        Returns:
+            DAGCircuit: Transformed dag.
+        """
+        name = dag.name
         self.reset()  # Reset passmanager instance before starting
 
         for passset in self.working_list:
             for pass_ in passset:
-                dag = self._do_pass(pass_, dag, passset.options)
+                dag = self._do_pass(pass_, dag, passset.options, passset.iteration)
 
-        circuit = dag_to_circuit(dag)
-        circuit.name = name
-        return circuit
+        dag.name = name
+        return dag
 
-    def _do_pass(self, pass_, dag, options):
+    def _do_pass(self, pass_, dag, options, iteration=1):
         """Do a pass and its "requires".
 
         Args:
             pass_ (BasePass): Pass to do.
             dag (DAGCircuit): The dag on which the pass is ran.
             options (dict): PassManager options.
+            iteration (int): The iteration of the enclosing flow controller.
         Returns:
             DAGCircuit: The transformed dag in case of a transformation pass.
             The same input dag in case of an analysis pass.
-        Raises:
-            TranspilerError: If the pass is not a proper pass instance.
         """
 
         # First, do the requires of pass_
         if not options["ignore_requires"]:
             for required_pass in pass_.requires:
-                dag = self._do_pass(required_pass, dag, options)
+                dag = self._do_pass(required_pass, dag, options, iteration)
 
         # Run the pass itself, if not already run
         if pass_ not in self.valid_passes:
-            if pass_.is_transformation_pass:
-                pass_.property_set = self.fenced_property_set
-                new_dag = pass_.run(dag)
-                if not isinstance(new_dag, DAGCircuit):
-                    raise TranspilerError("Transformation passes should return a transformed dag."
-                                          "The pass %s is returning a %s" % (type(pass_).__name__,
-                                                                             type(new_dag)))
-                dag = new_dag
-            elif pass_.is_analysis_pass:
-                pass_.property_set = self.property_set
-                pass_.run(FencedDAGCircuit(dag))
+            dag_before, version_before = dag, dag.version
+            layout_before = self._layout_state()
+            if self.callback is not None or \
+                    Publisher().has_subscribers("terra.transpiler.pass.done"):
+                dag = self._run_measured_pass(pass_, dag, iteration)
             else:
-                raise TranspilerError("I dont know how to handle this type of pass")
+                dag = self._run_pass(pass_, dag)
+            changed = dag is not dag_before or dag.version != version_before
 
             # update the valid_passes property
-            self._update_valid_passes(pass_, options['ignore_preserves'])
+            self._update_valid_passes(pass_, options['ignore_preserves'], changed,
+                                      self._layout_state() != layout_before)
+
+        return dag
+
+    def _run_measured_pass(self, pass_, dag, iteration):
+        """Run a pass, and report its measurements to the callback and the
+        subscribers of terra.transpiler.pass.done."""
+        size_before, depth_before = dag.size(), dag.depth()
+        # The traces and peak of tracemalloc may be the caller's, so they are
+        # left alone and the pass is measured against their state before it
+        memory_start = None
+        if tracemalloc.is_tracing():
+            memory_start, peak_start = tracemalloc.get_traced_memory()
+
+        start = time.perf_counter()
+        dag = self._run_pass(pass_, dag)
+        wall_time = time.perf_counter() - start
+
+        memory = None
+        if memory_start is not None:
+            memory_end, peak_end = tracemalloc.get_traced_memory()
+            # Below the earlier peak, only the net allocation of the pass is seen
+            memory = peak_end - memory_start if peak_end > peak_start else \
+                max(memory_end - memory_start, 0)
+
+        measurements = {'pass_': pass_,
+                        'name': type(pass_).__name__,
+                        'time': wall_time,
+                        'memory': memory,
+                        'size_before': size_before,
+                        'depth_before': depth_before,
+                        'size_after': dag.size(),
+                        'depth_after': dag.depth(),
+                        'iteration': iteration,
+                        'dag': dag,
+                        'property_set': self.property_set}
+        if self.callback is not None:
+            self.callback(**measurements)
+        Publisher().publish("terra.transpiler.pass.done", **measurements)
+        return dag
 
+    def _run_pass(self, pass_, dag):
+        """Run a single pass, without its requires.
+
+        Returns:
+            DAGCircuit: The transformed dag, or the input dag for an analysis pass.
+        Raises:
+            TranspilerError: If the pass is not a proper pass instance.
+        """
+        if pass_.is_transformation_pass:
+            pass_.property_set = self.fenced_property_set
+            new_dag = pass_.run(dag)
+            if not isinstance(new_dag, DAGCircuit):
+                raise TranspilerError("Transformation passes should return a transformed dag."
+                                      "The pass %s is returning a %s" % (type(pass_).__name__,
+                                                                         type(new_dag)))
+            dag = new_dag
+        elif pass_.is_analysis_pass:
+            pass_.property_set = self.property_set
+            pass_.run(FencedDAGCircuit(dag))
+        else:
+            raise TranspilerError("I dont know how to handle this type of pass")
         return dag
 
-    def _update_valid_passes(self, pass_, ignore_preserves):
+    def _layout_state(self):
+        """The layout in the property set and its mapping, to tell whether a pass changed it."""
+        layout = self.property_set['layout']
+        if layout is None:
+            return None
+        return layout, dict(layout.get_physical_bits())
+
+    def _update_valid_passes(self, pass_, ignore_preserves, changed=True, layout_changed=False):
+        if layout_changed:
+            # The passes that ran depend on the layout they saw, e.g. CheckMap
+            self.valid_passes.clear()
         self.valid_passes.add(pass_)
         if not pass_.is_analysis_pass:  # Analysis passes preserve all
+            if changed:
+                self.dag_changes += 1
+            elif self.skip_unchanged:
+                # An unchanged dag preserves all
+                return
             if ignore_preserves:
                 self.valid_passes.clear()
             else:
@@ -215,6 +363,9 @@ class FlowController():
 
     registered_controllers = OrderedDict()
 
+    # Iteration of the pass being yielded, counting from 1
+    iteration = 1
+
     def __init__(self, passes, options, **partial_controller):
         self._passes = passes
         self.passes = FlowController.controller_factory(passes, options, **partial_controller)
@@ -309,7 +460,8 @@ class DoWhileController(FlowController):
         super().__init__(passes, options, **partial_controller)
 
     def __iter__(self):
-        for _ in range(self.max_iteration):
+        for iteration in range(1, self.max_iteration + 1):
+            self.iteration = iteration
             for pass_ in self.passes:
                 yield pass_
 
@@ -27,6 +27,7 @@ from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import LegacySwap
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
+from qiskit.transpiler.preset_passmanagers.methods import layout_pass, routing_pass
 
 
 def default_pass_manager(transpile_config):
@@ -43,19 +44,26 @@ def default_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
-    pass_manager = PassManager()
+    layout_method = getattr(transpile_config, 'layout_method', None)
+    routing_method = getattr(transpile_config, 'routing_method', None)
+    pass_manager = PassManager(skip_unchanged=True)
     pass_manager.append(SetLayout(initial_layout))
     pass_manager.append(Unroller(basis_gates))
 
-    # Use the trivial layout if no layout is found
-    pass_manager.append(TrivialLayout(coupling_map),
-                        condition=lambda property_set: not property_set['layout'])
-
-    # if the circuit and layout already satisfy the coupling_constraints, use that layout
-    # otherwise layout on the most densely connected physical qubit subset
-    pass_manager.append(CheckMap(coupling_map))
-    pass_manager.append(DenseLayout(coupling_map),
-                        condition=lambda property_set: not property_set['is_swap_mapped'])
+    if layout_method:
+        # Use the layout of the given method if no layout is given
+        pass_manager.append(layout_pass(layout_method, transpile_config),
+                            condition=lambda property_set: not property_set['layout'])
+    else:
+        # Use the trivial layout if no layout is found
+        pass_manager.append(TrivialLayout(coupling_map),
+                            condition=lambda property_set: not property_set['layout'])
+
+        # if the circuit and layout already satisfy the coupling_constraints, use that layout
+        # otherwise layout on the most densely connected physical qubit subset
+        pass_manager.append(CheckMap(coupling_map))
+        pass_manager.append(DenseLayout(coupling_map),
+                            condition=lambda property_set: not property_set['is_swap_mapped'])
 
     # Extend the the dag/layout with ancillas using the full coupling map
     pass_manager.append(FullAncillaAllocation(coupling_map))
@@ -66,7 +74,10 @@ def default_pass_manager(transpile_config):
 
     # Swap mapper
     pass_manager.append(BarrierBeforeFinalMeasurements())
-    pass_manager.append(LegacySwap(coupling_map, trials=20, seed=seed_transpiler))
+    if routing_method:
+        pass_manager.append(routing_pass(routing_method, transpile_config))
+    else:
+        pass_manager.append(LegacySwap(coupling_map, trials=20, seed=seed_transpiler))
 
     # Expand swaps
     pass_manager.append(Decompose(SwapGate))
@@ -95,7 +106,7 @@ def default_pass_manager_simulator(transpile_config):
     """
     basis_gates = transpile_config.basis_gates
 
-    pass_manager = PassManager()
+    pass_manager = PassManager(skip_unchanged=True)
     pass_manager.append(Unroller(basis_gates))
     pass_manager.append([RemoveResetInZeroState(), Depth(), FixedPoint('depth')],
                         do_while=lambda property_set: not property_set['depth_fixed_point'])
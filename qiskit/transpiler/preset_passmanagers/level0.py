@@ -33,6 +33,7 @@ from qiskit.transpiler.passes import LegacySwap
 from qiskit.transpiler.passes import FullAncillaAllocation
 from qiskit.transpiler.passes import EnlargeWithAncilla
 from qiskit.transpiler.passes import RemoveResetInZeroState
+from qiskit.transpiler.preset_passmanagers.methods import layout_pass, routing_pass
 
 
 def level_0_pass_manager(transpile_config):
@@ -57,6 +58,8 @@ def level_0_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
+    layout_method = getattr(transpile_config, 'layout_method', None)
+    routing_method = getattr(transpile_config, 'routing_method', None)
 
     # 1. Use trivial layout if no layout given
     _given_layout = SetLayout(initial_layout)
@@ -65,6 +68,8 @@ def level_0_pass_manager(transpile_config):
         return not property_set['layout']
 
     _choose_layout = TrivialLayout(coupling_map)
+    if layout_method:
+        _choose_layout = layout_pass(layout_method, transpile_config)
 
     # 2. Extend dag/layout with ancillas using the full coupling map
     _embed = [FullAncillaAllocation(coupling_map), EnlargeWithAncilla()]
@@ -79,6 +84,7 @@ def level_0_pass_manager(transpile_config):
         return not property_set['is_swap_mapped']
 
     _swap = [BarrierBeforeFinalMeasurements(),
+             routing_pass(routing_method, transpile_config) if routing_method else
              LegacySwap(coupling_map, trials=20, seed=seed_transpiler),
              Decompose(SwapGate)]
 
@@ -92,7 +98,7 @@ def level_0_pass_manager(transpile_config):
     # 6. Remove zero-state reset
     _reset = RemoveResetInZeroState()
 
-    pm0 = PassManager()
+    pm0 = PassManager(skip_unchanged=True)
     if coupling_map:
         pm0.append(_given_layout)
         pm0.append(_choose_layout, condition=_choose_layout_condition)
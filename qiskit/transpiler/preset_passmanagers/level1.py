@@ -30,6 +30,9 @@ from qiskit.transpiler.passes import CXDirection
 from qiskit.transpiler.passes import SetLayout
 from qiskit.transpiler.passes import TrivialLayout
 from qiskit.transpiler.passes import DenseLayout
+from qiskit.transpiler.passes import VF2Layout
+from qiskit.transpiler.passes.mapping.vf2_layout import SOLUTION_FOUND
+from qiskit.transpiler.passes import ApplyLayout
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import LegacySwap
 from qiskit.transpiler.passes import FullAncillaAllocation
@@ -38,6 +41,7 @@ from qiskit.transpiler.passes import FixedPoint
 from qiskit.transpiler.passes import Depth
 from qiskit.transpiler.passes import RemoveResetInZeroState
 from qiskit.transpiler.passes import Optimize1qGates
+from qiskit.transpiler.preset_passmanagers.methods import layout_pass, routing_pass
 
 
 def level_1_pass_manager(transpile_config):
@@ -64,6 +68,8 @@ def level_1_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
+    layout_method = getattr(transpile_config, 'layout_method', None)
+    routing_method = getattr(transpile_config, 'routing_method', None)
 
     # 1. Use trivial layout if no layout given
     _given_layout = SetLayout(initial_layout)
@@ -72,12 +78,21 @@ def level_1_pass_manager(transpile_config):
         return not property_set['layout']
 
     _choose_layout = TrivialLayout(coupling_map)
+    if layout_method:
+        _choose_layout = layout_pass(layout_method, transpile_config)
 
-    # 2. Use a better layout on densely connected qubits, if circuit needs swaps
+    # 2. Use a layout that needs no swaps, if circuit needs swaps and there is one,
+    #    or else a better layout on densely connected qubits
     _layout_check = CheckMap(coupling_map)
 
+    def _perfect_layout_condition(property_set):
+        return initial_layout is None and not property_set['is_swap_mapped']
+
+    _perfect_layout = VF2Layout(coupling_map, call_limit=10000)
+
     def _improve_layout_condition(property_set):
-        return not property_set['is_swap_mapped']
+        return not property_set['is_swap_mapped'] and \
+            property_set['VF2Layout_stop_reason'] != SOLUTION_FOUND
 
     _improve_layout = DenseLayout(coupling_map)
 
@@ -94,9 +109,17 @@ def level_1_pass_manager(transpile_config):
         return not property_set['is_swap_mapped']
 
     _swap = [BarrierBeforeFinalMeasurements(),
+             routing_pass(routing_method, transpile_config) if routing_method else
              LegacySwap(coupling_map, trials=20, seed=seed_transpiler),
              Decompose(SwapGate)]
 
+    # Under the layout of VF2Layout no swaps are needed, so only apply it
+    def _apply_layout_condition(property_set):
+        return property_set['is_swap_mapped'] and \
+            property_set['VF2Layout_stop_reason'] == SOLUTION_FOUND
+
+    _apply_layout = ApplyLayout()
+
     # 5. Fix any bad CX directions
     # _direction_check = CheckCXDirection(coupling_map)  # TODO
     def _direction_condition(property_set):
@@ -115,17 +138,20 @@ def level_1_pass_manager(transpile_config):
 
     _opt = [Optimize1qGates(), CXCancellation()]
 
-    pm1 = PassManager()
+    pm1 = PassManager(skip_unchanged=True)
     if coupling_map:
         pm1.append(_given_layout)
         pm1.append(_choose_layout, condition=_choose_layout_condition)
-        pm1.append(_layout_check)
-        pm1.append(_improve_layout, condition=_improve_layout_condition)
+        if not layout_method:
+            pm1.append(_layout_check)
+            pm1.append(_perfect_layout, condition=_perfect_layout_condition)
+            pm1.append(_improve_layout, condition=_improve_layout_condition)
         pm1.append(_embed)
     pm1.append(_unroll)
     if coupling_map:
         pm1.append(_swap_check)
         pm1.append(_swap, condition=_swap_condition)
+        pm1.append(_apply_layout, condition=_apply_layout_condition)
         # pm1.append(_direction_check)  # TODO
         pm1.append(_direction, condition=_direction_condition)
     pm1.append(_reset)
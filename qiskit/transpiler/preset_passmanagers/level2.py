@@ -30,6 +30,9 @@ from qiskit.transpiler.passes import CXDirection
 from qiskit.transpiler.passes import SetLayout
 from qiskit.transpiler.passes import DenseLayout
 from qiskit.transpiler.passes import NoiseAdaptiveLayout
+from qiskit.transpiler.passes import VF2Layout
+from qiskit.transpiler.passes.mapping.vf2_layout import SOLUTION_FOUND
+from qiskit.transpiler.passes import ApplyLayout
 from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
 from qiskit.transpiler.passes import LegacySwap
 from qiskit.transpiler.passes import FullAncillaAllocation
@@ -39,6 +42,7 @@ from qiskit.transpiler.passes import Depth
 from qiskit.transpiler.passes import RemoveResetInZeroState
 from qiskit.transpiler.passes import Optimize1qGates
 from qiskit.transpiler.passes import CommutativeCancellation
+from qiskit.transpiler.preset_passmanagers.methods import layout_pass, routing_pass
 
 
 def level_2_pass_manager(transpile_config):
@@ -67,17 +71,24 @@ def level_2_pass_manager(transpile_config):
     coupling_map = transpile_config.coupling_map
     initial_layout = transpile_config.initial_layout
     seed_transpiler = transpile_config.seed_transpiler
+    layout_method = getattr(transpile_config, 'layout_method', None)
+    routing_method = getattr(transpile_config, 'routing_method', None)
     backend_properties = transpile_config.backend_properties
 
-    # 1. Layout on good qubits if calibration info available, otherwise on dense links
+    # 1. Layout that needs no swaps if there is one. Otherwise, layout on good qubits
+    #    if calibration info available, otherwise on dense links
     _given_layout = SetLayout(initial_layout)
 
     def _choose_layout_condition(property_set):
         return not property_set['layout']
 
+    _perfect_layout = VF2Layout(coupling_map)
+
     _choose_layout = DenseLayout(coupling_map)
     if backend_properties:
         _choose_layout = NoiseAdaptiveLayout(backend_properties)
+    if layout_method:
+        _choose_layout = layout_pass(layout_method, transpile_config)
 
     # 2. Extend dag/layout with ancillas using the full coupling map
     _embed = [FullAncillaAllocation(coupling_map), EnlargeWithAncilla()]
@@ -90,9 +101,17 @@ def level_2_pass_manager(transpile_config):
 
     _swap = [BarrierBeforeFinalMeasurements(),
              Unroll3qOrMore(),
+             routing_pass(routing_method, transpile_config) if routing_method else
              LegacySwap(coupling_map),
              Decompose(SwapGate)]
 
+    # Under the layout of VF2Layout no swaps are needed, so only apply it
+    def _apply_layout_condition(property_set):
+        return property_set['is_swap_mapped'] and \
+            property_set['VF2Layout_stop_reason'] == SOLUTION_FOUND
+
+    _apply_layout = ApplyLayout()
+
     # 4. Unroll to the basis
     _unroll = Unroller(basis_gates)
 
@@ -114,15 +133,18 @@ def level_2_pass_manager(transpile_config):
 
     _opt = [Optimize1qGates(), CommutativeCancellation()]
 
-    pm2 = PassManager()
+    pm2 = PassManager(skip_unchanged=True)
     if coupling_map:
         pm2.append(_given_layout)
+        if not layout_method:
+            pm2.append(_perfect_layout, condition=_choose_layout_condition)
         pm2.append(_choose_layout, condition=_choose_layout_condition)
         pm2.append(_embed)
     pm2.append(_unroll)
     if coupling_map:
         pm2.append(_swap_check)
         pm2.append(_swap, condition=_swap_condition)
+        pm2.append(_apply_layout, condition=_apply_layout_condition)
         # pm2.append(_direction_check)  # TODO
         pm2.append(_direction, condition=_direction_condition)
     pm2.append(_reset)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+The layout and routing passes that can be chosen by name in the preset pass managers.
+"""
+
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.passes import TrivialLayout
+from qiskit.transpiler.passes import DenseLayout
+from qiskit.transpiler.passes import NoiseAdaptiveLayout
+from qiskit.transpiler.passes import SabreLayout
+from qiskit.transpiler.passes import BasicSwap
+from qiskit.transpiler.passes import LookaheadSwap
+from qiskit.transpiler.passes import StochasticSwap
+from qiskit.transpiler.passes import LegacySwap
+from qiskit.transpiler.passes import SabreSwap
+
+LAYOUT_METHODS = ('trivial', 'dense', 'noise_adaptive', 'sabre')
+ROUTING_METHODS = ('basic', 'lookahead', 'stochastic', 'legacy', 'sabre')
+
+
+def layout_pass(layout_method, transpile_config):
+    """Return the pass choosing a layout with a layout method.
+
+    Args:
+        layout_method (str): one of LAYOUT_METHODS
+        transpile_config (TranspileConfig): the configuration giving the
+            coupling map, backend properties and seed of the pass.
+
+    Returns:
+        AnalysisPass: the pass setting the property `layout`.
+
+    Raises:
+        TranspilerError: if the method is unknown, or needs backend
+            properties that are not given.
+    """
+    coupling_map = transpile_config.coupling_map
+    if layout_method == 'trivial':
+        return TrivialLayout(coupling_map)
+    if layout_method == 'dense':
+        return DenseLayout(coupling_map)
+    if layout_method == 'noise_adaptive':
+        if not transpile_config.backend_properties:
+            raise TranspilerError("layout_method 'noise_adaptive' needs backend properties.")
+        return NoiseAdaptiveLayout(transpile_config.backend_properties)
+    if layout_method == 'sabre':
+        return SabreLayout(coupling_map, seed=transpile_config.seed_transpiler)
+    raise TranspilerError("Invalid layout_method '%s'. Choose from %s." %
+                          (layout_method, ', '.join(LAYOUT_METHODS)))
+
+
+def routing_pass(routing_method, transpile_config):
+    """Return the pass inserting SWAPs with a routing method.
+
+    Args:
+        routing_method (str): one of ROUTING_METHODS
+        transpile_config (TranspileConfig): the configuration giving the
+            coupling map and seed of the pass.
+
+    Returns:
+        TransformationPass: the pass mapping the circuit onto the coupling map.
+
+    Raises:
+        TranspilerError: if the method is unknown.
+    """
+    coupling_map = transpile_config.coupling_map
+    seed_transpiler = transpile_config.seed_transpiler
+    if routing_method == 'basic':
+        return BasicSwap(coupling_map)
+    if routing_method == 'lookahead':
+        return LookaheadSwap(coupling_map)
+    if routing_method == 'stochastic':
+        return StochasticSwap(coupling_map, trials=20, seed=seed_transpiler)
+    if routing_method == 'legacy':
+        return LegacySwap(coupling_map, trials=20, seed=seed_transpiler)
+    if routing_method == 'sabre':
+        return SabreSwap(coupling_map, seed=seed_transpiler)
+    raise TranspilerError("Invalid routing_method '%s'. Choose from %s." %
+                          (routing_method, ', '.join(ROUTING_METHODS)))
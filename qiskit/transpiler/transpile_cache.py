@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+On-disk cache of transpiled circuits.
+
+Entries are the binary encodings of transpiled circuits, stored in one file
+per key in a local directory. The key combines the fingerprint of the input
+circuit with everything the preset pass managers depend on, so a cached
+circuit is what transpiling the input again would produce. The least
+recently used entries are evicted once the directory outgrows its size limit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+from qiskit.circuit.fingerprint import fingerprint
+from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.version import __version__
+
+DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), '.qiskit', 'transpile_cache')
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+_SUFFIX = '.qkbc'
+
+
+class TranspileCache:
+    """A directory of transpiled circuits, keyed by circuit content and target."""
+
+    def __init__(self, directory=None, max_size=DEFAULT_MAX_SIZE):
+        """Create a TranspileCache
+
+        Args:
+            directory (str): The directory to store the transpiled circuits
+                in. If one isn't specified ~/.qiskit/transpile_cache is used.
+            max_size (int): The size, in bytes, above which the least
+                recently used circuits are evicted.
+        """
+        self.directory = directory if directory is not None else DEFAULT_DIRECTORY
+        self.max_size = max_size
+        self._size = None
+
+    def key(self, circuit, transpile_config):
+        """Return the cache key of transpiling a circuit with a configuration.
+
+        Args:
+            circuit (QuantumCircuit): circuit to transpile
+            transpile_config (TranspileConfig): configuration dictating how to transpile
+
+        Returns:
+            str or None: the hexadecimal key, or None if the result cannot be
+                cached. Circuits with unbound parameters are not cached, as the
+                transpiled circuit must use the caller's Parameter objects, and
+                neither are DAGCircuits or transpilations with a custom pass
+                manager.
+        """
+        if not isinstance(circuit, QuantumCircuit) or circuit.parameters or \
+                getattr(transpile_config, 'pass_manager', None) is not None:
+            return None
+
+        coupling_map = getattr(transpile_config, 'coupling_map', None)
+        if coupling_map is not None:
+            coupling_map = [coupling_map.physical_qubits, coupling_map.get_edges()]
+        initial_layout = getattr(transpile_config, 'initial_layout', None)
+        if initial_layout is not None:
+            initial_layout = [[physical, None] if bit is None else
+                              [physical, bit[0].name, bit[0].size, bit[1]]
+                              for physical, bit in
+                              sorted(initial_layout.get_physical_bits().items())]
+        parts = {
+            'version': __version__,
+            'circuit': circuit.fingerprint(),
+            'registers': [[type(register).__name__, register.name, register.size]
+                          for register in circuit.qregs + circuit.cregs],
+            'definitions': _definition_keys(circuit.data),
+            'basis_gates': getattr(transpile_config, 'basis_gates', None),
+            'coupling_map': coupling_map,
+            'initial_layout': initial_layout,
+            'seed_transpiler': getattr(transpile_config, 'seed_transpiler', None),
+            'optimization_level': getattr(transpile_config, 'optimization_level', None),
+            'layout_method': getattr(transpile_config, 'layout_method', None),
+            'routing_method': getattr(transpile_config, 'routing_method', None),
+            'backend_properties': _properties_digest(
+                getattr(transpile_config, 'backend_properties', None)),
+        }
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key):
+        """Return the encoded circuit stored under a key.
+
+        Args:
+            key (str): a key returned by ``key()``
+
+        Returns:
+            bytes or None: the binary encoding of the transpiled circuit, or
+                None if it is not in the cache.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+            # Mark the entry as recently used
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key, data):
+        """Store an encoded circuit under a key, evicting old entries if needed.
+
+        Args:
+            key (str): a key returned by ``key()``
+            data (bytes): the binary encoding of the transpiled circuit
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        try:
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = 0
+        # Write to a temporary file first so that other processes never read
+        # a partial entry
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+        self._size = self.size() + len(data) - previous
+        if self._size > self.max_size:
+            self._evict()
+
+    def size(self):
+        """Return the total size, in bytes, of the cached circuits."""
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        return self._size
+
+    def clear(self):
+        """Remove all the cached circuits."""
+        for path, _, _ in self._entries():
+            _remove(path)
+        self._size = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def _entries(self):
+        """Return (path, last use, size) of each entry."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def _evict(self):
+        """Remove the least recently used entries until the cache fits in max_size."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        size = sum(entry[2] for entry in entries)
+        for path, _, entry_size in entries:
+            if size <= self.max_size:
+                break
+            _remove(path)
+            size -= entry_size
+        self._size = size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _definition_keys(data, keys=None):
+    """Return the fingerprints of the custom definitions used in ``data``.
+
+    The circuit fingerprint only hashes the name and class of instructions,
+    so instructions built from circuits, whose definition is not generated
+    by their class, also need their definition in the key.
+    """
+    if keys is None:
+        keys = {}
+    for instruction, _, _ in data:
+        definition = instruction._definition
+        if definition is None or type(instruction)._define is not Instruction._define:
+            continue
+        wires = {}
+        for _, qargs, cargs in definition:
+            for wire in qargs + cargs:
+                wires.setdefault(wire)
+        key = fingerprint(list(wires), ((op.name, op, qargs, cargs, op.control)
+                                        for op, qargs, cargs in definition))
+        keys.setdefault(instruction.name, [])
+        if key not in keys[instruction.name]:
+            keys[instruction.name].append(key)
+            _definition_keys(definition, keys)
+    return keys
+
+
+def _properties_digest(backend_properties):
+    """Return a digest of backend properties, or None if there are none."""
+    if backend_properties is None:
+        return None
+    properties = json.dumps(backend_properties.to_dict(), sort_keys=True, default=str)
+    return hashlib.sha256(properties.encode()).hexdigest()
@@ -36,11 +36,32 @@ def transpile_circuit(circuit, transpile_config):
     Raises:
         TranspilerError: if transpile_config is not valid or transpilation incurs error
     """
+    return _select_pass_manager(transpile_config).run(circuit)
+
+
+def transpile_dag(dag, transpile_config):
+    """Select a PassManager and run a single dag through it.
+
+    Args:
+        dag (DAGCircuit): dag to transpile, which the passes may modify
+        transpile_config (TranspileConfig): configuration dictating how to transpile
+
+    Returns:
+        DAGCircuit: transpiled dag
+
+    Raises:
+        TranspilerError: if transpile_config is not valid or transpilation incurs error
+    """
+    return _select_pass_manager(transpile_config).run_dag(dag)
+
+
+def _select_pass_manager(transpile_config):
+    """Return the PassManager to transpile with according to transpile_config."""
     # if the pass manager is not already selected, choose an appropriate one.
     if transpile_config.pass_manager:
         pass_manager = transpile_config.pass_manager
 
-    elif transpile_config.optimization_level:
+    elif transpile_config.optimization_level is not None:
         level = transpile_config.optimization_level
         if level == 0:
             pass_manager = level_0_pass_manager(transpile_config)
@@ -59,4 +80,4 @@ def transpile_circuit(circuit, transpile_config):
     else:
         pass_manager = default_pass_manager_simulator(transpile_config)
 
-    return pass_manager.run(circuit)
+    return pass_manager
@@ -43,7 +43,7 @@ INCLUDE_DIRS = []
 LINK_FLAGS = []
 # If on Win and not in MSYS2 (i.e. Visual studio compile)
 if (sys.platform == 'win32' and os.environ.get('MSYSTEM') is None):
-    COMPILER_FLAGS = ['/O2']
+    COMPILER_FLAGS = ['/O2', '/openmp']
 # Everything else
 else:
     COMPILER_FLAGS = ['-O2', '-funroll-loops', '-std=c++11']
@@ -51,6 +51,11 @@ else:
         # These are needed for compiling on OSX 10.14+
         COMPILER_FLAGS.append('-mmacosx-version-min=10.9')
         LINK_FLAGS.append('-mmacosx-version-min=10.9')
+    else:
+        # Run the StochasticSwap trials on multiple threads. Apple's clang
+        # has no OpenMP, and there the trials run one after another.
+        COMPILER_FLAGS.append('-fopenmp')
+        LINK_FLAGS.append('-fopenmp')
 
 
 EXT_MODULES = []
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of single transpiler passes.
+
+Each pass runs, with the analysis passes it requires, on a snapshot of a
+DAG prepared in setup(), so that every run starts from the same DAG.
+"""
+
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import (StochasticSwap, SabreSwap, SabreLayout, Unroller,
+                                      CommutativeCancellation, Collect2qBlocks,
+                                      ConsolidateBlocks, Optimize1qGates)
+
+from .utils import BASIS_GATES, CIRCUITS, grid_coupling_map
+
+# The grid the circuits of each size are routed on
+GRIDS = {5: (1, 5), 20: (4, 5), 100: (10, 10)}
+
+PASSES = {
+    'StochasticSwap': lambda coupling_map: [StochasticSwap(coupling_map, seed=42)],
+    'SabreSwap': lambda coupling_map: [SabreSwap(coupling_map, seed=42)],
+    'SabreLayout': lambda coupling_map: [SabreLayout(coupling_map, seed=42)],
+    'Unroller': lambda _: [Unroller(BASIS_GATES)],
+    'CommutativeCancellation': lambda _: [CommutativeCancellation()],
+    'ConsolidateBlocks': lambda _: [Collect2qBlocks(), ConsolidateBlocks()],
+    'Optimize1qGates': lambda _: [Optimize1qGates()],
+}
+
+
+class PassBenchmarks:
+    params = (sorted(CIRCUITS), sorted(GRIDS), sorted(PASSES))
+    param_names = ['circuit', 'n_qubits', 'pass']
+    timeout = 300
+
+    def setup(self, circuit_name, n_qubits, pass_name):
+        self.coupling_map = grid_coupling_map(*GRIDS[n_qubits])
+        self.dag = circuit_to_dag(CIRCUITS[circuit_name](n_qubits))
+        if pass_name != 'Unroller':
+            # The other passes run on circuits in the basis
+            self.dag = Unroller(BASIS_GATES).run(self.dag)
+
+    def _run(self, pass_name):
+        # The passes are created for each run, as StochasticSwap keeps the
+        # layout of its first run
+        passmanager = PassManager(PASSES[pass_name](self.coupling_map))
+        return passmanager.run_dag(self.dag.snapshot())
+
+    def time_pass(self, _, __, pass_name):
+        self._run(pass_name)
+
+    def peakmem_pass(self, _, __, pass_name):
+        self._run(pass_name)
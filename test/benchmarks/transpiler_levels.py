@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring,invalid-name,attribute-defined-outside-init
+
+"""Benchmarks of transpile() at each optimization level."""
+
+from qiskit.compiler import transpile
+
+from .utils import BASIS_GATES, CIRCUITS, TARGETS, build
+
+
+class TranspileLevelBenchmarks:
+    params = (sorted(CIRCUITS), [5, 14, 20, 100], sorted(TARGETS), [0, 1, 2, 3])
+    param_names = ['circuit', 'n_qubits', 'target', 'optimization_level']
+    timeout = 600
+
+    def setup(self, circuit_name, n_qubits, target_name, optimization_level):
+        if optimization_level == 3 and n_qubits > 20:
+            # Level 3 routes with LegacySwap, which does not finish on
+            # 100 qubit circuits in a useful time
+            raise NotImplementedError('optimization level 3 is limited to 20 qubits')
+        if circuit_name == 'deep_1q' and n_qubits == 20 and target_name == 'tokyo' \
+                and optimization_level >= 2:
+            # The circuit takes every qubit of Tokyo, and levels 2 and 3 have
+            # failed on it in CXDirection when their layout was not applied
+            raise NotImplementedError('deep_1q on all of tokyo is limited to levels 0 and 1')
+        self.circuit, self.coupling_map = build(circuit_name, n_qubits, target_name)
+
+    def _transpile(self, optimization_level):
+        return transpile(self.circuit, basis_gates=BASIS_GATES,
+                         coupling_map=self.coupling_map, seed_transpiler=42,
+                         optimization_level=optimization_level)
+
+    def time_transpile(self, _, __, ___, optimization_level):
+        self._transpile(optimization_level)
+
+    def peakmem_transpile(self, _, __, ___, optimization_level):
+        self._transpile(optimization_level)
+
+    def track_depth(self, _, __, ___, optimization_level):
+        return self._transpile(optimization_level).depth()
+    track_depth.unit = 'layers'
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Circuits and targets of the transpiler benchmarks."""
+
+import math
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.extensions.unitary import UnitaryGate
+from qiskit.quantum_info.random import random_unitary
+from qiskit.test.mock import FakeMelbourne, FakeRueschlikon, FakeTokyo
+from qiskit.transpiler import CouplingMap
+
+BASIS_GATES = ['u1', 'u2', 'u3', 'cx', 'id']
+
+
+def random_circuit(n_qubits, depth, seed=42):
+    """A layered circuit of random 1 and 2 qubit standard gates, then measurements."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr, name='random_%d_%d' % (n_qubits, depth))
+    one_qubit_gates = [circuit.h, circuit.x, circuit.s, circuit.t, circuit.tdg]
+    two_qubit_gates = [circuit.cx, circuit.cz, circuit.swap]
+    for _ in range(depth):
+        qubits = rng.permutation(n_qubits)
+        index = 0
+        while index < n_qubits:
+            if index + 1 < n_qubits and rng.rand() < 0.5:
+                gate = two_qubit_gates[rng.randint(len(two_qubit_gates))]
+                gate(qr[int(qubits[index])], qr[int(qubits[index + 1])])
+                index += 2
+            elif rng.rand() < 0.5:
+                circuit.u3(*rng.uniform(0, 2 * np.pi, 3), qr[int(qubits[index])])
+                index += 1
+            else:
+                one_qubit_gates[rng.randint(len(one_qubit_gates))](qr[int(qubits[index])])
+                index += 1
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def qft_circuit(n_qubits):
+    """The quantum Fourier transform, with controlled phase rotations."""
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr, name='qft_%d' % n_qubits)
+    for j in range(n_qubits):
+        for k in range(j):
+            circuit.cu1(math.pi / float(2 ** (j - k)), qr[j], qr[k])
+        circuit.h(qr[j])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def quantum_volume_circuit(n_qubits, depth=None, seed=42):
+    """A model circuit of quantum volume: layers of random SU(4) on random pairs."""
+    depth = n_qubits if depth is None else depth
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr, name='quantum_volume_%d_%d' % (n_qubits, depth))
+    for _ in range(depth):
+        qubits = rng.permutation(n_qubits)
+        for pair in range(n_qubits // 2):
+            unitary = random_unitary(4, seed=rng.randint(2 ** 31))
+            circuit.append(UnitaryGate(unitary.data),
+                           [qr[int(qubits[2 * pair])], qr[int(qubits[2 * pair + 1])]])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+def deep_1q_circuit(n_qubits, depth, seed=42):
+    """A deep circuit of runs of single qubit gates between sparse CNOTs."""
+    rng = np.random.RandomState(seed)
+    qr = QuantumRegister(n_qubits, 'q')
+    cr = ClassicalRegister(n_qubits, 'c')
+    circuit = QuantumCircuit(qr, cr, name='deep_1q_%d_%d' % (n_qubits, depth))
+    for layer in range(depth):
+        for qubit in range(n_qubits):
+            circuit.u3(*rng.uniform(0, 2 * np.pi, 3), qr[qubit])
+            circuit.u1(rng.uniform(0, 2 * np.pi), qr[qubit])
+            circuit.h(qr[qubit])
+        if layer % 4 == 3:
+            for qubit in range(layer % 2, n_qubits - 1, 2):
+                circuit.cx(qr[qubit], qr[qubit + 1])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+CIRCUITS = {
+    'random': lambda n_qubits: random_circuit(n_qubits, depth=10),
+    'qft': qft_circuit,
+    'quantum_volume': lambda n_qubits: quantum_volume_circuit(n_qubits, depth=10),
+    'deep_1q': lambda n_qubits: deep_1q_circuit(n_qubits, depth=40),
+}
+
+
+def grid_coupling_map(rows, columns):
+    """A coupling map of a grid of qubits, with both directions of each edge."""
+    edges = []
+    for row in range(rows):
+        for column in range(columns):
+            qubit = row * columns + column
+            if column + 1 < columns:
+                edges += [[qubit, qubit + 1], [qubit + 1, qubit]]
+            if row + 1 < rows:
+                edges += [[qubit, qubit + columns], [qubit + columns, qubit]]
+    return CouplingMap(edges)
+
+
+def line_coupling_map(n_qubits):
+    """A coupling map of a line of qubits, with one direction of each edge."""
+    return CouplingMap([[qubit, qubit + 1] for qubit in range(n_qubits - 1)])
+
+
+def _backend_coupling_map(backend_class):
+    return lambda: CouplingMap(backend_class().configuration().coupling_map)
+
+
+# The coupling map of each target. The backend properties are not used, so
+# that the benchmarks do not depend on calibration data.
+TARGETS = {
+    'melbourne': _backend_coupling_map(FakeMelbourne),
+    'rueschlikon': _backend_coupling_map(FakeRueschlikon),
+    'tokyo': _backend_coupling_map(FakeTokyo),
+    'grid_100': lambda: grid_coupling_map(10, 10),
+    'line_100': lambda: line_coupling_map(100),
+}
+
+
+def build(circuit_name, n_qubits, target_name):
+    """Return a circuit and a coupling map, or raise NotImplementedError,
+    which asv reports as a skipped benchmark, if the target is too small."""
+    coupling_map = TARGETS[target_name]()
+    if n_qubits > coupling_map.size():
+        raise NotImplementedError('%s has fewer than %d qubits' % (target_name, n_qubits))
+    return CIRCUITS[circuit_name](n_qubits), coupling_map
@@ -15,6 +15,7 @@ import qiskit.pulse as pulse
 from qiskit.circuit import Instruction, Parameter
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.compiler.assemble import assemble
+from qiskit.converters import circuit_to_dag
 from qiskit.exceptions import QiskitError
 from qiskit.qobj import QasmQobj
 from qiskit.test import QiskitTestCase
@@ -249,6 +250,62 @@ class TestCircuitAssembler(QiskitTestCase):
         self.assertEqual(qobj.experiments[5].instructions[0].params, [1])
         self.assertEqual(qobj.experiments[5].instructions[1].params, [1])
 
+    def test_assemble_parameter_value_columns(self):
+        """Verify bindings given as value columns assemble like bound circuits."""
+        qr = QuantumRegister(2, name='q')
+        cr = ClassicalRegister(2, name='c')
+        x = Parameter('x')
+        y = Parameter('y')
+        circ = QuantumCircuit(qr, cr, name='circ')
+        circ.rz(x, qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.u3(y, x, 0.5, qr[1])
+        circ.measure(qr, cr)
+        values = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+
+        qobj = assemble(circ, qobj_id='binds',
+                        parameter_binds={x: values[:, 0], y: values[:, 1]})
+        bound_qobj = assemble([circ.bind_parameters({x: x_value, y: y_value})
+                               for x_value, y_value in values], qobj_id='binds')
+
+        self.assertEqual(qobj.to_dict(), bound_qobj.to_dict())
+        # Only the instructions with parameters differ between the experiments
+        self.assertIs(qobj.experiments[0].instructions[1], qobj.experiments[2].instructions[1])
+        self.assertEqual(qobj.experiments[0].instructions[0].params, [0.1])
+        self.assertEqual(qobj.experiments[0].instructions[2].params, [0.2, 0.1, 0.5])
+        self.assertRaises(QiskitError, assemble, circ,
+                          parameter_binds={x: [0.1, 0.2], y: [0.3]})
+
+    def test_assemble_dags(self):
+        """Verify DAGs assemble to the same qobj as their circuits."""
+        qr = QuantumRegister(2, name='q')
+        cr1 = ClassicalRegister(1, name='c1')
+        cr2 = ClassicalRegister(1, name='c2')
+        circ = QuantumCircuit(qr, cr1, cr2, name='circ')
+        circ.h(qr[0])
+        circ.measure(qr[0], cr1[0])
+        circ.x(qr[1]).c_if(cr1, 1)
+        circ.measure(qr[1], cr2[0])
+
+        qobj = assemble(circ, qobj_id='dag')
+        dag_qobj = assemble(circuit_to_dag(circ), qobj_id='dag')
+
+        self.assertEqual(dag_qobj.to_dict(), qobj.to_dict())
+        self.assertEqual(dag_qobj.experiments[0].header.name, 'circ')
+
+    def test_assemble_dags_binds_parameters(self):
+        """Verify parameterized DAGs are bound like circuits."""
+        qr = QuantumRegister(1)
+        x = Parameter('x')
+        circ = QuantumCircuit(qr)
+        circ.rz(x, qr[0])
+
+        qobj = assemble(circuit_to_dag(circ), parameter_binds=[{x: 0}, {x: 1}])
+
+        self.assertEqual(len(qobj.experiments), 2)
+        self.assertEqual(qobj.experiments[1].instructions[0].params, [1])
+        self.assertRaises(QiskitError, assemble, circuit_to_dag(circ))
+
 
 class TestPulseAssembler(QiskitTestCase):
     """Tests for assembling schedules to qobj."""
@@ -16,12 +16,15 @@ from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit import BasicAer
 from qiskit.extensions.standard import CnotGate
 from qiskit.transpiler import PassManager
-from qiskit.compiler import transpile
+from qiskit.compiler import transpile, transpile_iter
+from qiskit.compiler.transpile import (_parse_transpile_args, _share_transpile_options,
+                                       _transpile_circuit)
 from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.test import QiskitTestCase, Path
 from qiskit.test.mock import FakeMelbourne, FakeRueschlikon
-from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements
-from qiskit.transpiler import Layout
+from qiskit.transpiler.passes import BarrierBeforeFinalMeasurements, SabreLayout, SabreSwap
+from qiskit.transpiler import Layout, CouplingMap, TranspilerError
 from qiskit.circuit import Parameter
 
 
@@ -340,6 +343,79 @@ class TestTranspile(QiskitTestCase):
 
         self.assertEqual(mapped_qubits, [4, 6, 10])
 
+    def test_transpile_dags(self):
+        """DAGs are transpiled to DAGs, and left unmodified."""
+        qr1 = QuantumRegister(1, 'qr1')
+        qr2 = QuantumRegister(2, 'qr2')
+        qc = QuantumCircuit(qr1, qr2, name='dag_circuit')
+        qc.h(qr1[0])
+        qc.cx(qr1[0], qr2[0])
+        qc.cx(qr2[1], qr2[0])
+        dag = circuit_to_dag(qc)
+        options = {'coupling_map': [[0, 1], [1, 2]], 'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                   'initial_layout': [2, 1, 0], 'optimization_level': 0}
+
+        new_dag = transpile(dag, **options)
+        new_dags = transpile([dag, dag], **options)
+
+        self.assertIsInstance(new_dag, DAGCircuit)
+        self.assertEqual(new_dag.name, 'dag_circuit')
+        self.assertEqual(new_dag, circuit_to_dag(transpile(qc, **options)))
+        self.assertEqual(new_dags, [new_dag, new_dag])
+        self.assertEqual(dag, circuit_to_dag(qc))
+
+    def test_transpile_iter(self):
+        """transpile_iter yields the transpiled circuits in order, a chunk at a time."""
+        qr = QuantumRegister(3, 'qr')
+        circuits = []
+        for i in range(5):
+            qc = QuantumCircuit(qr, name='circuit%d' % i)
+            qc.h(qr[i % 3])
+            qc.cx(qr[0], qr[1])
+            qc.cx(qr[1], qr[2])
+            circuits.append(qc)
+        options = {'coupling_map': [[0, 1], [1, 2]], 'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                   'initial_layout': [0, 1, 2], 'optimization_level': 1}
+        consumed = []
+
+        def generate():
+            for circuit in circuits:
+                consumed.append(circuit.name)
+                yield circuit
+
+        transpiled = transpile_iter(generate(), chunk_size=2, **options)
+        first = next(transpiled)
+        self.assertEqual(consumed, ['circuit0', 'circuit1'])
+        self.assertEqual([first] + list(transpiled), transpile(circuits, **options))
+        self.assertEqual(len(consumed), 5)
+
+    def test_transpile_iter_bad_chunk_size(self):
+        """transpile_iter checks the chunk size when it is called."""
+        qc = QuantumCircuit(QuantumRegister(1))
+        self.assertRaises(TranspilerError, transpile_iter, [qc], chunk_size=0)
+
+    def test_shared_transpile_options(self):
+        """Options shared by the circuits are sent to the workers once."""
+        qr = QuantumRegister(2, 'qr')
+        circuits = []
+        for i in range(3):
+            qc = QuantumCircuit(qr, name='circuit%d' % i)
+            qc.h(qr[i % 2])
+            qc.cx(qr[0], qr[1])
+            circuits.append(qc)
+        coupling_map = CouplingMap([[0, 1]])
+        transpile_configs = _parse_transpile_args(circuits, None, ['u2', 'cx'], coupling_map,
+                                                  None, [0, 1], None, 1, None)
+
+        option_values, options = _share_transpile_options(transpile_configs)
+
+        self.assertEqual(len([value for value in option_values if value is coupling_map]), 1)
+        self.assertEqual(len(options), 3)
+        for circuit, option, transpile_config in zip(circuits, options, transpile_configs):
+            self.assertIs(option_values[option['coupling_map']], coupling_map)
+            self.assertEqual(_transpile_circuit((circuit, option), option_values),
+                             _transpile_circuit((circuit, transpile_config)))
+
     def test_mapping_multi_qreg(self):
         """Test mapping works for multiple qregs.
         """
@@ -549,6 +625,42 @@ class TestTranspile(QiskitTestCase):
         resources_after = dag_circuit.count_ops()
         self.assertEqual({'h': 3}, resources_after)
 
+    def test_sabre_layout_and_routing(self):
+        """Test transpiling with the sabre layout and routing methods."""
+        qr = QuantumRegister(5, 'q')
+        cr = ClassicalRegister(5, 'c')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        for index in range(1, 5):
+            circuit.cx(qr[0], qr[index])
+        circuit.measure(qr, cr)
+        coupling_map = FakeMelbourne().configuration().coupling_map
+
+        for level in [None, 0, 1, 2, 3]:
+            with self.subTest(optimization_level=level), \
+                    unittest.mock.patch.object(SabreLayout, 'run', autospec=True,
+                                               side_effect=SabreLayout.run) as layout_run, \
+                    unittest.mock.patch.object(SabreSwap, 'run', autospec=True,
+                                               side_effect=SabreSwap.run) as routing_run:
+                result = transpile(circuit, coupling_map=coupling_map,
+                                   basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                   layout_method='sabre', routing_method='sabre',
+                                   optimization_level=level, seed_transpiler=42)
+                self.assertTrue(layout_run.called)
+                self.assertTrue(routing_run.called)
+                cmap = CouplingMap(coupling_map)
+                for node in circuit_to_dag(result).twoQ_gates():
+                    self.assertIn((node.qargs[0][1], node.qargs[1][1]), cmap.get_edges())
+
+    def test_invalid_routing_method(self):
+        """Test that an unknown routing method is rejected."""
+        qr = QuantumRegister(2, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+
+        with self.assertRaises(TranspilerError):
+            transpile(circuit, coupling_map=[[0, 1]], routing_method='fastest')
+
     @unittest.skip('skipping due to MacOS specific failure, unrolling to u2')
     def test_basis_subset(self):
         """Test a transpilation with a basis subset of the standard basis"""
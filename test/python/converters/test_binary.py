@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the binary circuit encoding."""
+
+import pickle
+import unittest
+
+import numpy
+
+from qiskit.converters import (circuit_to_binary, binary_to_circuit, dag_to_binary,
+                               binary_to_dag, circuit_to_dag)
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.extensions.simulator import Snapshot
+from qiskit.extensions.unitary import UnitaryGate
+from qiskit.exceptions import QiskitError
+from qiskit.test import QiskitTestCase
+
+
+class TestBinary(QiskitTestCase):
+    """Test the binary encoding of circuits and DAGs."""
+
+    def setUp(self):
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        self.qr, self.cr = qr, cr
+        self.circuit = QuantumCircuit(qr, cr, name='example')
+        self.circuit.h(qr[0])
+        self.circuit.cx(qr[0], qr[1])
+        self.circuit.u3(0.1, 0.2, 0.3, qr[2])
+        self.circuit.u1(numpy.pi / 2, qr[1])
+        self.circuit.barrier(qr)
+        self.circuit.measure(qr[0], cr[0])
+        self.circuit.x(qr[0]).c_if(cr, 0x3)
+        self.circuit.append(Snapshot('final', num_qubits=3), qr)
+        self.circuit.measure(qr, cr)
+
+    def test_circuit_round_trip(self):
+        """A circuit is equal to its decoded encoding."""
+        circuit_out = binary_to_circuit(circuit_to_binary(self.circuit))
+        self.assertEqual(circuit_out, self.circuit)
+        self.assertEqual(circuit_out.name, 'example')
+        self.assertEqual(circuit_out.qasm(), self.circuit.qasm())
+
+    def test_dag_round_trip(self):
+        """A DAG is equal to its decoded encoding, conditions included."""
+        for storage in ('networkx', 'array'):
+            dag = circuit_to_dag(self.circuit, storage=storage)
+            dag_out = binary_to_dag(dag_to_binary(dag))
+            self.assertEqual(dag_out, dag)
+            self.assertEqual(dag_out.storage, storage)
+            self.assertEqual(dag_out.named_nodes('x')[0].condition, (self.cr, 3))
+
+    def test_smaller_than_pickle(self):
+        """Repeated gates are encoded once in the op table."""
+        circuit = QuantumCircuit(self.qr)
+        for _ in range(100):
+            circuit.h(self.qr[0])
+            circuit.cx(self.qr[0], self.qr[1])
+        encoded = circuit_to_binary(circuit)
+        self.assertLess(len(encoded), len(pickle.dumps(circuit)))
+        self.assertEqual(binary_to_circuit(encoded), circuit)
+
+    def test_instructions_not_shared(self):
+        """Decoded instructions are distinct objects."""
+        circuit = QuantumCircuit(self.qr)
+        circuit.h(self.qr[0])
+        circuit.h(self.qr[1])
+        circuit_out = binary_to_circuit(circuit_to_binary(circuit))
+        self.assertIsNot(circuit_out.data[0][0], circuit_out.data[1][0])
+
+    def test_parameters(self):
+        """A parameter used twice decodes to a single Parameter."""
+        theta = Parameter('theta')
+        circuit = QuantumCircuit(self.qr)
+        circuit.rx(theta, self.qr[0])
+        circuit.rz(theta, self.qr[1])
+        circuit_out = binary_to_circuit(circuit_to_binary(circuit))
+        self.assertEqual(len(circuit_out.parameters), 1)
+        new_theta = circuit_out.parameters.pop()
+        self.assertEqual(new_theta.name, 'theta')
+        bound = circuit_out.bind_parameters({new_theta: 0.5})
+        self.assertEqual(bound, circuit.bind_parameters({theta: 0.5}))
+
+    def test_composite_and_unitary(self):
+        """Custom instructions keep their definition, and arrays their values."""
+        sub = QuantumCircuit(QuantumRegister(2, 'q'), name='bell')
+        sub.h(0)
+        sub.cx(0, 1)
+        circuit = QuantumCircuit(self.qr)
+        circuit.append(sub.to_instruction(), [self.qr[0], self.qr[1]])
+        circuit.append(UnitaryGate(numpy.array([[0, 1], [1, 0]])), [self.qr[2]])
+        circuit_out = binary_to_circuit(circuit_to_binary(circuit))
+        self.assertEqual(circuit_out, circuit)
+        self.assertEqual(circuit_out.decompose(), circuit.decompose())
+
+    def test_wrong_kind(self):
+        """Decoding a DAG encoding as a circuit raises."""
+        encoded = dag_to_binary(circuit_to_dag(self.circuit))
+        self.assertRaises(QiskitError, binary_to_circuit, encoded)
+        self.assertRaises(QiskitError, binary_to_circuit, b'not a circuit')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
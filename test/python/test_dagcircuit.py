@@ -15,9 +15,13 @@
 
 """Test for the DAGCircuit object"""
 
+import copy
 import unittest
 
+import networkx as nx
+
 from qiskit.dagcircuit import DAGCircuit
+from qiskit.dagcircuit import DAGNode
 from qiskit.circuit import QuantumRegister
 from qiskit.circuit import ClassicalRegister
 from qiskit.circuit import QuantumCircuit
@@ -30,6 +34,7 @@ from qiskit.extensions.standard.x import XGate
 from qiskit.extensions.standard.barrier import Barrier
 from qiskit.dagcircuit.exceptions import DAGCircuitError
 from qiskit.converters import circuit_to_dag
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
 
@@ -172,8 +177,8 @@ class TestDagOperations(QiskitTestCase):
 
         successor_cnot = self.dag.quantum_successors(cnot_node)
         self.assertEqual(len(successor_cnot), 2)
-        self.assertEqual(successor_cnot[0].type, 'out')
-        self.assertIsInstance(successor_cnot[1].op, Reset)
+        self.assertIsInstance(successor_cnot[0].op, Reset)
+        self.assertEqual(successor_cnot[1].type, 'out')
 
     def test_quantum_predecessors(self):
         """The method dag.quantum_predecessors() returns predecessors connected by quantum edges"""
@@ -400,6 +405,66 @@ class TestDagLayers(QiskitTestCase):
             ['measure', 'measure']
         ], name_layers)
 
+    def test_layer_views_match_layers(self):
+        """The layer_views() method yields the op nodes and partition of layers()."""
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(1, 'cr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.add_creg(creg)
+        dag.apply_operation_back(HGate(), [qreg[0]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[1], qreg[2]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+        dag.apply_operation_back(Barrier(3), [qreg[0], qreg[1], qreg[2]], [])
+        dag.apply_operation_back(Measure(), [qreg[2]], [creg[0]])
+
+        layers = list(dag.layers())
+        views = list(dag.layer_views())
+
+        self.assertEqual(len(layers), len(views))
+        for layer, view in zip(layers, views):
+            layer_nodes = [node for node in layer["graph"].topological_op_nodes()]
+            self.assertEqual(set(layer_nodes), set(view["nodes"]))
+            self.assertEqual(sorted(map(str, layer["partition"])),
+                             sorted(map(str, view["partition"])))
+        self.assertEqual([], views[2]["partition"])
+
+    def test_serial_layer_views(self):
+        """The serial_layer_views() method yields one op node per layer."""
+        qreg = QuantumRegister(2, 'qr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.apply_operation_back(HGate(), [qreg[1]], [])
+        dag.apply_operation_back(XGate(), [qreg[0]], [])
+        dag.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+
+        views = list(dag.serial_layer_views())
+        self.assertEqual([['x'], ['h'], ['cx']],
+                         [[node.name for node in view["nodes"]] for view in views])
+        self.assertEqual([[qreg[0], qreg[1]]], views[2]["partition"])
+
+        first_layer = next(dag.layer_views())["nodes"]
+        serial = [view["nodes"][0] for view in dag.serial_layer_views(first_layer)]
+        layer_graph = next(dag.layers())["graph"]
+        expected = [layer["graph"].op_nodes()[0]
+                    for layer in layer_graph.serial_layers()]
+        self.assertEqual([node.name for node in expected],
+                         [node.name for node in serial])
+
+    def test_compose_nodes_back(self):
+        """The compose_nodes_back() method appends nodes with mapped wires."""
+        qreg = QuantumRegister(2, 'qr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.apply_operation_back(CnotGate(), [qreg[0], qreg[1]], [])
+
+        other = DAGCircuit()
+        other.add_qreg(qreg)
+        other.compose_nodes_back(dag.op_nodes(), {qreg[0]: qreg[1], qreg[1]: qreg[0]})
+
+        self.assertEqual([[qreg[1], qreg[0]]],
+                         [node.qargs for node in other.op_nodes()])
+
 
 class TestCircuitProperties(QiskitTestCase):
     """DAGCircuit properties test."""
@@ -526,6 +591,68 @@ class TestDagEquivalence(QiskitTestCase):
         self.assertNotEqual(self.dag1, dag2)
 
 
+class TestDagFingerprint(QiskitTestCase):
+    """DAGCircuit and QuantumCircuit fingerprints."""
+
+    def setUp(self):
+        self.qr = QuantumRegister(3, 'qr')
+        self.cr = ClassicalRegister(1, 'cr')
+        self.circ = QuantumCircuit(self.qr, self.cr)
+        self.circ.h(self.qr[0])
+        self.circ.cx(self.qr[0], self.qr[1])
+        self.circ.u1(0.5, self.qr[2])
+        self.circ.barrier(self.qr)
+        self.circ.x(self.qr[2]).c_if(self.cr, 1)
+        self.circ.measure(self.qr[1], self.cr[0])
+
+    def test_circuit_and_dag(self):
+        """A circuit and its DAG have the same fingerprint."""
+        dag = circuit_to_dag(self.circ)
+        self.assertEqual(self.circ.fingerprint(), dag.fingerprint())
+        self.assertEqual(dag.fingerprint(), copy.deepcopy(dag).fingerprint())
+
+    def test_equal_circuits(self):
+        """Equal circuits built in different orders have the same fingerprint."""
+        circ2 = QuantumCircuit(self.cr, self.qr)
+        circ2.u1(0.5 + 1e-13, self.qr[2])
+        circ2.h(self.qr[0])
+        circ2.cx(self.qr[0], self.qr[1])
+        circ2.barrier([self.qr[2], self.qr[1], self.qr[0]])
+        circ2.x(self.qr[2]).c_if(self.cr, 1)
+        circ2.measure(self.qr[1], self.cr[0])
+        self.assertEqual(self.circ, circ2)
+        self.assertEqual(self.circ.fingerprint(), circ2.fingerprint())
+
+    def test_different_circuits(self):
+        """Circuits differing in wires, parameters or conditions have different fingerprints."""
+        fingerprints = {self.circ.fingerprint()}
+
+        circ2 = self.circ.copy()
+        circ2.data[1] = (circ2.data[1][0], [self.qr[1], self.qr[0]], [])
+        fingerprints.add(circ2.fingerprint())
+
+        circ3 = self.circ.copy()
+        circ3.data[2][0].params = [0.6]
+        fingerprints.add(circ3.fingerprint())
+
+        circ4 = self.circ.copy()
+        circ4.data[4][0].control = (self.cr, 0)
+        fingerprints.add(circ4.fingerprint())
+
+        self.assertEqual(4, len(fingerprints))
+        self.assertNotEqual(self.circ, circ2)
+        self.assertNotEqual(self.circ, circ3)
+
+    def test_cache(self):
+        """The DAG fingerprint follows modifications of the DAG."""
+        dag = circuit_to_dag(self.circ)
+        before = dag.fingerprint()
+        dag.apply_operation_back(HGate(), [self.qr[0]], [])
+        self.assertNotEqual(before, dag.fingerprint())
+        self.circ.h(self.qr[0])
+        self.assertEqual(self.circ.fingerprint(), dag.fingerprint())
+
+
 class TestDagSubstitute(QiskitTestCase):
     """Test substitutuing a dag node with a sub-dag"""
 
@@ -572,6 +699,44 @@ class TestDagSubstitute(QiskitTestCase):
         """The method substitute_node_with_dag() replaces a leaf-in-the-back node with a DAG."""
         pass
 
+    def test_substitute_nodes(self):
+        """The method substitute_nodes() matches substitute_node_with_dag() on each node."""
+        v = QuantumRegister(1, "v")
+        x_circuit = DAGCircuit()
+        x_circuit.add_qreg(v)
+        x_circuit.apply_operation_back(HGate(), [v[0]], [])
+        x_circuit.apply_operation_back(HGate(), [v[0]], [])
+
+        expected = copy.deepcopy(self.dag)
+        self.dag.apply_operation_back(XGate(), [self.qubit2], [], condition=self.condition)
+        expected.apply_operation_back(XGate(), [self.qubit2], [], condition=self.condition)
+        for node in expected.named_nodes('x'):
+            replacement = copy.deepcopy(x_circuit)
+            expected.substitute_node_with_dag(node, replacement)
+
+        self.dag.topological_nodes()
+        self.dag.substitute_nodes({node: x_circuit for node in self.dag.named_nodes('x')})
+
+        self.assertEqual(expected, self.dag)
+        self.assertEqual(self.dag.count_ops(), {'h': 5, 'cx': 1})
+        self.assertEqual([self.condition, self.condition],
+                         [node.condition for node in self.dag.op_nodes()
+                          if node.qargs == [self.qubit2]])
+        self.assertEqual(2, len(x_circuit.op_nodes()))
+        self.assertEqual(self.dag._cached_topological_order(),
+                         tuple(self.dag.topological_nodes()))
+        self.assertEqual(self.dag.size(), len(list(self.dag.topological_op_nodes())))
+
+    def test_substitute_nodes_wrong_wires(self):
+        """The method substitute_nodes() rejects a dag with the wrong wires."""
+        cx_node = self.dag.op_nodes(op=CnotGate).pop()
+        v = QuantumRegister(1, "v")
+        h_circuit = DAGCircuit()
+        h_circuit.add_qreg(v)
+        h_circuit.apply_operation_back(HGate(), [v[0]], [])
+
+        self.assertRaises(DAGCircuitError, self.dag.substitute_nodes, {cx_node: h_circuit})
+
 
 class TestDagProperties(QiskitTestCase):
     """Test the DAG properties.
@@ -642,5 +807,385 @@ class TestDagProperties(QiskitTestCase):
         self.assertEqual(dag.depth(), 6)
 
 
+class TestDagMetrics(QiskitTestCase):
+    """Test the incrementally maintained DAG metrics."""
+
+    def setUp(self):
+        self.qreg = QuantumRegister(3, 'qr')
+        self.creg = ClassicalRegister(2, 'cr')
+        self.dag = DAGCircuit()
+        self.dag.add_qreg(self.qreg)
+        self.dag.add_creg(self.creg)
+        self.dag.apply_operation_back(HGate(), [self.qreg[0]], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qreg[0], self.qreg[1]], [])
+        self.dag.apply_operation_back(XGate(), [self.qreg[2]], [], condition=(self.creg, 1))
+        self.dag.apply_operation_back(Measure(), [self.qreg[1]], [self.creg[0]])
+
+    def assertMetrics(self, dag):
+        """Check the maintained metrics against a full recomputation."""
+        graph = dag.to_networkx()
+        self.assertEqual(max(nx.dag_longest_path_length(graph) - 1, 0), dag.depth())
+        counts = {}
+        for node in dag.topological_op_nodes():
+            counts[node.name] = counts.get(node.name, 0) + 1
+        self.assertEqual(counts, dag.count_ops())
+        self.assertEqual(sum(counts.values()), dag.size())
+
+    def test_apply_operation_back(self):
+        """Appending ops updates the metrics without a recomputation."""
+        self.assertEqual(self.dag._depth_version, self.dag.version)
+        self.assertMetrics(self.dag)
+        self.dag.add_qreg(QuantumRegister(1, 'qs'))
+        self.dag.apply_operation_back(CnotGate(), [self.qreg[1], self.qreg[2]], [])
+        self.assertEqual(self.dag._depth_version, self.dag.version)
+        self.assertMetrics(self.dag)
+
+    def test_other_mutations(self):
+        """The metrics follow front applications, removals and substitutions."""
+        self.dag.apply_operation_front(HGate(), [self.qreg[2]], [])
+        self.assertMetrics(self.dag)
+        self.dag.remove_op_node(self.dag.named_nodes('cx')[0])
+        self.assertMetrics(self.dag)
+        self.dag.remove_all_ops_named('h')
+        self.assertMetrics(self.dag)
+
+        v = QuantumRegister(1, 'v')
+        replacement = DAGCircuit()
+        replacement.add_qreg(v)
+        replacement.apply_operation_back(HGate(), [v[0]], [])
+        replacement.apply_operation_back(HGate(), [v[0]], [])
+        self.dag.substitute_nodes({self.dag.named_nodes('x')[0]: replacement})
+        self.assertMetrics(self.dag)
+
+    def test_layers(self):
+        """The layers of a DAG have their own metrics."""
+        for layer in self.dag.layers():
+            self.assertMetrics(layer["graph"])
+
+
+class TestDagNode(QiskitTestCase):
+    """Test the DAGNode fields and their backward-compatible accessors."""
+
+    def setUp(self):
+        self.qreg = QuantumRegister(2, 'qr')
+        self.creg = ClassicalRegister(1, 'cr')
+        self.dag = DAGCircuit()
+        self.dag.add_qreg(self.qreg)
+        self.dag.add_creg(self.creg)
+        self.dag.apply_operation_back(XGate(), [self.qreg[0]], [],
+                                      condition=(self.creg, 1))
+
+    def test_fields(self):
+        """Op and input nodes expose their fields as attributes."""
+        node = self.dag.op_nodes()[0]
+        self.assertEqual('op', node.type)
+        self.assertEqual('x', node.name)
+        self.assertEqual([self.qreg[0]], node.qargs)
+        self.assertEqual([], node.cargs)
+        self.assertEqual((self.creg, 1), node.condition)
+        self.assertRaises(QiskitError, lambda: node.wire)
+
+        in_node = self.dag.input_map[self.qreg[0]]
+        self.assertEqual(self.qreg[0], in_node.wire)
+        self.assertEqual([], in_node.qargs)
+        self.assertRaises(QiskitError, lambda: in_node.op)
+
+    def test_no_instance_dict(self):
+        """Nodes store their fields in slots."""
+        node = self.dag.op_nodes()[0]
+        self.assertFalse(hasattr(node, '__dict__'))
+
+    def test_data_dict(self):
+        """Nodes can still be built from and read as a data_dict."""
+        node = self.dag.op_nodes()[0]
+        copied = DAGNode(data_dict=node.data_dict, nid=7)
+        self.assertEqual(7, copied._node_id)
+        self.assertTrue(DAGNode.semantic_eq(node, copied))
+        self.assertNotEqual(node, copied)
+        self.assertEqual({node, copied}, {copied, node})
+
+        copied.pop('name')
+        self.assertIsNone(copied.name)
+        self.assertFalse(DAGNode.semantic_eq(node, copied))
+
+    def test_data_dict_writes_through(self):
+        """Setting a key of the data_dict sets the field of the node."""
+        node = self.dag.op_nodes()[0]
+        data_dict = node.data_dict
+        self.assertEqual({'type', 'name', 'op', 'qargs', 'cargs', 'condition'},
+                         set(data_dict))
+
+        data_dict['qargs'] = [self.qreg[1]]
+        self.assertEqual([self.qreg[1]], node.qargs)
+        node.data_dict['name'] = 'y'
+        self.assertEqual('y', node.name)
+        del node.data_dict['condition']
+        self.assertIsNone(node.condition)
+        with self.assertRaises(KeyError):
+            node.data_dict['wire'] = self.qreg[0]
+
+        in_node = self.dag.input_map[self.qreg[0]]
+        self.assertEqual({'type': 'in', 'name': in_node.name, 'wire': self.qreg[0]},
+                         dict(in_node.data_dict))
+
+
+class TestDagArrayStorage(QiskitTestCase):
+    """Test the array-backed DAG storage against the networkx one."""
+
+    def setUp(self):
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circ = QuantumCircuit(qr, cr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.t(qr[2])
+        circ.cx(qr[1], qr[2])
+        circ.barrier(qr)
+        circ.x(qr[0]).c_if(cr, 1)
+        circ.measure(qr[0], cr[0])
+        circ.measure(qr[2], cr[1])
+        self.circuit = circ
+        self.nx_dag = circuit_to_dag(circ)
+        self.array_dag = circuit_to_dag(circ, storage='array')
+
+    def test_unknown_storage(self):
+        """An unknown storage raises."""
+        self.assertRaises(DAGCircuitError, DAGCircuit, storage='sparse')
+
+    def test_storage_property(self):
+        """The storage is reported by the DAG."""
+        self.assertEqual(self.nx_dag.storage, 'networkx')
+        self.assertEqual(self.array_dag.storage, 'array')
+
+    def test_same_structure(self):
+        """Both storages hold the same nodes, edges and properties."""
+        self.assertEqual(len(list(self.nx_dag.nodes())), len(list(self.array_dag.nodes())))
+        self.assertEqual(len(list(self.nx_dag.edges())), len(list(self.array_dag.edges())))
+        self.assertEqual(self.nx_dag.properties(), self.array_dag.properties())
+        self.assertEqual([node.name for node in self.nx_dag.topological_nodes()],
+                         [node.name for node in self.array_dag.topological_nodes()])
+        self.assertEqual(self.nx_dag, self.array_dag)
+
+    def test_layers(self):
+        """Both storages produce the same layers."""
+        nx_layers = [[node.name for node in layer['graph'].op_nodes()]
+                     for layer in self.nx_dag.layers()]
+        array_layers = [[node.name for node in layer['graph'].op_nodes()]
+                        for layer in self.array_dag.layers()]
+        self.assertEqual(nx_layers, array_layers)
+
+    def test_remove_and_substitute(self):
+        """Structural edits keep both storages in sync."""
+        for dag in [self.nx_dag, self.array_dag]:
+            dag.remove_op_node(dag.named_nodes('t')[0])
+            cx_node = dag.named_nodes('cx')[0]
+            replacement = DAGCircuit(storage='array')
+            v = QuantumRegister(2, 'v')
+            replacement.add_qreg(v)
+            replacement.apply_operation_back(HGate(), [v[0]], [])
+            replacement.apply_operation_back(CnotGate(), [v[1], v[0]], [])
+            dag.substitute_node_with_dag(cx_node, replacement, wires=[v[0], v[1]])
+        self.assertEqual(self.nx_dag, self.array_dag)
+        self.assertEqual(self.nx_dag.depth(), self.array_dag.depth())
+        qubit = self.circuit.qregs[0][1]
+        self.assertEqual([node.name for node in self.nx_dag.nodes_on_wire(qubit)],
+                         [node.name for node in self.array_dag.nodes_on_wire(qubit)])
+
+    def test_ancestors_descendants(self):
+        """Ancestors and descendants agree on both storages."""
+        nx_node = self.nx_dag.named_nodes('cx')[1]
+        array_node = self.array_dag.named_nodes('cx')[1]
+        self.assertEqual(sorted(node.name for node in self.nx_dag.ancestors(nx_node)),
+                         sorted(node.name for node in self.array_dag.ancestors(array_node)))
+        self.assertEqual(sorted(node.name for node in self.nx_dag.descendants(nx_node)),
+                         sorted(node.name for node in self.array_dag.descendants(array_node)))
+
+
+class TestDagFrontLayer(QiskitTestCase):
+    """Test the incremental front and back layers."""
+
+    def setUp(self):
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circ = QuantumCircuit(qr, cr)
+        circ.h(qr[0])
+        circ.x(qr[2])
+        circ.cx(qr[0], qr[1])
+        circ.cx(qr[1], qr[2])
+        circ.measure(qr[2], cr[0])
+        self.dag = circuit_to_dag(circ)
+
+    def test_front_layer(self):
+        """The front layer holds the first ops and advances on consume."""
+        front = self.dag.front_layer()
+        self.assertEqual(sorted(node.name for node in front), ['h', 'x'])
+        h_node = [node for node in front if node.name == 'h'][0]
+        x_node = [node for node in front if node.name == 'x'][0]
+        self.assertEqual([node.name for node in front.consume(h_node)], ['cx'])
+        cx_node = front.nodes[-1]
+        self.assertEqual(front.consume(x_node), [])
+        self.assertEqual([node.name for node in front.consume(cx_node)], ['cx'])
+        self.assertNotIn(cx_node, front)
+        self.assertRaises(DAGCircuitError, front.consume, cx_node)
+
+    def test_back_layer(self):
+        """The back layer walks the circuit from the outputs."""
+        back = self.dag.back_layer()
+        self.assertEqual([node.name for node in back], ['measure'])
+        names = []
+        while back.nodes:
+            node = back.nodes[0]
+            names.append(node.name)
+            back.consume(node)
+        self.assertEqual(names[:3], ['measure', 'cx', 'cx'])
+        self.assertEqual(sorted(names[3:]), ['h', 'x'])
+
+    def test_wire_index_after_edits(self):
+        """The per-wire index follows removals and substitutions."""
+        qubit = self.dag.qubits()[1]
+        self.dag.remove_op_node(self.dag.named_nodes('h')[0])
+        cx_node = self.dag.named_nodes('cx')[0]
+        replacement = DAGCircuit()
+        v = QuantumRegister(2, 'v')
+        replacement.add_qreg(v)
+        replacement.apply_operation_back(HGate(), [v[1]], [])
+        replacement.apply_operation_back(CnotGate(), [v[0], v[1]], [])
+        self.dag.substitute_node_with_dag(cx_node, replacement, wires=[v[0], v[1]])
+        self.assertEqual([node.type for node in self.dag.nodes_on_wire(qubit)],
+                         ['in', 'op', 'op', 'op', 'out'])
+        self.assertEqual([node.name for node in self.dag.nodes_on_wire(qubit, only_ops=True)],
+                         ['h', 'cx', 'cx'])
+        new_cx = self.dag.quantum_successors(self.dag.named_nodes('h')[0])[0]
+        self.assertEqual([node.type for node in self.dag.quantum_successors(new_cx)],
+                         ['out', 'op'])
+
+
+class TestDagTopologicalCache(QiskitTestCase):
+    """Test the cached topological order."""
+
+    def setUp(self):
+        qr = QuantumRegister(2, 'qr')
+        circ = QuantumCircuit(qr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.x(qr[1])
+        self.qr = qr
+        self.dag = circuit_to_dag(circ)
+
+    def test_order_is_cached(self):
+        """An unchanged DAG does not sort again."""
+        order = list(self.dag.topological_nodes())
+        version = self.dag.version
+        self.assertIs(self.dag._topo_order, self.dag._cached_topological_order())
+        self.assertEqual(list(self.dag.topological_nodes()), order)
+        self.assertEqual(self.dag.version, version)
+
+    def test_invalidated_on_apply(self):
+        """Adding an operation changes the version and the order."""
+        list(self.dag.topological_nodes())
+        version = self.dag.version
+        self.dag.apply_operation_back(HGate(), [self.qr[1]], [])
+        self.assertGreater(self.dag.version, version)
+        self.assertIsNone(self.dag._cached_topological_order())
+        self.assertEqual([node.name for node in self.dag.topological_op_nodes()],
+                         ['h', 'cx', 'x', 'h'])
+
+    def test_patched_on_remove(self):
+        """Removing a node patches the cached order."""
+        list(self.dag.topological_nodes())
+        self.dag.remove_op_node(self.dag.named_nodes('cx')[0])
+        self.assertIsNotNone(self.dag._cached_topological_order())
+        self.assertEqual([node.name for node in self.dag.topological_op_nodes()],
+                         ['h', 'x'])
+
+    def test_patched_on_substitute(self):
+        """Substituting a node patches the cached order."""
+        list(self.dag.topological_nodes())
+        replacement = DAGCircuit()
+        v = QuantumRegister(2, 'v')
+        replacement.add_qreg(v)
+        replacement.apply_operation_back(HGate(), [v[0]], [])
+        replacement.apply_operation_back(CnotGate(), [v[1], v[0]], [])
+        self.dag.substitute_node_with_dag(self.dag.named_nodes('cx')[0], replacement,
+                                          wires=[v[0], v[1]])
+        self.assertIsNotNone(self.dag._cached_topological_order())
+        self.assertEqual([node.name for node in self.dag.topological_op_nodes()],
+                         ['h', 'h', 'cx', 'x'])
+
+    def test_multi_graph_setter_rebuilds_indices(self):
+        """Setting the multi_graph rebuilds the wire index and the cached metrics."""
+        self.assertEqual(self.dag.depth(), 3)
+        list(self.dag.topological_nodes())
+        other = QuantumCircuit(self.qr)
+        for _ in range(4):
+            other.h(self.qr[1])
+        other_dag = circuit_to_dag(other)
+
+        with self.assertWarns(DeprecationWarning):
+            self.dag.multi_graph = other_dag._multi_graph
+        self.dag.input_map = other_dag.input_map
+        self.dag.output_map = other_dag.output_map
+
+        self.assertEqual([node.name for node in
+                          self.dag.nodes_on_wire(self.qr[1], only_ops=True)], ['h'] * 4)
+        self.assertEqual([node.name for node in self.dag.topological_op_nodes()], ['h'] * 4)
+        self.assertEqual(self.dag.depth(), 4)
+        self.assertEqual(self.dag.count_ops(), {'h': 4})
+
+
+class TestDagSnapshot(QiskitTestCase):
+    """Test the copy-on-write snapshots of a DAG."""
+
+    def setUp(self):
+        self.qreg = QuantumRegister(2, 'qr')
+        self.dag = DAGCircuit()
+        self.dag.add_qreg(self.qreg)
+        self.dag.apply_operation_back(HGate(), [self.qreg[0]], [])
+        self.dag.apply_operation_back(CnotGate(), [self.qreg[0], self.qreg[1]], [])
+
+    def test_shares_until_mutated(self):
+        """A snapshot shares the graph of its DAG until one is modified."""
+        snapshot = self.dag.snapshot()
+        self.assertIs(snapshot._multi_graph, self.dag._multi_graph)
+        self.assertEqual(snapshot, self.dag)
+
+        snapshot.apply_operation_back(XGate(), [self.qreg[1]], [])
+        self.assertIsNot(snapshot._multi_graph, self.dag._multi_graph)
+        self.assertEqual(self.dag.count_ops(), {'h': 1, 'cx': 1})
+        self.assertEqual(snapshot.count_ops(), {'h': 1, 'cx': 1, 'x': 1})
+        self.assertEqual(self.dag.depth(), 2)
+        self.assertEqual(snapshot.depth(), 3)
+        self.assertEqual([node.name for node in self.dag.topological_op_nodes()],
+                         ['h', 'cx'])
+
+    def test_original_mutated(self):
+        """Modifying the DAG leaves its snapshot unchanged."""
+        expected = copy.deepcopy(self.dag)
+        snapshot = self.dag.snapshot()
+        self.dag.remove_op_node(self.dag.named_nodes('cx')[0])
+        self.dag.add_creg(ClassicalRegister(1, 'cr'))
+        self.assertEqual(snapshot, expected)
+        self.assertNotIn('cr', snapshot.cregs)
+        self.assertEqual(len(self.dag.op_nodes()), 1)
+
+    def test_last_owner_does_not_copy(self):
+        """Once the snapshot is modified, the DAG keeps its own graph."""
+        snapshot = self.dag.snapshot()
+        snapshot.apply_operation_back(XGate(), [self.qreg[1]], [])
+        graph = self.dag._multi_graph
+        self.dag.apply_operation_back(XGate(), [self.qreg[0]], [])
+        self.assertIs(self.dag._multi_graph, graph)
+
+    def test_array_storage(self):
+        """Snapshots of an array-backed DAG copy its arrays on write."""
+        dag = DAGCircuit(storage='array')
+        dag.add_qreg(self.qreg)
+        dag.apply_operation_back(HGate(), [self.qreg[0]], [])
+        snapshot = dag.snapshot()
+        snapshot.apply_operation_back(CnotGate(), [self.qreg[0], self.qreg[1]], [])
+        self.assertEqual(dag.size(), 1)
+        self.assertEqual(snapshot, self.dag)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -14,9 +14,11 @@
 
 """Tests for qiskit/tools/parallel"""
 import os
+import tempfile
 import time
 
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import parallel_map, get_pool, shutdown_pool
+from qiskit.tools.events.pubsub import Subscriber
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
 
@@ -28,6 +30,31 @@ def _parfunc(x):
     return x
 
 
+def _raise(x):
+    """Function for testing parallel_map errors"""
+    if x == 3:
+        raise ValueError('bad value')
+    return x
+
+
+def _exit_once(x, marker):
+    """Function for testing parallel_map when a worker dies: the first call
+    with x == 3 exits its worker"""
+    if x == 3 and not os.path.exists(marker):
+        open(marker, 'w').close()
+        os._exit(1)
+    return x
+
+
+def _make_late_task():
+    """Return a function to set as the module attribute _late_task, after
+    the workers of the pool were forked"""
+    def _late_task(x):
+        return 2 * x
+    _late_task.__qualname__ = '_late_task'
+    return _late_task
+
+
 def _build_simple(_):
     qreg = QuantumRegister(2)
     creg = ClassicalRegister(2)
@@ -53,3 +80,53 @@ class TestParallel(QiskitTestCase):
         out_circs = parallel_map(_build_simple, list(range(10)))
         names = [circ.name for circ in out_circs]
         self.assertEqual(len(names), len(set(names)))
+
+    def test_pool_reused(self):
+        """The worker pool is kept between calls, until it is shut down"""
+        parallel_map(_parfunc, [0, 1], num_processes=2)
+        pool = get_pool(2)
+        parallel_map(_build_simple, list(range(10)), num_processes=2)
+        self.assertIs(get_pool(2), pool)
+        shutdown_pool()
+        self.assertIsNot(get_pool(2), pool)
+        shutdown_pool()
+
+    def test_task_error(self):
+        """An error raised by a task is raised by parallel_map"""
+        with self.assertRaises(ValueError):
+            parallel_map(_raise, list(range(10)), num_processes=2)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+        self.assertEqual(parallel_map(_raise, [0, 1, 2], num_processes=2), [0, 1, 2])
+
+    def test_progress_events(self):
+        """A done event is published for each task"""
+        done = []
+        subscriber = Subscriber()
+        subscriber.subscribe("terra.parallel.done", done.append)
+        try:
+            parallel_map(_build_simple, list(range(10)), num_processes=2)
+        finally:
+            subscriber.unsubscribe("terra.parallel.done", done.append)
+        self.assertEqual(sorted(done), list(range(1, 11)))
+
+    def test_task_defined_after_pool(self):
+        """A task that the workers of the pool cannot unpickle runs on a new pool"""
+        parallel_map(_build_simple, [0, 1], num_processes=2)
+        globals()['_late_task'] = _make_late_task()
+        try:
+            self.assertEqual(parallel_map(globals()['_late_task'], list(range(4)),
+                                          num_processes=2), [0, 2, 4, 6])
+        finally:
+            del globals()['_late_task']
+            shutdown_pool()
+
+    def test_worker_died(self):
+        """The tasks of a worker that died are run on a new pool"""
+        with tempfile.TemporaryDirectory() as directory:
+            marker = os.path.join(directory, 'marker')
+            pool = get_pool(2)
+            self.assertEqual(parallel_map(_exit_once, list(range(6)), task_args=(marker,),
+                                          num_processes=2), list(range(6)))
+            self.assertTrue(os.path.exists(marker))
+        self.assertIsNot(get_pool(2), pool)
+        shutdown_pool()
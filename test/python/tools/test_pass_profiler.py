@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for qiskit/tools/events/passprofiler.py"""
+
+import io
+import tracemalloc
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.compiler import transpile
+from qiskit.tools.events import PassProfiler
+from qiskit.tools.events.pubsub import Publisher
+from qiskit.test import QiskitTestCase
+
+
+class TestPassProfiler(QiskitTestCase):
+    """Test the per-pass profile of a transpile() call."""
+
+    def setUp(self):
+        qr = QuantumRegister(3)
+        self.circuit = QuantumCircuit(qr)
+        self.circuit.h(qr[0])
+        self.circuit.cx(qr[0], qr[2])
+        self.circuit.ccx(qr[0], qr[1], qr[2])
+
+    def test_profile_table(self):
+        """The profile of the passes is written when transpile() finishes."""
+        output = io.StringIO()
+        profiler = PassProfiler(output_handler=output, memory=True)
+        transpile([self.circuit, self.circuit], basis_gates=['u1', 'u2', 'u3', 'cx'],
+                  coupling_map=[[0, 1], [1, 2]], optimization_level=1, seed_transpiler=42)
+
+        self.assertEqual(profiler.stats['Unroller']['calls'], 2)
+        self.assertGreater(profiler.stats['Unroller']['size'], 0)
+        self.assertIsNotNone(profiler.stats['Unroller']['memory'])
+        self.assertGreater(profiler.stats['Optimize1qGates']['iterations'], 1)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        lines = output.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('Pass '))
+        self.assertEqual(len(lines), len(profiler.stats) + 1)
+        self.assertIn('Unroller', output.getvalue())
+
+    def test_caller_traces_kept(self):
+        """The traces of a caller already tracing are kept."""
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        allocated = bytearray(100000)
+        profiler = PassProfiler(output_handler=io.StringIO(), memory=True)
+        transpile(self.circuit, basis_gates=['u1', 'u2', 'u3', 'cx'])
+
+        self.assertIsNotNone(tracemalloc.get_object_traceback(allocated))
+        self.assertGreaterEqual(profiler.stats['Unroller']['memory'], 0)
+        self.assertTrue(tracemalloc.is_tracing())
+
+    def test_single_transpile(self):
+        """The profiler stops listening once the transpile() call finishes."""
+        output = io.StringIO()
+        PassProfiler(output_handler=output)
+        transpile(self.circuit, basis_gates=['u1', 'u2', 'u3', 'cx'])
+        self.assertFalse(Publisher().has_subscribers("terra.transpiler.pass.done"))
+        printed = output.getvalue()
+        transpile(self.circuit, basis_gates=['u1', 'u2', 'u3', 'cx'])
+        self.assertEqual(output.getvalue(), printed)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the ApplyLayout pass"""
+
+import unittest
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.transpiler import Layout, TranspilerError
+from qiskit.transpiler.passes import ApplyLayout
+from qiskit.converters import circuit_to_dag
+from qiskit.test import QiskitTestCase
+
+
+class TestApplyLayout(QiskitTestCase):
+    """Tests the ApplyLayout pass"""
+
+    def test_maps_onto_physical_qubits(self):
+        """Test that the gates, measurements and conditions are on the
+        physical qubits of the layout."""
+        qr = QuantumRegister(3, 'v')
+        cr = ClassicalRegister(2, 'c')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[2])
+        circuit.measure(qr[2], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+
+        device = QuantumRegister(3, 'q')
+        expected = QuantumCircuit(device, cr)
+        expected.h(device[2])
+        expected.cx(device[2], device[1])
+        expected.measure(device[1], cr[0])
+        expected.x(device[0]).c_if(cr, 1)
+
+        pass_ = ApplyLayout()
+        pass_.property_set['layout'] = Layout({qr[0]: 2, qr[1]: 0, qr[2]: 1})
+        result = pass_.run(circuit_to_dag(circuit))
+
+        self.assertEqual(result, circuit_to_dag(expected))
+
+    def test_raises_without_layout(self):
+        """Test that ApplyLayout raises when there is no layout."""
+        qr = QuantumRegister(2, 'q')
+        with self.assertRaises(TranspilerError):
+            ApplyLayout().run(circuit_to_dag(QuantumCircuit(qr)))
+
+    def test_raises_on_layout_of_other_size(self):
+        """Test that ApplyLayout raises when the layout does not cover the circuit."""
+        qr = QuantumRegister(2, 'q')
+        pass_ = ApplyLayout()
+        pass_.property_set['layout'] = Layout({qr[0]: 0})
+        with self.assertRaises(TranspilerError):
+            pass_.run(circuit_to_dag(QuantumCircuit(qr)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,9 +14,11 @@
 
 # pylint: disable=missing-docstring
 
+import networkx as nx
+
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.exceptions import CouplingError
-from qiskit.test.mock import FakeRueschlikon
+from qiskit.test.mock import FakeRueschlikon, FakeTokyo, FakeMelbourne
 from qiskit.test import QiskitTestCase
 
 
@@ -80,6 +82,46 @@ class CouplingTest(QiskitTestCase):
         self.assertEqual(coupling.get_edges(), edges_expected)
         self.assertEqual(2, coupling.distance(0, 2))
 
+    def test_shortest_undirected_path(self):
+        coupling = CouplingMap([[0, 1], [2, 1], [2, 3], [4, 3]])
+        self.assertEqual([0, 1, 2, 3, 4], coupling.shortest_undirected_path(0, 4))
+        self.assertEqual([3, 2, 1], coupling.shortest_undirected_path(3, 1))
+        self.assertEqual([2], coupling.shortest_undirected_path(2, 2))
+
+    def test_shortest_undirected_path_error(self):
+        """Test the path between unconnected physical_qubits."""
+        coupling = CouplingMap([[0, 1]])
+        coupling.add_physical_qubit(2)
+        self.assertEqual([1, 0], coupling.shortest_undirected_path(1, 0))
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 2)
+        self.assertRaises(CouplingError, coupling.shortest_undirected_path, 0, 3)
+
+    def test_shortest_undirected_path_ties(self):
+        """Test that paths of the same length are chosen as networkx does."""
+        for backend in (FakeTokyo(), FakeMelbourne(), FakeRueschlikon()):
+            coupling = CouplingMap(backend.configuration().coupling_map)
+            undirected = coupling.graph.to_undirected(as_view=True)
+            for source in coupling.physical_qubits:
+                for target in coupling.physical_qubits:
+                    self.assertEqual(nx.shortest_path(undirected, source, target),
+                                     coupling.shortest_undirected_path(source, target))
+
+    def test_distances_shared_by_equal_maps(self):
+        """Test that maps with the same undirected edges share their distances."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3]])
+        reversed_coupling = CouplingMap([[3, 2], [2, 1], [1, 0]])
+        self.assertEqual(3, coupling.distance(0, 3))
+        self.assertEqual(3, reversed_coupling.distance(3, 0))
+        self.assertIs(coupling._dist_matrix, reversed_coupling._dist_matrix)
+
+    def test_distances_after_add_edge(self):
+        """Test that adding an edge updates the distances."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3]])
+        self.assertEqual(3, coupling.distance(0, 3))
+        coupling.add_edge(3, 0)
+        self.assertEqual(1, coupling.distance(0, 3))
+        self.assertEqual([0, 3], coupling.shortest_undirected_path(0, 3))
+
     def test_successful_reduced_map(self):
         """Generate a reduced map
         """
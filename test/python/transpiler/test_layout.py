@@ -18,7 +18,7 @@ import copy
 import unittest
 
 from qiskit import QuantumRegister
-from qiskit.transpiler.layout import Layout
+from qiskit.transpiler.layout import Layout, IntLayout
 from qiskit.transpiler.exceptions import LayoutError
 from qiskit.test import QiskitTestCase
 
@@ -398,5 +398,78 @@ class LayoutTest(QiskitTestCase):
         self.assertDictEqual(layout._v2p, expected._v2p)
 
 
+class IntLayoutTest(QiskitTestCase):
+    """Test the methods in the IntLayout object."""
+
+    def setUp(self):
+        self.qr = QuantumRegister(3, 'qr')
+
+    def test_int_layout(self):
+        """Constructor from the physical qubit of each virtual qubit"""
+        layout = IntLayout([2, 0, 3], 5)
+
+        self.assertEqual(len(layout), 3)
+        self.assertEqual(layout.get_virtual_bits().tolist(), [2, 0, 3])
+        self.assertEqual(layout.get_physical_bits().tolist(), [1, -1, 0, 2, -1])
+
+    def test_int_layout_repeated_physical(self):
+        """A physical qubit cannot hold two virtual qubits"""
+        with self.assertRaises(LayoutError):
+            IntLayout([1, 1])
+        with self.assertRaises(LayoutError):
+            IntLayout([0, 3], 3)
+
+    def test_int_layout_swap(self):
+        """swap() swaps the virtual qubits of two physical qubits"""
+        layout = IntLayout([2, 0, 3], 5)
+        layout.swap(0, 2)
+        layout.swap(3, 4)
+
+        self.assertEqual(layout.get_virtual_bits().tolist(), [0, 2, 4])
+        self.assertEqual(layout.get_physical_bits().tolist(), [0, -1, 1, -1, 2])
+
+    def test_int_layout_copy(self):
+        """A copy is not modified with the original"""
+        layout = IntLayout([0, 1, 2])
+        layout_copy = layout.copy()
+        layout.swap(0, 1)
+
+        self.assertEqual(layout_copy, IntLayout([0, 1, 2]))
+        self.assertNotEqual(layout, layout_copy)
+
+    def test_int_layout_combine_into_edge_map(self):
+        """combine_into_edge_map() maps the virtual qubits on the same physical qubit"""
+        layout = IntLayout([0, 1, 2])
+        another_layout = IntLayout([1, 2, 0])
+
+        self.assertEqual(layout.combine_into_edge_map(another_layout), [2, 0, 1])
+        with self.assertRaises(LayoutError):
+            IntLayout([0, 1, 3]).combine_into_edge_map(another_layout)
+
+    def test_int_layout_to_and_from_layout(self):
+        """Conversion to and from a Layout"""
+        qubits = [self.qr[0], self.qr[1], self.qr[2]]
+        layout = Layout({self.qr[0]: 4, self.qr[1]: 0, self.qr[2]: 2})
+
+        int_layout = IntLayout.from_layout(layout, qubits)
+        self.assertEqual(int_layout.get_virtual_bits().tolist(), [4, 0, 2])
+
+        back = int_layout.to_layout(qubits)
+        self.assertDictEqual(back.get_virtual_bits(), layout.get_virtual_bits())
+        self.assertDictEqual(back.get_physical_bits(), layout.get_physical_bits())
+
+    def test_int_layout_to_and_from_nlayout(self):
+        """Conversion to and from the NLayout of StochasticSwap"""
+        layout = IntLayout([2, 0, 1])
+
+        nlayout = layout.to_nlayout()
+        self.assertEqual(nlayout.logic_to_phys.tolist(), [2, 0, 1])
+        self.assertEqual(nlayout.phys_to_logic.tolist(), [1, 2, 0])
+        self.assertEqual(IntLayout.from_nlayout(nlayout), layout)
+
+        with self.assertRaises(LayoutError):
+            IntLayout([0, 2]).to_nlayout()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -157,6 +157,41 @@ class TestLookaheadSwap(QiskitTestCase):
                       [set(((QuantumRegister(3, 'q'), 0), (QuantumRegister(3, 'q'), 1))),
                        set(((QuantumRegister(3, 'q'), 1), (QuantumRegister(3, 'q'), 2)))])
 
+    def test_lookahead_swap_maps_onto_grid(self):
+        """Verify every two-qubit gate mapped onto a grid acts on a coupled pair.
+
+        The mapped gates are copies of the input gates, which are left untouched.
+        """
+
+        qr = QuantumRegister(9, 'q')
+        cr = ClassicalRegister(9, 'c')
+        circuit = QuantumCircuit(qr, cr)
+        for control, target in [(0, 8), (2, 6), (1, 7), (3, 5), (8, 0), (4, 0),
+                                (6, 2), (5, 1)]:
+            circuit.cx(qr[control], qr[target])
+            circuit.h(qr[target])
+        circuit.measure(qr, cr)
+        dag_circuit = circuit_to_dag(circuit)
+
+        # 0 - 1 - 2
+        # |   |   |
+        # 3 - 4 - 5
+        # |   |   |
+        # 6 - 7 - 8
+        coupling_map = CouplingMap([[0, 1], [1, 2], [3, 4], [4, 5], [6, 7], [7, 8],
+                                    [0, 3], [3, 6], [1, 4], [4, 7], [2, 5], [5, 8]])
+
+        mapped_dag = LookaheadSwap(coupling_map).run(dag_circuit)
+
+        for node in mapped_dag.twoQ_gates():
+            self.assertEqual(coupling_map.distance(node.qargs[0][1], node.qargs[1][1]), 1)
+        counts = mapped_dag.count_ops()
+        self.assertGreater(counts.pop('swap', 0), 0)
+        self.assertEqual(counts, dag_circuit.count_ops())
+        input_ops = {id(node.op) for node in dag_circuit.op_nodes()}
+        self.assertFalse(input_ops.intersection(id(node.op) for node in mapped_dag.op_nodes()))
+        self.assertEqual(dag_circuit, circuit_to_dag(circuit))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,11 +19,14 @@
 import unittest.mock
 
 from qiskit import QuantumRegister, QuantumCircuit
-from qiskit.transpiler import PassManager
+from qiskit.transpiler import PassManager, CouplingMap, Layout
 from qiskit.compiler import transpile
 from qiskit.transpiler import TranspilerAccessError, TranspilerError
 from qiskit.transpiler.passmanager import DoWhileController, ConditionalController, \
     FlowController, FlowControllerLinear
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.dagcircuit import DAGCircuit
+from qiskit.transpiler.passes import CXCancellation, Size, CheckMap, SetLayout
 from qiskit.test import QiskitTestCase
 from ._dummy_passes import (PassA_TP_NR_NP, PassB_TP_RA_PA, PassC_TP_RA_PA,
                             PassD_TP_NR_NP, PassE_AP_NR_NP, PassF_reduce_dag_property,
@@ -686,5 +689,147 @@ class TestPassManagerReuse(SchedulerTestCase):
         self.assertScheduler(self.circuit, self.passmanager, expected)
 
 
+class TestPassManagerCallback(SchedulerTestCase):
+    """ The PassManager callback is called after each pass """
+
+    def test_callback_measurements(self):
+        """ The callback gets the measurements of each pass run. """
+        calls = []
+
+        def callback(**kwargs):
+            calls.append(kwargs)
+
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        passmanager = PassManager(callback=callback)
+        passmanager.append(PassA_TP_NR_NP())
+        passmanager.run(circuit)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0]['name'], 'PassA_TP_NR_NP')
+        self.assertIsInstance(calls[0]['pass_'], PassA_TP_NR_NP)
+        self.assertGreaterEqual(calls[0]['time'], 0)
+        self.assertEqual(calls[0]['size_before'], 2)
+        self.assertEqual(calls[0]['depth_before'], 2)
+        self.assertEqual(calls[0]['size_after'], 2)
+        self.assertEqual(calls[0]['depth_after'], 2)
+        self.assertEqual(calls[0]['iteration'], 1)
+
+    def test_callback_do_while_iteration(self):
+        """ The callback gets the iteration of a do-while loop. """
+        iterations = []
+
+        def callback(name, iteration, **_):
+            if name == 'PassA_TP_NR_NP':
+                iterations.append(iteration)
+
+        passmanager = PassManager(callback=callback)
+        passmanager.append(
+            [PassK_check_fixed_point_property(),
+             PassA_TP_NR_NP(),
+             PassF_reduce_dag_property()],
+            do_while=lambda property_set: not property_set['property_fixed_point'])
+        passmanager.run(QuantumCircuit(QuantumRegister(1)))
+
+        self.assertEqual(iterations, [1, 2, 3, 4, 5, 6, 7])
+
+
+class TestPassManagerRunDag(SchedulerTestCase):
+    """ PassManager.run_dag runs the passes on a DAG """
+
+    def test_run_dag(self):
+        """ run_dag returns the transformed DAG, with the name of the input. """
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr, name='a_circuit')
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[0], qr[1])
+        passmanager = PassManager(CXCancellation())
+
+        dag = passmanager.run_dag(circuit_to_dag(circuit))
+
+        self.assertIsInstance(dag, DAGCircuit)
+        self.assertEqual(dag.name, 'a_circuit')
+        self.assertEqual(dag.size(), 0)
+        self.assertEqual(dag_to_circuit(dag), passmanager.run(circuit))
+
+
+class TestPassManagerSkipUnchanged(SchedulerTestCase):
+    """ With skip_unchanged, passes are not run again on an unchanged DAG """
+
+    def setUp(self):
+        self.circuit = QuantumCircuit(QuantumRegister(1))
+
+    def test_analysis_not_repeated(self):
+        """ An analysis pass is not run again after a transformation left the DAG unchanged. """
+        passmanager = PassManager(skip_unchanged=True)
+        passmanager.append(PassE_AP_NR_NP('value'))
+        passmanager.append(PassA_TP_NR_NP())
+        passmanager.append(PassE_AP_NR_NP('value'))
+        self.assertScheduler(self.circuit, passmanager,
+                             ['run analysis pass PassE_AP_NR_NP',
+                              'set property as value',
+                              'run transformation pass PassA_TP_NR_NP'])
+
+    def test_analysis_repeated_without_skip_unchanged(self):
+        """ By default, a transformation pass invalidates the passes it does not preserve. """
+        passmanager = PassManager()
+        passmanager.append(PassE_AP_NR_NP('value'))
+        passmanager.append(PassA_TP_NR_NP())
+        passmanager.append(PassE_AP_NR_NP('value'))
+        self.assertScheduler(self.circuit, passmanager,
+                             ['run analysis pass PassE_AP_NR_NP',
+                              'set property as value',
+                              'run transformation pass PassA_TP_NR_NP',
+                              'run analysis pass PassE_AP_NR_NP',
+                              'set property as value'])
+
+    def test_loop_ends_when_unchanged(self):
+        """ A do-while loop ends after an iteration that left the DAG unchanged. """
+        passmanager = PassManager(skip_unchanged=True)
+        passmanager.append([PassE_AP_NR_NP('value'), PassA_TP_NR_NP()],
+                           do_while=lambda property_set: True)
+        self.assertScheduler(self.circuit, passmanager,
+                             ['run analysis pass PassE_AP_NR_NP',
+                              'set property as value',
+                              'run transformation pass PassA_TP_NR_NP'])
+
+    def test_changed_dag_invalidates(self):
+        """ A transformation that modifies the DAG invalidates the analysis passes. """
+        qr = QuantumRegister(2)
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[0], qr[1])
+        passmanager = PassManager(skip_unchanged=True)
+        passmanager.append([Size(), CXCancellation(), Size(), CXCancellation(), Size()])
+        calls = []
+        passmanager.callback = lambda **kwargs: calls.append(kwargs['name'])
+
+        passmanager.run(circuit)
+
+        self.assertEqual(calls, ['Size', 'CXCancellation', 'Size', 'CXCancellation'])
+        self.assertEqual(passmanager.property_set['size'], 0)
+
+    def test_changed_layout_invalidates(self):
+        """ A pass that changes the layout invalidates the passes that read it. """
+        qr = QuantumRegister(2, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        coupling_map = CouplingMap([[0, 1], [1, 2]])
+        passmanager = PassManager(skip_unchanged=True)
+        passmanager.append([SetLayout(Layout({qr[0]: 0, qr[1]: 1, None: 2})),
+                            CheckMap(coupling_map),
+                            SetLayout(Layout({qr[0]: 0, qr[1]: 2, None: 1})),
+                            CheckMap(coupling_map)])
+        calls = []
+        passmanager.callback = lambda **kwargs: calls.append(kwargs['name'])
+
+        passmanager.run(circuit)
+
+        self.assertEqual(calls, ['SetLayout', 'CheckMap', 'SetLayout', 'CheckMap'])
+        self.assertFalse(passmanager.property_set['is_swap_mapped'])
+
+
 if __name__ == '__main__':
     unittest.main()
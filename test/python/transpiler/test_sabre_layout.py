@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the SabreLayout pass"""
+
+import unittest
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.transpiler import CouplingMap, TranspilerError
+from qiskit.transpiler.passes import SabreLayout
+from qiskit.converters import circuit_to_dag
+from qiskit.test import QiskitTestCase
+
+
+class TestSabreLayout(QiskitTestCase):
+    """Tests the SabreLayout pass."""
+
+    def test_layout_of_a_line(self):
+        """Test that every virtual qubit gets its own physical qubit."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        for _ in range(3):
+            circuit.cx(qr[0], qr[1])
+            circuit.cx(qr[1], qr[2])
+        dag = circuit_to_dag(circuit)
+        coupling_map = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4], [4, 5]])
+
+        pass_ = SabreLayout(coupling_map, seed=0)
+        pass_.run(dag)
+
+        layout = pass_.property_set['layout']
+        physical_qubits = {layout[qubit] for qubit in qr}
+        self.assertEqual(len(physical_qubits), 3)
+        self.assertTrue(physical_qubits <= set(coupling_map.physical_qubits))
+
+    def test_raises_on_too_wide_circuit(self):
+        """Test that a circuit wider than the device is rejected."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[2])
+        dag = circuit_to_dag(circuit)
+
+        with self.assertRaises(TranspilerError):
+            SabreLayout(CouplingMap([[0, 1]])).run(dag)
+
+
+if __name__ == '__main__':
+    unittest.main()
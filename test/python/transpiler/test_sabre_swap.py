@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the SabreSwap pass"""
+
+import unittest
+import numpy as np
+from qiskit.transpiler.passes import SabreSwap, CheckMap
+from qiskit.transpiler.passes.mapping.sabre_swap import (SabreDAG, SabreRouter, _SwapScores,
+                                                         _extended_set, _swap)
+from qiskit.transpiler import CouplingMap, PassManager, TranspilerError
+from qiskit.converters import circuit_to_dag
+from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
+from qiskit.test import QiskitTestCase
+
+
+class TestSabreSwap(QiskitTestCase):
+    """Tests the SabreSwap pass."""
+
+    def test_sabre_swap_doesnt_modify_mapped_circuit(self):
+        """Test that SabreSwap does not modify a circuit that is already mapped."""
+        qr = QuantumRegister(3, name='q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[2])
+        circuit.cx(qr[0], qr[1])
+        original_dag = circuit_to_dag(circuit)
+
+        coupling_map = CouplingMap([[0, 1], [0, 2]])
+
+        mapped_dag = SabreSwap(coupling_map, seed=0).run(original_dag)
+
+        self.assertEqual(original_dag, mapped_dag)
+
+    def test_sabre_swap_should_add_a_single_swap(self):
+        """Test that SabreSwap inserts a single SWAP for a distance-2 cx."""
+        qr = QuantumRegister(3, name='q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[2])
+        dag_circuit = circuit_to_dag(circuit)
+
+        coupling_map = CouplingMap([[0, 1], [1, 2]])
+
+        mapped_dag = SabreSwap(coupling_map, seed=0).run(dag_circuit)
+
+        self.assertEqual(mapped_dag.count_ops(), {'swap': 1, 'cx': 1})
+
+    def test_sabre_swap_maps_measurements_and_conditions(self):
+        """Test that SabreSwap keeps measurements and conditioned gates in order."""
+        qr = QuantumRegister(4, name='q')
+        cr = ClassicalRegister(4, name='c')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[3])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[3]).c_if(cr, 1)
+        circuit.cx(qr[3], qr[1])
+        circuit.measure(qr, cr)
+        dag_circuit = circuit_to_dag(circuit)
+
+        coupling_map = CouplingMap([[0, 1], [1, 2], [2, 3]])
+
+        mapped_dag = SabreSwap(coupling_map, seed=0).run(dag_circuit)
+        check_map = CheckMap(coupling_map)
+        check_map.run(mapped_dag)
+
+        self.assertTrue(check_map.property_set['is_swap_mapped'])
+        counts = mapped_dag.count_ops()
+        self.assertEqual(counts['measure'], 5)
+        self.assertEqual(counts['x'], 1)
+        self.assertEqual(counts['cx'], 2)
+        conditioned = [node for node in mapped_dag.op_nodes() if node.name == 'x']
+        self.assertEqual(conditioned[0].condition, (cr, 1))
+
+    def test_sabre_swap_maps_large_circuit(self):
+        """Test that SabreSwap maps a random circuit onto a grid."""
+        edges = []
+        for row in range(5):
+            for column in range(5):
+                qubit = 5 * row + column
+                if column < 4:
+                    edges.append([qubit, qubit + 1])
+                if row < 4:
+                    edges.append([qubit, qubit + 5])
+        coupling_map = CouplingMap(edges)
+
+        qr = QuantumRegister(25, name='q')
+        circuit = QuantumCircuit(qr)
+        for index in range(500):
+            control = (7 * index) % 25
+            circuit.cx(qr[control], qr[(control + 1 + (11 * index) % 24) % 25])
+
+        pass_manager = PassManager([SabreSwap(coupling_map, seed=0), CheckMap(coupling_map)])
+        mapped = pass_manager.run(circuit)
+
+        self.assertTrue(pass_manager.property_set['is_swap_mapped'])
+        self.assertEqual(mapped.count_ops()['cx'], circuit.count_ops()['cx'])
+
+    def test_swap_scores_follow_swaps_and_routing(self):
+        """Test that the scores updated for SWAPs and new front layers are
+        those scored from scratch."""
+        edges = [[qubit, qubit + 1] for qubit in range(15) if qubit % 4 != 3]
+        edges += [[qubit, qubit + 4] for qubit in range(12)]
+        router = SabreRouter(CouplingMap(edges))
+        rng = np.random.RandomState(3)
+        qr = QuantumRegister(16, name='q')
+        circuit = QuantumCircuit(qr)
+        for _ in range(60):
+            qubit1, qubit2 = rng.choice(16, 2, replace=False)
+            circuit.cx(qr[int(qubit1)], qr[int(qubit2)])
+        sabre_dag = SabreDAG(circuit_to_dag(circuit))
+        v2p = [int(physical) for physical in rng.permutation(16)]
+        p2v = [0] * 16
+        for virtual, physical in enumerate(v2p):
+            p2v[physical] = virtual
+
+        def rescored(front):
+            scores = _SwapScores(router, sabre_dag.pairs)
+            scores.update(front, _extended_set(front, sabre_dag.successors, sabre_dag.pairs),
+                          v2p)
+            return scores
+
+        front = [index for index, gates in enumerate(sabre_dag.predecessors) if not gates]
+        scores = rescored(front)
+        for step in range(30):
+            physical1, physical2 = router.edge_list[rng.randint(len(router.edge_list))]
+            scores.swap(physical1, physical2, v2p, p2v)
+            _swap(v2p, p2v, physical1, physical2)
+            if step % 10 == 9:
+                # Move on to the gates after the first gate of the front layer
+                done = front.pop(0)
+                front.extend(successor for successor in sabre_dag.successors[done]
+                             if sabre_dag.predecessors[successor] == [done])
+                scores.update(front, _extended_set(front, sabre_dag.successors,
+                                                   sabre_dag.pairs), v2p)
+            expected = rescored(front)
+            self.assertEqual(scores.total, expected.total)
+            self.assertEqual(scores.change, expected.change)
+            self.assertEqual(scores.front_count, expected.front_count)
+
+    def test_sabre_swap_is_deterministic_with_seed(self):
+        """Test that SabreSwap gives the same result with the same seed."""
+        qr = QuantumRegister(5, name='q')
+        circuit = QuantumCircuit(qr)
+        for index in range(20):
+            circuit.cx(qr[index % 5], qr[(index + 2 + index % 3) % 5])
+        dag_circuit = circuit_to_dag(circuit)
+        coupling_map = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4]])
+
+        first = SabreSwap(coupling_map, seed=42).run(dag_circuit)
+        second = SabreSwap(coupling_map, seed=42).run(dag_circuit)
+
+        self.assertEqual(first, second)
+
+    def test_sabre_swap_rejects_unknown_heuristic(self):
+        """Test that SabreSwap raises on an unknown heuristic."""
+        with self.assertRaises(TranspilerError):
+            SabreSwap(CouplingMap([[0, 1]]), heuristic='fastest')
+
+
+if __name__ == '__main__':
+    unittest.main()
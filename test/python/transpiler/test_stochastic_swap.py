@@ -15,10 +15,13 @@
 """Test the Stochastic Swap pass"""
 
 import unittest
+from unittest import mock
+from importlib import import_module
 from qiskit.transpiler.passes import StochasticSwap
-from qiskit.transpiler import CouplingMap, Layout
+from qiskit.transpiler import CouplingMap, Layout, PassManager
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
+from qiskit.compiler import transpile
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
 
@@ -627,6 +630,41 @@ class TestStochasticSwap(QiskitTestCase):
         with self.assertRaises(TranspilerError):
             _ = pass_.run(dag)
 
+    def test_result_independent_of_threads(self):
+        """The mapped circuit only depends on the seed, not on the number of threads."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4], [0, 5], [5, 6],
+                                [6, 7], [7, 8], [8, 9], [4, 9]])
+        qr = QuantumRegister(10, 'q')
+        circuit = QuantumCircuit(qr)
+        for control, target in [(0, 7), (3, 9), (1, 5), (2, 8), (4, 6), (9, 0),
+                                (5, 3), (8, 1), (6, 2), (7, 4)]:
+            circuit.cx(qr[control], qr[target])
+        dag = circuit_to_dag(circuit)
+
+        expected = StochasticSwap(coupling, seed=7, num_threads=1).run(dag)
+        for num_threads in [2, 3, 20]:
+            pass_ = StochasticSwap(coupling, seed=7, num_threads=num_threads)
+            self.assertEqual(pass_.run(dag), expected)
+
+    def test_pass_manager_reused_in_parallel(self):
+        """A pass manager run with several threads can then be run in parallel workers."""
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3], [3, 4], [0, 5], [5, 6],
+                                [6, 7], [7, 8], [8, 9], [4, 9]])
+        qr = QuantumRegister(10, 'q')
+        circuits = []
+        for shift in range(4):
+            circuit = QuantumCircuit(qr)
+            for control, target in [(0, 7), (3, 9), (1, 5), (2, 8), (4, 6), (9, 0)]:
+                circuit.cx(qr[(control + shift) % 10], qr[(target + shift) % 10])
+            circuits.append(circuit)
+
+        pass_manager = PassManager(StochasticSwap(coupling, seed=7, num_threads=4))
+        pass_manager.run(circuits[0])
+        # Transpile in two worker processes whatever the number of CPUs
+        with mock.patch.object(import_module('qiskit.compiler.transpile'), 'CPU_COUNT', 2):
+            result = transpile(circuits, pass_manager=pass_manager)
+        self.assertEqual([circuit.count_ops()['cx'] for circuit in result], [6, 6, 6, 6])
+
 
 if __name__ == '__main__':
     unittest.main()
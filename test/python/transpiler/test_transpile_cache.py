@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the on-disk transpile cache."""
+
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.compiler import transpile
+from qiskit.transpiler import CouplingMap, PassManager, TranspileCache
+from qiskit.transpiler.transpile_config import TranspileConfig
+from qiskit.test import QiskitTestCase
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Test the TranspileCache and its use by transpile()."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache = TranspileCache(self.directory)
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        self.circuit = QuantumCircuit(qr, cr)
+        self.circuit.h(qr[0])
+        self.circuit.cx(qr[0], qr[2])
+        self.circuit.measure(qr, cr)
+        self.config = TranspileConfig(optimization_level=1,
+                                      basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                      coupling_map=CouplingMap([[0, 1], [1, 2]]),
+                                      backend_properties=None, initial_layout=None,
+                                      seed_transpiler=42, pass_manager=None)
+
+    def _config(self, **kwargs):
+        options = {'basis_gates': self.config.basis_gates,
+                   'coupling_map': self.config.coupling_map,
+                   'backend_properties': None, 'initial_layout': None,
+                   'seed_transpiler': 42, 'pass_manager': None}
+        options.update(kwargs)
+        return TranspileConfig(**options)
+
+    def test_key_content(self):
+        """Equal circuits and options have the same key, other targets do not."""
+        key = self.cache.key(self.circuit, self.config)
+        same_circuit = self.circuit.copy('another_name')
+        self.assertEqual(self.cache.key(same_circuit, self.config), key)
+        self.assertNotEqual(self.cache.key(self.circuit, self._config(optimization_level=2)),
+                            key)
+        self.assertNotEqual(self.cache.key(self.circuit, self._config(optimization_level=1,
+                                                                      seed_transpiler=1)),
+                            key)
+        self.assertNotEqual(self.cache.key(self.circuit,
+                                           self._config(optimization_level=1,
+                                                        basis_gates=['u3', 'cx'])),
+                            key)
+        other = self.circuit.copy()
+        other.x(other.qregs[0][1])
+        self.assertNotEqual(self.cache.key(other, self.config), key)
+
+    def test_key_custom_definition(self):
+        """Custom instructions with the same name but other definitions differ."""
+        sub1 = QuantumCircuit(QuantumRegister(2, 'q'), name='custom')
+        sub1.cx(0, 1)
+        sub2 = QuantumCircuit(QuantumRegister(2, 'q'), name='custom')
+        sub2.cx(1, 0)
+        qr = QuantumRegister(2, 'qr')
+        circuit1 = QuantumCircuit(qr)
+        circuit1.append(sub1.to_instruction(), qr)
+        circuit2 = QuantumCircuit(qr)
+        circuit2.append(sub2.to_instruction(), qr)
+        self.assertNotEqual(self.cache.key(circuit1, self.config),
+                            self.cache.key(circuit2, self.config))
+
+    def test_uncacheable(self):
+        """Parameterized circuits and custom pass managers are not cached."""
+        circuit = self.circuit.copy()
+        circuit.rz(Parameter('theta'), circuit.qregs[0][0])
+        self.assertIsNone(self.cache.key(circuit, self.config))
+        self.assertIsNone(self.cache.key(self.circuit,
+                                         self._config(optimization_level=1,
+                                                      pass_manager=PassManager())))
+
+    def test_lru_eviction(self):
+        """The least recently used entries are evicted first."""
+        cache = TranspileCache(self.directory, max_size=25)
+        cache.put('a', b'0123456789')
+        cache.put('b', b'0123456789')
+        os.utime(os.path.join(self.directory, 'a.qkbc'), (0, 0))
+        os.utime(os.path.join(self.directory, 'b.qkbc'), (1, 1))
+        self.assertEqual(cache.get('a'), b'0123456789')
+        cache.put('c', b'0123456789')
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.size(), 20)
+        cache.clear()
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.size(), 0)
+
+    def test_transpile_cached(self):
+        """Cached circuits are not transpiled again, and repeats only once."""
+        transpile_module = importlib.import_module('qiskit.compiler.transpile')
+        circuits = [self.circuit, self.circuit.copy('copy'), self.circuit]
+        options = {'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                   'coupling_map': [[0, 1], [1, 2]], 'seed_transpiler': 42}
+        with mock.patch.object(transpile_module, '_transpile_circuits',
+                               wraps=transpile_module._transpile_circuits) as transpile_circuits:
+            first = transpile(circuits, cache=self.cache, **options)
+            self.assertEqual(len(transpile_circuits.call_args[0][0]), 1)
+            second = transpile(circuits, cache=self.directory, **options)
+            self.assertEqual(transpile_circuits.call_count, 1)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[0], first[1])
+        self.assertIsNot(first[0], first[2])
+        self.assertEqual([circuit.name for circuit in second],
+                         [circuit.name for circuit in circuits])
+
+
+if __name__ == '__main__':
+    unittest.main()
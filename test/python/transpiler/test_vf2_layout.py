@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the VF2Layout pass"""
+
+import unittest
+from unittest import mock
+
+from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.transpiler import CouplingMap, TranspilerError
+from qiskit.transpiler.passes import VF2Layout, ApplyLayout, LegacySwap
+from qiskit.transpiler.passes.mapping.vf2_layout import (SOLUTION_FOUND, NO_SOLUTION,
+                                                         CALL_LIMIT_REACHED)
+from qiskit.compiler import transpile
+from qiskit.converters import circuit_to_dag
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeTokyo, FakeMelbourne
+
+
+class TestVF2Layout(QiskitTestCase):
+    """Tests the VF2Layout pass"""
+
+    def setUp(self):
+        self.cmap20 = FakeTokyo().configuration().coupling_map
+
+    def assertLayoutFits(self, circuit, layout, coupling_map):
+        """Assert that the two-qubit gates of circuit are on coupled qubits."""
+        edges = {tuple(sorted(edge)) for edge in coupling_map.get_edges()}
+        for _, qargs, _ in circuit.data:
+            if len(qargs) == 2:
+                self.assertIn(tuple(sorted((layout[qargs[0]], layout[qargs[1]]))), edges)
+
+    def test_ring_on_grid(self):
+        """Test that a ring of 6 qubits is laid out on the 20q coupling map."""
+        qr = QuantumRegister(6, 'q')
+        circuit = QuantumCircuit(qr)
+        for index in range(6):
+            circuit.cx(qr[index], qr[(index + 1) % 6])
+        coupling_map = CouplingMap(self.cmap20)
+
+        pass_ = VF2Layout(coupling_map)
+        pass_.run(circuit_to_dag(circuit))
+
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], SOLUTION_FOUND)
+        layout = pass_.property_set['layout']
+        self.assertEqual(len({layout[qubit] for qubit in qr}), 6)
+        self.assertLayoutFits(circuit, layout, coupling_map)
+
+    def test_idle_qubits_are_laid_out(self):
+        """Test that qubits without two-qubit gates get a physical qubit."""
+        qr = QuantumRegister(4, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[3])
+        circuit.cx(qr[0], qr[2])
+        coupling_map = CouplingMap([[0, 1], [1, 2], [2, 3]])
+
+        pass_ = VF2Layout(coupling_map)
+        pass_.run(circuit_to_dag(circuit))
+
+        layout = pass_.property_set['layout']
+        self.assertEqual({layout[qubit] for qubit in qr}, {0, 1, 2, 3})
+        self.assertLayoutFits(circuit, layout, coupling_map)
+
+    def test_no_solution(self):
+        """Test that no layout is set when the circuit does not fit."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.cx(qr[2], qr[0])
+
+        pass_ = VF2Layout(CouplingMap([[0, 1], [1, 2], [2, 3]]))
+        pass_.run(circuit_to_dag(circuit))
+
+        self.assertIsNone(pass_.property_set['layout'])
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], NO_SOLUTION)
+
+    def test_call_limit(self):
+        """Test that the search stops at the call limit."""
+        qr = QuantumRegister(6, 'q')
+        circuit = QuantumCircuit(qr)
+        for index in range(6):
+            circuit.cx(qr[index], qr[(index + 1) % 6])
+
+        pass_ = VF2Layout(CouplingMap(self.cmap20), call_limit=2)
+        pass_.run(circuit_to_dag(circuit))
+
+        self.assertIsNone(pass_.property_set['layout'])
+        self.assertEqual(pass_.property_set['VF2Layout_stop_reason'], CALL_LIMIT_REACHED)
+
+    def test_raises_on_too_wide_circuit(self):
+        """Test that a circuit wider than the device is rejected."""
+        qr = QuantumRegister(3, 'q')
+        circuit = QuantumCircuit(qr)
+
+        with self.assertRaises(TranspilerError):
+            VF2Layout(CouplingMap([[0, 1]])).run(circuit_to_dag(circuit))
+
+    def test_transpile_needs_no_swaps(self):
+        """Test that the preset pass managers do not add swaps to a fitting circuit."""
+        qr = QuantumRegister(5, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[2], qr[0])
+        circuit.cx(qr[2], qr[1])
+        circuit.cx(qr[2], qr[3])
+        circuit.cx(qr[3], qr[4])
+
+        edges = CouplingMap(self.cmap20).get_edges()
+        for level in (1, 2, 3):
+            with self.subTest(optimization_level=level):
+                result = transpile(circuit, coupling_map=self.cmap20,
+                                   basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                   optimization_level=level, seed_transpiler=42)
+                self.assertEqual(result.count_ops()['cx'], 4)
+                for node in circuit_to_dag(result).twoQ_gates():
+                    self.assertIn((node.qargs[0][1], node.qargs[1][1]), edges)
+
+    def test_transpile_applies_layout(self):
+        """Test that the layout found is applied to the circuit."""
+        qr = QuantumRegister(5, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[4])
+        circuit.cx(qr[1], qr[3])
+        coupling_map = FakeMelbourne().configuration().coupling_map
+
+        edges = CouplingMap(coupling_map).get_edges()
+        for level in range(4):
+            with self.subTest(optimization_level=level):
+                result = transpile(circuit, coupling_map=coupling_map,
+                                   basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                   optimization_level=level, seed_transpiler=42)
+                self.assertEqual(result.count_ops()['cx'], 2)
+                for node in circuit_to_dag(result).twoQ_gates():
+                    self.assertIn((node.qargs[0][1], node.qargs[1][1]), edges)
+
+    def test_transpile_skips_routing(self):
+        """Test that the layout found is applied without running the routing."""
+        qr = QuantumRegister(5, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[4])
+        circuit.cx(qr[1], qr[3])
+        coupling_map = FakeMelbourne().configuration().coupling_map
+
+        for level in range(1, 4):
+            with self.subTest(optimization_level=level), \
+                    mock.patch.object(LegacySwap, 'run', autospec=True) as routing, \
+                    mock.patch.object(ApplyLayout, 'run', autospec=True,
+                                      side_effect=ApplyLayout.run) as apply_layout:
+                transpile(circuit, coupling_map=coupling_map,
+                          basis_gates=['u1', 'u2', 'u3', 'cx'],
+                          optimization_level=level, seed_transpiler=42)
+                routing.assert_not_called()
+                apply_layout.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()